@@ -10,11 +10,12 @@ Streaming PCAP export using python-libpcap with backpressure integration.
 This file is part of AX-TrafficAnalyzer Community Edition.
 """
 
+import logging
 import subprocess
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Sequence
 from ...core.errors import NetworkError
-from ...core.logging import get_logger
+from ...core.logging import get_logger, is_enabled_for
 from ...core.memory import RingBuffer, BackpressureController, CircuitBreaker
 
 log = get_logger(__name__)
@@ -40,6 +41,7 @@ class StreamingPCAPExporter:
         self.backpressure = BackpressureController(self.buffer)
         self.circuit_breaker = CircuitBreaker(failure_threshold=3)
         self.writer = None
+        self._debug = is_enabled_for(logging.DEBUG)  # Cached log-level state
         log.debug("pcap_exporter_initialized", output_dir=str(output_dir), buffer_size_mb=buffer_size_mb)
     
     def _ensure_output_dir(self) -> None:
@@ -91,7 +93,7 @@ class StreamingPCAPExporter:
         Returns:
             True if exported successfully, False if backpressure active
         """
-        if self.circuit_breaker.should_open():
+        if self.circuit_breaker.is_open:
             log.warning("circuit_breaker_open_pcap_export_paused")
             return False
         
@@ -114,13 +116,51 @@ class StreamingPCAPExporter:
             if packet:
                 self.writer.write_packet(packet)
                 self.circuit_breaker.record_success()
-                log.debug("packet_exported", size=len(packet))
+                if self._debug:
+                    log.debug("packet_exported", size=len(packet))
                 return True
         except Exception as e:
             self.circuit_breaker.record_failure()
             log.error("packet_export_failed", error=str(e))
             return False
     
+    def export_packets(self, packets: Sequence[bytes]) -> int:
+        """
+        Export a burst of packets to PCAP.
+        
+        Args:
+            packets: Raw packet bytes, in capture order
+            
+        Returns:
+            Number of packets written (0 if backpressure active)
+        """
+        if self.circuit_breaker.is_open:
+            log.warning("circuit_breaker_open_pcap_export_paused")
+            return 0
+        
+        if self.backpressure.should_pause():
+            log.warning("backpressure_active_packet_dropped", count=len(packets))
+            return 0
+        
+        if self.writer is None:
+            log.error("pcap_writer_not_initialized")
+            return 0
+        
+        written = 0
+        try:
+            # Add the whole burst to the ring buffer, then drain it to file
+            self.buffer.push_many(packets)
+            while not self.buffer.is_empty():
+                self.writer.write_packet(self.buffer.pop())
+                written += 1
+            self.circuit_breaker.record_success()
+            if self._debug:
+                log.debug("packets_exported", count=written)
+        except Exception as e:
+            self.circuit_breaker.record_failure()
+            log.error("packet_export_failed", error=str(e), written=written)
+        return written
+    
     def stop(self, pcap_monitor=None) -> None:
         """
         Stop PCAP export and flush buffer.
@@ -26,7 +26,7 @@ from .errors import (
 )
 from .logging import setup_logging, get_logger
 from .config import load_config, get_config, validate_config
-from .orchestrator import StartupOrchestrator
+from .orchestrator import StartupOrchestrator, AsyncStartupOrchestrator
 
 # Phase 2a: Critical Infrastructure
 from .security import KeyringManager, CertificateSecurityManager
@@ -54,6 +54,7 @@ __all__ = [
     "get_config",
     "validate_config",
     "StartupOrchestrator",
+    "AsyncStartupOrchestrator",
     # Phase 2a: Critical Infrastructure
     "KeyringManager",
     "CertificateSecurityManager",
@@ -20,26 +20,189 @@ INNOVATION:
 - Platform-specific installation commands
 """
 
-import subprocess
 import sys
 import shutil
 import os
-import importlib
-import pkg_resources
-import socket
-import tempfile
-import time
-from typing import Dict, List, Optional, Tuple
+import re
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, Optional, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
-import psutil  # Fail-fast if missing - validated in PYTHON_PACKAGES
+# subprocess, tempfile, time, pkg_resources and psutil are imported lazily
+# inside the helpers/validators that need them, so importing this module (and
+# running with skip_system_tools) stays cheap.
 
-from .platform.detector import get_platform_info, PlatformInfo
 from .errors import DependencyValidationError
+from .logging import get_logger
 
+log = get_logger(__name__)
 
-@dataclass
+if TYPE_CHECKING:
+    from .platform.detector import PlatformInfo
+
+# Version extraction (first "X.Y" or "X.Y.Z" in tool output)
+_VERSION_RE = re.compile(rb'(\d+\.\d+(?:\.\d+)?)')
+
+# Flags tried in order when probing a tool's version
+_VERSION_FLAGS = ("--version", "-V", "-v")
+
+# Timeout (seconds) applied to every external probe command
+_PROBE_TIMEOUT = 5
+
+# Package install command per distribution (lowercase), formatted with tool=
+_INSTALL_COMMANDS = {
+    "ubuntu": "sudo apt-get update\n    sudo apt-get install {tool}",
+    "debian": "sudo apt-get update\n    sudo apt-get install {tool}",
+    "fedora": "sudo dnf install {tool}",
+    "rhel": "sudo dnf install {tool}",
+    "centos": "sudo dnf install {tool}",
+    "arch": "sudo pacman -S {tool}",
+}
+_INSTALL_COMMAND_FALLBACK = "Install {tool} using your distribution's package manager"
+
+# What each system tool is needed for (shown in fail-fast errors)
+_TOOL_PURPOSES = {
+    "hostapd": "WiFi hotspot creation",
+    "dnsmasq": "DHCP and DNS server",
+    "iptables": "IPv4 packet filtering",
+    "ip6tables": "IPv6 packet filtering",
+    "tcpdump": "Raw packet capture",
+    "tshark": "Protocol dissection",
+    "redis-server": "Message queue backend",
+    "ntpd": "Network time synchronization",
+    "chronyd": "Network time synchronization",
+    "ip": "Network interface management",
+    "systemctl": "Service management",
+}
+
+# Fail-fast error message templates (rendered with str.format_map)
+_TOOL_ERROR_TEMPLATE = """
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+❌ CRITICAL ERROR: Required dependency missing
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+COMPONENT:    {tool}
+VERSION REQ:  >= {version_req}
+FOUND:        {found}
+PLATFORM:     Linux ({platform})
+REQUIRED FOR: {purpose}
+
+SOLUTION:
+  Run the following commands:
+
+    {install_cmd}
+
+  Then run AX-TrafficAnalyzer again.
+
+DOCUMENTATION:
+  https://docs.ax-traffic-analyzer.com/installation/dependencies
+
+ALTERNATIVE:
+  None - {tool} is a core dependency and cannot be substituted.
+
+If you believe {tool} is installed but not detected:
+  1. Check if it's in your PATH: which {tool}
+  2. Set custom path via env: export {tool_upper}_PATH=/path/to/{tool}
+  3. Report this issue: https://github.com/ax/issues
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+_PACKAGE_ERROR_TEMPLATE = """
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+❌ CRITICAL ERROR: Python package issue
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+COMPONENT:    {package}
+VERSION REQ:  {version_req}
+FOUND:        {found}
+PLATFORM:     Python {python_version}
+
+SOLUTION:
+  Run the following command:
+
+    {install_cmd}
+
+  Then run AX-TrafficAnalyzer again.
+
+DOCUMENTATION:
+  https://docs.ax-traffic-analyzer.com/installation/dependencies
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+_CAPABILITY_ERROR_TEMPLATE = """
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+❌ CRITICAL ERROR: System capability missing
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+CAPABILITY:   {capability}
+REASON:      {reason}
+PLATFORM:    {platform}
+
+SOLUTION:
+  {solution}
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+_RESOURCE_ERROR_TEMPLATE = """
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+❌ CRITICAL ERROR: Insufficient system resources
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+RESOURCE:    {resource}
+REQUIRED:    {required}
+FOUND:       {found}
+PLATFORM:    {platform}
+
+SOLUTION:
+  {solution}
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+_SECURITY_ERROR_TEMPLATE = """
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+❌ CRITICAL ERROR: Security policy issue
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+COMPONENT:   {component}
+REASON:      {reason}
+PLATFORM:    {platform}
+
+SOLUTION:
+  {solution}
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+_NETWORK_ERROR_TEMPLATE = """
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+❌ CRITICAL ERROR: Network state conflict
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+ISSUE:       {issue}
+REASON:      {reason}
+PLATFORM:    {platform}
+
+SOLUTION:
+  {solution}
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+
+@lru_cache(maxsize=None)
+def _version_range(version_bounds: Optional[Tuple[str, str]]) -> Optional[str]:
+    """Render package version bounds as ">= min, < max" (None if unbounded)."""
+    if not version_bounds:
+        return None
+    return f">= {version_bounds[0]}, < {version_bounds[1]}"
+
+
+@dataclass(slots=True)
 class DependencyCheck:
     """Result of a dependency check."""
     name: str
@@ -51,6 +214,27 @@ class DependencyCheck:
     error: Optional[str] = None
 
 
+@dataclass(slots=True)
+class SystemSnapshot:
+    """
+    Host state shared by the resource, capability, security and
+    network-state validators.
+    
+    Collected once per DependencyValidator (see DependencyValidator.snapshot).
+    A field is None when its source could not be read.
+    """
+    disk_free_gb: Optional[float]
+    mem_total_gb: Optional[float]
+    cpu_count: Optional[int]
+    kernel_modules: Optional[FrozenSet[str]]
+    listening_ports: Optional[FrozenSet[int]]
+    ip_addrs: Optional[Tuple[str, ...]]
+    netns_supported: bool
+    selinux_mode: Optional[str]  # None = getenforce not installed, "" = probe failed
+    apparmor_status: str  # "missing", "inactive" or "active"
+    apparmor_profiles: FrozenSet[str]
+
+
 class DependencyValidator:
     """
     Dependency validator with fail-fast validation.
@@ -65,61 +249,73 @@ class DependencyValidator:
     - Network state
     """
     
-    # System tools with version requirements
-    SYSTEM_TOOLS = {
-        "hostapd": "2.9",
-        "dnsmasq": "2.80",
-        "iptables": "1.8",
-        "ip6tables": "1.8",
-        "tcpdump": "4.9",
-        "tshark": "3.0",
-        "redis-server": "6.0",
-        "ip": None,  # iproute2 - version check not critical
-        "systemctl": None,  # systemd - version check not critical
-        "iw": "5.0",  # WiFi management tool (Phase 1)
+    # System tools: (name, minimum version or None, category)
+    # Categories: "core" always checked, "ui" only if ui.enabled,
+    # "keyring" optional and skipped on WSL2
+    SYSTEM_TOOLS = (
+        ("hostapd", "2.9", "core"),
+        ("dnsmasq", "2.80", "core"),
+        ("iptables", "1.8", "core"),
+        ("ip6tables", "1.8", "core"),
+        ("tcpdump", "4.9", "core"),
+        ("tshark", "3.0", "core"),
+        ("redis-server", "6.0", "core"),
+        ("ip", None, "core"),  # iproute2 - version check not critical
+        ("systemctl", None, "core"),  # systemd - version check not critical
+        ("iw", "5.0", "core"),  # WiFi management tool (Phase 1)
         # Frontend build tools (conditional - only if ui.enabled)
-        "node": "18.0.0",
-        "npm": "9.0.0",
-        "libsecret-tool": None,  # Linux keyring (Phase 2a, Linux only, skip on WSL2)
-    }
+        ("node", "18.0.0", "ui"),
+        ("npm", "9.0.0", "ui"),
+        ("libsecret-tool", None, "keyring"),  # Linux keyring (Phase 2a, Linux only, skip on WSL2)
+    )
     
     # NTP daemons (either one is acceptable)
-    NTP_DAEMONS = ["ntpd", "chronyd"]
-    
-    # Python packages with version bounds
-    PYTHON_PACKAGES = {
-        "mitmproxy": ("10.0.0", "11.0.0"),
-        "fastapi": ("0.104.0", "1.0.0"),
-        "scapy": ("2.5.0", "3.0.0"),
-        "sqlalchemy": ("2.0.0", "3.0.0"),
-        "redis": ("4.5.0", "5.0.0"),
-        "psutil": ("5.9.0", "6.0.0"),
-        "uvicorn": ("0.20.0", "1.0.0"),  # ASGI server (Phase 1)
-        "structlog": None,  # Any recent version
-        "pydantic": None,  # Any recent version
-        "keyring": ("24.0.0", "25.0.0"),  # Secure key storage (Phase 2a)
-        "qrcode": ("7.4.0", "8.0.0"),  # QR code generation (Phase 2a)
-        "Pillow": ("10.0.0", "11.0.0"),  # Image processing for QR codes (Phase 2a)
-        "aioredis": ("2.0.0", "3.0.0"),  # Async Redis client (Phase 2a)
-        "python-libpcap": ("0.5.0", "1.0.0"),  # Fast PCAP writing (Phase 2b)
-        "alembic": ("1.12.0", "2.0.0"),  # Database migrations (Phase 3)
-        "python-jose": ("3.3.0", "4.0.0"),  # JWT tokens (Phase 3, imports as 'jose')
-        "passlib": ("1.7.4", "2.0.0"),  # Password hashing (Phase 3)
-        "aiosqlite": ("0.19.0", "1.0.0"),  # Async SQLite driver (Phase 3)
+    NTP_DAEMONS = ("ntpd", "chronyd")
+    
+    # Python packages: (name, (min, max) version bounds or None, category)
+    # Categories: "core" always checked, "database" only if database.enabled,
+    # "capture" only if capture.enabled
+    PYTHON_PACKAGES = (
+        ("mitmproxy", ("10.0.0", "11.0.0"), "core"),
+        ("fastapi", ("0.104.0", "1.0.0"), "core"),
+        ("scapy", ("2.5.0", "3.0.0"), "core"),
+        ("sqlalchemy", ("2.0.0", "3.0.0"), "core"),
+        ("redis", ("4.5.0", "5.0.0"), "core"),
+        ("psutil", ("5.9.0", "6.0.0"), "core"),
+        ("uvicorn", ("0.20.0", "1.0.0"), "core"),  # ASGI server (Phase 1)
+        ("structlog", None, "core"),  # Any recent version
+        ("pydantic", None, "core"),  # Any recent version
+        ("keyring", ("24.0.0", "25.0.0"), "core"),  # Secure key storage (Phase 2a)
+        ("qrcode", ("7.4.0", "8.0.0"), "core"),  # QR code generation (Phase 2a)
+        ("Pillow", ("10.0.0", "11.0.0"), "core"),  # Image processing for QR codes (Phase 2a)
+        ("aioredis", ("2.0.0", "3.0.0"), "core"),  # Async Redis client (Phase 2a)
+        ("python-libpcap", ("0.5.0", "1.0.0"), "capture"),  # Fast PCAP writing (Phase 2b)
+        ("alembic", ("1.12.0", "2.0.0"), "database"),  # Database migrations (Phase 3)
+        ("python-jose", ("3.3.0", "4.0.0"), "database"),  # JWT tokens (Phase 3, imports as 'jose')
+        ("passlib", ("1.7.4", "2.0.0"), "database"),  # Password hashing (Phase 3)
+        ("aiosqlite", ("0.19.0", "1.0.0"), "database"),  # Async SQLite driver (Phase 3)
         # Phase 5: Analysis Features
-        "reportlab": ("4.0.0", "5.0.0"),  # PDF report generation
-        "sklearn": ("1.3.0", "2.0.0"),  # ML traffic classification (scikit-learn imports as sklearn)
-        "requests": ("2.31.0", "3.0.0"),  # HTTP client for threat intel APIs
-        "magic": ("0.4.0", "1.0.0"),  # File type detection (python-magic imports as magic)
-        "yaml": ("6.0", "7.0"),  # YAML parser for rule engine (PyYAML imports as yaml)
-        "numpy": ("1.24.0", "2.0.0"),  # Numerical computing for ML
-        "pandas": ("2.0.0", "3.0.0"),  # Data analysis for traffic stats
-    }
-    
-    def __init__(self, platform_info: Optional[PlatformInfo] = None):
-        self.platform_info = platform_info or get_platform_info()
+        ("reportlab", ("4.0.0", "5.0.0"), "core"),  # PDF report generation
+        ("sklearn", ("1.3.0", "2.0.0"), "core"),  # ML traffic classification (scikit-learn imports as sklearn)
+        ("requests", ("2.31.0", "3.0.0"), "core"),  # HTTP client for threat intel APIs
+        ("magic", ("0.4.0", "1.0.0"), "core"),  # File type detection (python-magic imports as magic)
+        ("yaml", ("6.0", "7.0"), "core"),  # YAML parser for rule engine (PyYAML imports as yaml)
+        ("numpy", ("1.24.0", "2.0.0"), "core"),  # Numerical computing for ML
+        ("pandas", ("2.0.0", "3.0.0"), "core"),  # Data analysis for traffic stats
+    )
+    
+    def __init__(self, platform_info: Optional["PlatformInfo"] = None):
+        if platform_info is None:
+            from .platform.detector import get_platform_info
+            platform_info = get_platform_info()
+        self.platform_info = platform_info
+        self._dist_lc = platform_info.distribution.lower()
+        # Per-session constants used by every fail-fast message
+        self._platform_str = f"{platform_info.distribution} {platform_info.distribution_version}"
+        self._python_version_str = platform_info.python_version
         self._checked_tools: Dict[str, DependencyCheck] = {}
         self._checked_packages: Dict[str, DependencyCheck] = {}
+        self._snapshot: Optional[SystemSnapshot] = None
     
     def validate_all(self, mode: str = "production", config: dict = None) -> None:
         """
@@ -197,12 +393,7 @@ class DependencyValidator:
         Raises:
             ConfigurationError: If directory creation fails or is not writable
         """
-        from pathlib import Path
-        import os
         from .errors import ConfigurationError
-        from .logging import get_logger
-        
-        log = get_logger(__name__)
         
         # Get directories from config or use defaults
         required_dirs = [
@@ -221,19 +412,30 @@ class DependencyValidator:
         
         log.debug("validating_directories", count=len(required_dirs))
         
+        euid = os.geteuid()
         for dir_path in required_dirs:
             path = Path(dir_path)
             try:
-                if not path.exists():
-                    path.mkdir(parents=True, mode=0o700)
+                try:
+                    st = os.stat(path)
+                except FileNotFoundError:
+                    path.mkdir(parents=True, mode=0o700, exist_ok=True)
                     log.info("directory_created", path=dir_path, mode="0700")
-                else:
-                    # Ensure correct permissions
+                    st = os.stat(path)
+                
+                # Ensure correct permissions (skip chmod if already 0700)
+                mode = st.st_mode & 0o777
+                if mode != 0o700:
                     os.chmod(path, 0o700)
+                    mode = 0o700
                     log.debug("directory_permissions_set", path=dir_path, mode="0700")
                 
-                # Verify writable
-                if not os.access(path, os.W_OK):
+                # Verify writable (owner write bit suffices when we own it)
+                if st.st_uid == euid:
+                    writable = bool(mode & 0o200)
+                else:
+                    writable = os.access(path, os.W_OK)
+                if not writable:
                     raise ConfigurationError(
                         f"Directory not writable: {dir_path}",
                         None
@@ -249,16 +451,15 @@ class DependencyValidator:
     
     def _validate_system_tools(self, config: dict = None) -> None:
         """Validate all required system tools."""
-        for tool, min_version in self.SYSTEM_TOOLS.items():
+        ui_enabled = config.get("ui", {}).get("enabled", False) if config else False
+        for tool, min_version, category in self.SYSTEM_TOOLS:
             # Skip frontend tools if UI disabled
-            if tool in ["node", "npm"]:
-                ui_enabled = config.get("ui", {}).get("enabled", False) if config else False
-                if not ui_enabled:
-                    log.debug("tool_validation_skipped", tool=tool, reason="ui_disabled")
-                    continue
+            if category == "ui" and not ui_enabled:
+                log.debug("tool_validation_skipped", tool=tool, reason="ui_disabled")
+                continue
             
             # Skip libsecret-tool on WSL2 (uses Windows DPAPI instead)
-            if tool == "libsecret-tool" and self.platform_info.is_wsl2:
+            if category == "keyring" and self.platform_info.is_wsl2:
                 log.debug("skipping_libsecret_on_wsl2", tool=tool)
                 continue
             
@@ -267,7 +468,7 @@ class DependencyValidator:
             
             if not check.found:
                 # libsecret-tool is optional (warning only)
-                if tool == "libsecret-tool":
+                if category == "keyring":
                     log.warning("libsecret_tool_not_found", 
                                note="Keyring will use default backend")
                 else:
@@ -331,40 +532,51 @@ class DependencyValidator:
     
     def _get_tool_version(self, tool: str) -> Optional[str]:
         """Get version of a system tool."""
-        try:
-            # Try --version first
-            result = subprocess.run(
-                [tool, "--version"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if result.returncode == 0:
-                # Extract version from output (first line, first number)
-                import re
-                match = re.search(r'(\d+\.\d+(?:\.\d+)?)', result.stdout)
-                if match:
-                    return match.group(1)
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
+        # Some tools (hostapd, dnsmasq) print their version to stderr and/or
+        # exit non-zero, so search the combined output for every flag tried.
+        for flag in _VERSION_FLAGS:
+            _, output = self._run([tool, flag], merge_stderr=True)
+            match = _VERSION_RE.search(output)
+            if match:
+                return match.group(1).decode()
+        
+        return None
+    
+    def _run(
+        self,
+        argv: List[str],
+        timeout: float = _PROBE_TIMEOUT,
+        merge_stderr: bool = False
+    ) -> Tuple[int, bytes]:
+        """
+        Run an external probe command and capture its raw stdout.
+        
+        Output is returned undecoded; callers match on bytes. stderr is
+        discarded unless merge_stderr is set.
+        
+        Args:
+            argv: Command and arguments
+            timeout: Timeout in seconds
+            merge_stderr: Append stderr to the returned output
+            
+        Returns:
+            (returncode, stdout) - returncode is 127 if the command is not
+            installed and -1 if it timed out
+        """
+        import subprocess
         
-        # Try -V for some tools
         try:
             result = subprocess.run(
-                [tool, "-V"],
-                capture_output=True,
-                text=True,
-                timeout=5
+                argv,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT if merge_stderr else subprocess.DEVNULL,
+                timeout=timeout
             )
-            if result.returncode == 0:
-                import re
-                match = re.search(r'(\d+\.\d+(?:\.\d+)?)', result.stdout)
-                if match:
-                    return match.group(1)
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
-        
-        return None
+        except FileNotFoundError:
+            return 127, b""
+        except subprocess.TimeoutExpired:
+            return -1, b""
+        return result.returncode, result.stdout
     
     def _version_meets_requirement(self, version: str, min_version: str) -> bool:
         """Check if version meets minimum requirement."""
@@ -381,27 +593,27 @@ class DependencyValidator:
         except (ValueError, IndexError):
             return False
     
-    def _should_validate_package(self, package_name: str, config: dict) -> bool:
+    def _should_validate_package(self, package_name: str, category: str, config: dict) -> bool:
         """
         Determine if package should be validated based on config.
         
         Args:
             package_name: Package name
+            category: Package category from PYTHON_PACKAGES
             config: Configuration dict
             
         Returns:
             True if package should be validated
         """
         # Phase 3 database packages - only if database enabled
-        phase3_db_packages = ["alembic", "aiosqlite", "python-jose", "passlib"]
-        if package_name in phase3_db_packages:
+        if category == "database":
             db_enabled = config.get("database", {}).get("enabled", True)
             if not db_enabled:
                 log.debug("package_validation_skipped", package=package_name, reason="database_disabled")
                 return False
         
         # python-libpcap only if capture enabled
-        if package_name == "python-libpcap":
+        elif category == "capture":
             capture_enabled = config.get("capture", {}).get("enabled", False)
             if not capture_enabled:
                 log.debug("package_validation_skipped", package=package_name, reason="capture_disabled")
@@ -412,9 +624,9 @@ class DependencyValidator:
     def _validate_python_packages(self, config: dict = None) -> None:
         """Validate all required Python packages."""
         config = config or {}
-        for package, version_bounds in self.PYTHON_PACKAGES.items():
+        for package, version_bounds, category in self.PYTHON_PACKAGES:
             # Skip validation if feature disabled
-            if not self._should_validate_package(package, config):
+            if category != "core" and not self._should_validate_package(package, category, config):
                 continue
             check = self._check_python_package(package, version_bounds)
             self._checked_packages[package] = check
@@ -430,6 +642,8 @@ class DependencyValidator:
         version_bounds: Optional[Tuple[str, str]]
     ) -> DependencyCheck:
         """Check if a Python package is installed with correct version."""
+        import pkg_resources
+        
         try:
             dist = pkg_resources.get_distribution(package)
             version = dist.version
@@ -442,7 +656,7 @@ class DependencyValidator:
                         required=True,
                         found=True,
                         version=version,
-                        version_required=f">= {min_version}, < {max_version}",
+                        version_required=_version_range(version_bounds),
                         error=f"Version {version} outside required range"
                     )
             
@@ -451,14 +665,14 @@ class DependencyValidator:
                 required=True,
                 found=True,
                 version=version,
-                version_required=f">= {version_bounds[0]}, < {version_bounds[1]}" if version_bounds else None
+                version_required=_version_range(version_bounds)
             )
         except pkg_resources.DistributionNotFound:
             return DependencyCheck(
                 name=package,
                 required=True,
                 found=False,
-                version_required=f">= {version_bounds[0]}, < {version_bounds[1]}" if version_bounds else None,
+                version_required=_version_range(version_bounds),
                 error=f"{package} not installed"
             )
     
@@ -483,6 +697,102 @@ class DependencyValidator:
                 break
         return tuple(parts)
     
+    @property
+    def snapshot(self) -> SystemSnapshot:
+        """System snapshot, collected on first access and reused afterwards."""
+        if self._snapshot is None:
+            self._snapshot = self._collect_snapshot()
+        return self._snapshot
+    
+    def _collect_snapshot(self) -> SystemSnapshot:
+        """Collect host state, running the external probes concurrently."""
+        from concurrent.futures import ThreadPoolExecutor
+        import psutil  # Validated in PYTHON_PACKAGES
+        
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            ip_addr = pool.submit(self._run, ['ip', '-o', 'addr', 'show'])
+            netns = pool.submit(self._run, ['ip', 'netns', 'list'])
+            getenforce = pool.submit(self._run, ['getenforce'])
+            aa_status = pool.submit(self._run, ['aa-status'])
+            
+            try:
+                st = os.statvfs('/')
+                disk_free_gb = (st.f_bavail * st.f_frsize) / (1024**3)
+            except OSError:
+                disk_free_gb = None
+            try:
+                mem_total_gb = psutil.virtual_memory().total / (1024**3)
+            except Exception:
+                mem_total_gb = None
+            try:
+                cpu_count = psutil.cpu_count(logical=False)
+            except Exception:
+                cpu_count = None
+            kernel_modules = self._get_kernel_modules()
+            listening_ports = self._get_listening_ports()
+            
+            returncode, output = ip_addr.result()
+            ip_addrs = None
+            if returncode == 0:
+                # "<idx>: <iface>    inet 192.168.4.1/24 brd ..." per address
+                ip_addrs = tuple(
+                    fields[3].decode()
+                    for fields in map(bytes.split, output.splitlines())
+                    if len(fields) > 3 and fields[2] in (b'inet', b'inet6')
+                )
+            
+            netns_supported = netns.result()[0] == 0
+            
+            returncode, output = getenforce.result()
+            if returncode == 127:
+                selinux_mode = None
+            elif returncode == 0:
+                selinux_mode = output.strip().decode()
+            else:
+                selinux_mode = ""
+            
+            returncode, output = aa_status.result()
+            apparmor_profiles = frozenset()
+            if returncode == 127:
+                apparmor_status = "missing"
+            elif returncode == 0 and b'profiles are loaded' in output:
+                apparmor_status = "active"
+                # Profile names are the indented lines under each mode heading
+                apparmor_profiles = frozenset(
+                    line.strip().decode(errors="replace")
+                    for line in output.splitlines()
+                    if line[:1].isspace() and line.strip()
+                )
+            else:
+                apparmor_status = "inactive"
+        
+        return SystemSnapshot(
+            disk_free_gb=disk_free_gb,
+            mem_total_gb=mem_total_gb,
+            cpu_count=cpu_count,
+            kernel_modules=kernel_modules,
+            listening_ports=frozenset(listening_ports) if listening_ports is not None else None,
+            ip_addrs=ip_addrs,
+            netns_supported=netns_supported,
+            selinux_mode=selinux_mode,
+            apparmor_status=apparmor_status,
+            apparmor_profiles=apparmor_profiles,
+        )
+    
+    def _get_kernel_modules(self) -> Optional[FrozenSet[str]]:
+        """Get loaded kernel module names from /proc/modules (lsmod fallback)."""
+        try:
+            with open("/proc/modules", "r") as f:
+                return frozenset(line.split(" ", 1)[0] for line in f if line.strip())
+        except OSError:
+            pass
+        returncode, output = self._run(['lsmod'])
+        if returncode != 0:
+            return None
+        return frozenset(
+            line.split()[0].decode() for line in output.splitlines()[1:] if line.strip()
+        )
+    
     def _validate_system_capabilities(self) -> None:
         """Validate basic system capabilities."""
         # Check root/sudo access - FAIL IMMEDIATELY if not root
@@ -510,16 +820,20 @@ class DependencyValidator:
     
     def _validate_resources(self, mode: str = "production") -> None:
         """Validate system resources."""
+        import tempfile
+        import time
+        
+        snapshot = self.snapshot
+        
         # 1. Disk space check
-        try:
-            stat = os.statvfs('/')
-            available_gb = (stat.f_bavail * stat.f_frsize) / (1024**3)
+        available_gb = snapshot.disk_free_gb
+        if available_gb is None:
+            print("    ⚠️  Warning: Could not check disk space")
+        else:
             print(f"    ├─ Disk space: {available_gb:.2f}GB available")
             if available_gb < 1.0:
                 self._fail_fast_resource("Disk space", ">= 1GB", f"{available_gb:.2f}GB", 
                                           "Free up disk space or use different partition")
-        except Exception as e:
-            print(f"    ⚠️  Warning: Could not check disk space: {e}")
         
         # 2. Disk I/O speed check (write test)
         try:
@@ -546,9 +860,10 @@ class DependencyValidator:
             print(f"    ⚠️  Warning: Could not check disk I/O speed: {e}")
         
         # 3. Memory check
-        try:
-            mem = psutil.virtual_memory()
-            mem_gb = mem.total / (1024**3)
+        mem_gb = snapshot.mem_total_gb
+        if mem_gb is None:
+            print("    ⚠️  Warning: Could not check memory")
+        else:
             print(f"    ├─ Memory: {mem_gb:.2f}GB total")
             if mem_gb < 2.0:
                 if mode == "production":
@@ -557,12 +872,12 @@ class DependencyValidator:
                 else:
                     # WARN in dev mode
                     self._warn_resource("Memory", f"{mem_gb:.2f}GB", "< 2GB recommended")
-        except Exception as e:
-            print(f"    ⚠️  Warning: Could not check memory: {e}")
         
         # 4. CPU cores check
-        try:
-            cpu_count = psutil.cpu_count(logical=False)
+        cpu_count = snapshot.cpu_count
+        if cpu_count is None:
+            print("    ⚠️  Warning: Could not check CPU")
+        else:
             print(f"    └─ CPU cores: {cpu_count}")
             if cpu_count < 2:
                 if mode == "production":
@@ -570,26 +885,24 @@ class DependencyValidator:
                                               "Use system with more CPU cores")
                 else:
                     self._warn_resource("CPU cores", str(cpu_count), "< 2 recommended")
-        except Exception as e:
-            print(f"    ⚠️  Warning: Could not check CPU: {e}")
     
     def _validate_network_capabilities(self) -> None:
         """Validate network capabilities for hotspot creation."""
         # 1. Check for wireless interface
-        result = subprocess.run(['iw', 'dev'], capture_output=True, text=True, timeout=5)
-        if result.returncode != 0 or 'Interface' not in result.stdout:
+        returncode, output = self._run(['iw', 'dev'])
+        if returncode != 0 or b'Interface' not in output:
             # Try alternative: check for wlan interfaces
-            result2 = subprocess.run(['ip', 'link', 'show'], capture_output=True, text=True, timeout=5)
-            if 'wlan' not in result2.stdout and 'wifi' not in result2.stdout.lower():
+            _, output = self._run(['ip', 'link', 'show'])
+            if b'wlan' not in output and b'wifi' not in output.lower():
                 self._fail_fast_capability("WiFi adapter", "Required for hotspot creation",
                                             "Ensure WiFi adapter is connected and recognized by system")
         else:
             print("    ├─ WiFi adapter: ✓")
         
         # 2. Check AP mode support
-        result = subprocess.run(['iw', 'list'], capture_output=True, text=True, timeout=5)
-        if result.returncode == 0:
-            if 'AP' in result.stdout:
+        returncode, output = self._run(['iw', 'list'])
+        if returncode == 0:
+            if b'AP' in output:
                 print("    ├─ AP mode support: ✓")
             else:
                 self._fail_fast_capability("AP mode support", "WiFi adapter must support AP mode",
@@ -598,10 +911,10 @@ class DependencyValidator:
             print("    ⚠️  Warning: Could not check AP mode support (iw list failed)")
         
         # 3. Check kernel modules
-        result = subprocess.run(['lsmod'], capture_output=True, text=True, timeout=5)
-        if result.returncode == 0:
-            for module in ['mac80211', 'cfg80211']:
-                if module not in result.stdout:
+        kernel_modules = self.snapshot.kernel_modules
+        if kernel_modules is not None:
+            for module in ('mac80211', 'cfg80211'):
+                if module not in kernel_modules:
                     self._fail_fast_capability(f"Kernel module {module}", "Required for WiFi operations",
                                                 f"Load module: sudo modprobe {module}")
             print("    ├─ Kernel modules: ✓")
@@ -620,8 +933,7 @@ class DependencyValidator:
             print("    ⚠️  Warning: Could not check IP forwarding")
         
         # 5. Check network namespaces support
-        result = subprocess.run(['ip', 'netns', 'list'], capture_output=True, text=True, timeout=5)
-        if result.returncode == 0:
+        if self.snapshot.netns_supported:
             print("    └─ Network namespaces: ✓")
         else:
             self._fail_fast_capability("Network namespaces", "Required for isolation",
@@ -629,45 +941,43 @@ class DependencyValidator:
     
     def _validate_security_policies(self) -> None:
         """Validate security policies (SELinux, AppArmor)."""
+        snapshot = self.snapshot
+        
         # 1. Check SELinux
-        try:
-            result = subprocess.run(['getenforce'], capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                mode = result.stdout.strip()
-                if mode == 'Enforcing':
-                    # Check for required capabilities (simplified check)
-                    # In production, would check for specific policies
-                    print("    ├─ SELinux: Enforcing mode detected")
-                    self._warn_security("SELinux", "enforcing", "Ensure required policies are installed")
-                elif mode == 'Permissive':
-                    self._warn_security("SELinux", "permissive", "Not enforcing")
-                else:
-                    print("    ├─ SELinux: Disabled")
-        except FileNotFoundError:
+        mode = snapshot.selinux_mode
+        if mode is None:
             print("    ├─ SELinux: Not installed")
+        elif mode == 'Enforcing':
+            # Check for required capabilities (simplified check)
+            # In production, would check for specific policies
+            print("    ├─ SELinux: Enforcing mode detected")
+            self._warn_security("SELinux", "enforcing", "Ensure required policies are installed")
+        elif mode == 'Permissive':
+            self._warn_security("SELinux", "permissive", "Not enforcing")
+        elif mode:
+            print("    ├─ SELinux: Disabled")
         
         # 2. Check AppArmor
-        try:
-            result = subprocess.run(['aa-status'], capture_output=True, text=True, timeout=5)
-            if result.returncode == 0 and 'profiles are loaded' in result.stdout:
-                # Check if ax-traffic profile exists
-                if 'ax-traffic' not in result.stdout:
-                    print("    └─ AppArmor: Active (ax-traffic profile not found)")
-                    self._warn_security("AppArmor", "active without profile", 
-                                         "Install profile or disable AppArmor for testing")
-                else:
-                    print("    └─ AppArmor: Active with ax-traffic profile ✓")
-            else:
-                print("    └─ AppArmor: Not active")
-        except FileNotFoundError:
+        if snapshot.apparmor_status == "missing":
             print("    └─ AppArmor: Not installed")
+        elif snapshot.apparmor_status == "active":
+            # Check if ax-traffic profile exists
+            if not any('ax-traffic' in profile for profile in snapshot.apparmor_profiles):
+                print("    └─ AppArmor: Active (ax-traffic profile not found)")
+                self._warn_security("AppArmor", "active without profile", 
+                                     "Install profile or disable AppArmor for testing")
+            else:
+                print("    └─ AppArmor: Active with ax-traffic profile ✓")
+        else:
+            print("    └─ AppArmor: Not active")
     
     def _validate_network_state(self) -> None:
         """Validate network state before startup."""
+        import socket
+        
         # 1. Check for existing iptables rules
-        result = subprocess.run(['iptables', '-L', 'AX_TRAFFIC_ANALYZER', '-n'],
-                               capture_output=True, text=True, timeout=5)
-        if result.returncode == 0:
+        returncode, _ = self._run(['iptables', '-L', 'AX_TRAFFIC_ANALYZER', '-n'])
+        if returncode == 0:
             # Chain exists
             self._fail_fast_network("iptables conflict", 
                                     "AX_TRAFFIC_ANALYZER chain already exists",
@@ -676,26 +986,27 @@ class DependencyValidator:
             print("    ├─ iptables: No existing AX_TRAFFIC_ANALYZER chain ✓")
         
         # 2. Check port availability (API: 8443, mitmproxy: 8080, metrics: 9090)
-        import socket
-        ports_available = True
-        required_ports = [8080, 8443, 9090]  # mitmproxy, API, metrics
-        for port in required_ports:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(1)
-            result = sock.connect_ex(('localhost', port))
-            sock.close()
-            if result == 0:
-                port_name = "mitmproxy" if port == 8080 else ("API" if port == 8443 else "metrics")
-                self._fail_fast_network(f"Port {port} ({port_name})", f"Port {port} already in use",
-                                        f"Stop service using port {port}: sudo lsof -i :{port}")
-                ports_available = False
-        if ports_available:
-            print("    ├─ Ports (API: 8443, mitmproxy: 8080, metrics: 9090): Available ✓")
+        required_ports = {8080: "mitmproxy", 8443: "API", 9090: "metrics"}
+        listening = self.snapshot.listening_ports
+        if listening is None:
+            # /proc unavailable - fall back to probing each port
+            listening = set()
+            for port in required_ports:
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                sock.settimeout(1)
+                if sock.connect_ex(('localhost', port)) == 0:
+                    listening.add(port)
+                sock.close()
+        for port in sorted(listening.intersection(required_ports)):
+            port_name = required_ports[port]
+            self._fail_fast_network(f"Port {port} ({port_name})", f"Port {port} already in use",
+                                    f"Stop service using port {port}: sudo lsof -i :{port}")
+        print("    ├─ Ports (API: 8443, mitmproxy: 8080, metrics: 9090): Available ✓")
         
         # 3. Check IP range conflicts
-        result = subprocess.run(['ip', 'addr'], capture_output=True, text=True, timeout=5)
-        if result.returncode == 0:
-            if '192.168.4.' in result.stdout:
+        ip_addrs = self.snapshot.ip_addrs
+        if ip_addrs is not None:
+            if any(addr.startswith('192.168.4.') for addr in ip_addrs):
                 self._fail_fast_network("IP range conflict", 
                                         "192.168.4.0/24 already in use",
                                         "Change hotspot IP range in config.json (when config system is implemented)")
@@ -704,6 +1015,29 @@ class DependencyValidator:
         else:
             print("    └─ IP range: Could not check")
     
+    def _get_listening_ports(self) -> Optional[set]:
+        """
+        Get TCP ports in LISTEN state from /proc/net/tcp{,6}.
+        
+        Returns:
+            Set of listening ports, or None if /proc/net/tcp is unreadable
+        """
+        ports = set()
+        for table in ("/proc/net/tcp", "/proc/net/tcp6"):
+            try:
+                with open(table, "r") as f:
+                    lines = f.read().splitlines()[1:]
+            except OSError:
+                if table == "/proc/net/tcp":
+                    return None
+                continue  # IPv6 disabled
+            for line in lines:
+                fields = line.split()
+                # fields[1] = local "ADDR:PORT" (hex), fields[3] = state (0A = LISTEN)
+                if len(fields) > 3 and fields[3] == "0A":
+                    ports.add(int(fields[1].rsplit(":", 1)[1], 16))
+        return ports
+    
     def _fail_fast_tool(
         self,
         tool: str,
@@ -711,43 +1045,17 @@ class DependencyValidator:
         check: DependencyCheck
     ) -> None:
         """Fail-fast for missing system tool."""
-        platform_str = f"{self.platform_info.distribution} {self.platform_info.distribution_version}"
-        
-        # Get installation command based on distribution
-        install_cmd = self._get_install_command(tool)
-        
-        error_msg = f"""
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-❌ CRITICAL ERROR: Required dependency missing
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-COMPONENT:    {tool}
-VERSION REQ:  >= {version_req}
-FOUND:        {check.error or "Not installed"}
-PLATFORM:     Linux ({platform_str})
-REQUIRED FOR: {self._get_tool_purpose(tool)}
-
-SOLUTION:
-  Run the following commands:
-
-    {install_cmd}
-
-  Then run AX-TrafficAnalyzer again.
-
-DOCUMENTATION:
-  https://docs.ax-traffic-analyzer.com/installation/dependencies
-
-ALTERNATIVE:
-  None - {tool} is a core dependency and cannot be substituted.
-
-If you believe {tool} is installed but not detected:
-  1. Check if it's in your PATH: which {tool}
-  2. Set custom path via env: export {tool.upper()}_PATH=/path/to/{tool}
-  3. Report this issue: https://github.com/ax/issues
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-"""
-        raise DependencyValidationError(error_msg)
+        error_msg = _TOOL_ERROR_TEMPLATE.format_map({
+            "tool": tool,
+            "tool_upper": tool.upper(),
+            "version_req": version_req,
+            "found": check.error or "Not installed",
+            "platform": self._platform_str,
+            "purpose": self._get_tool_purpose(tool),
+            # Installation command based on distribution
+            "install_cmd": self._get_install_command(tool),
+        })
+        raise DependencyValidationError(error_msg) from None
     
     def _fail_fast_package(
         self,
@@ -756,36 +1064,21 @@ If you believe {tool} is installed but not detected:
         check: DependencyCheck
     ) -> None:
         """Fail-fast for missing or incorrect Python package."""
-        version_req = f">= {version_bounds[0]}, < {version_bounds[1]}" if version_bounds else "any recent version"
+        version_req = _version_range(version_bounds) or "any recent version"
         
         if not check.found:
             install_cmd = f"pip install '{package}>={version_bounds[0]},<{version_bounds[1]}'" if version_bounds else f"pip install {package}"
         else:
             install_cmd = f"pip install --upgrade '{package}>={version_bounds[0]},<{version_bounds[1]}'"
         
-        error_msg = f"""
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-❌ CRITICAL ERROR: Python package issue
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-COMPONENT:    {package}
-VERSION REQ:  {version_req}
-FOUND:        {check.error or (check.version or "Not installed")}
-PLATFORM:     Python {self.platform_info.python_version}
-
-SOLUTION:
-  Run the following command:
-
-    {install_cmd}
-
-  Then run AX-TrafficAnalyzer again.
-
-DOCUMENTATION:
-  https://docs.ax-traffic-analyzer.com/installation/dependencies
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-"""
-        raise DependencyValidationError(error_msg)
+        error_msg = _PACKAGE_ERROR_TEMPLATE.format_map({
+            "package": package,
+            "version_req": version_req,
+            "found": check.error or (check.version or "Not installed"),
+            "python_version": self._python_version_str,
+            "install_cmd": install_cmd,
+        })
+        raise DependencyValidationError(error_msg) from None
     
     def _fail_fast_capability(
         self,
@@ -794,40 +1087,24 @@ DOCUMENTATION:
         solution: str
     ) -> None:
         """Fail-fast for missing system capability."""
-        error_msg = f"""
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-❌ CRITICAL ERROR: System capability missing
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-CAPABILITY:   {capability}
-REASON:      {reason}
-PLATFORM:    {self.platform_info.distribution} {self.platform_info.distribution_version}
-
-SOLUTION:
-  {solution}
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-"""
-        raise DependencyValidationError(error_msg)
+        error_msg = _CAPABILITY_ERROR_TEMPLATE.format_map({
+            "capability": capability,
+            "reason": reason,
+            "solution": solution,
+            "platform": self._platform_str,
+        })
+        raise DependencyValidationError(error_msg) from None
     
     def _fail_fast_resource(self, resource: str, required: str, found: str, solution: str) -> None:
         """Fail-fast for insufficient resources."""
-        error_msg = f"""
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-❌ CRITICAL ERROR: Insufficient system resources
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-RESOURCE:    {resource}
-REQUIRED:    {required}
-FOUND:       {found}
-PLATFORM:    {self.platform_info.distribution} {self.platform_info.distribution_version}
-
-SOLUTION:
-  {solution}
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-"""
-        raise DependencyValidationError(error_msg)
+        error_msg = _RESOURCE_ERROR_TEMPLATE.format_map({
+            "resource": resource,
+            "required": required,
+            "found": found,
+            "solution": solution,
+            "platform": self._platform_str,
+        })
+        raise DependencyValidationError(error_msg) from None
     
     def _warn_resource(self, resource: str, found: str, recommendation: str) -> None:
         """Warning for resources (dev mode)."""
@@ -835,21 +1112,13 @@ SOLUTION:
     
     def _fail_fast_security(self, component: str, reason: str, solution: str) -> None:
         """Fail-fast for security policy issues."""
-        error_msg = f"""
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-❌ CRITICAL ERROR: Security policy issue
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-COMPONENT:   {component}
-REASON:      {reason}
-PLATFORM:    {self.platform_info.distribution} {self.platform_info.distribution_version}
-
-SOLUTION:
-  {solution}
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-"""
-        raise DependencyValidationError(error_msg)
+        error_msg = _SECURITY_ERROR_TEMPLATE.format_map({
+            "component": component,
+            "reason": reason,
+            "solution": solution,
+            "platform": self._platform_str,
+        })
+        raise DependencyValidationError(error_msg) from None
     
     def _warn_security(self, component: str, status: str, note: str) -> None:
         """Warning for security policies."""
@@ -857,21 +1126,13 @@ SOLUTION:
     
     def _fail_fast_network(self, issue: str, reason: str, solution: str) -> None:
         """Fail-fast for network state issues."""
-        error_msg = f"""
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-❌ CRITICAL ERROR: Network state conflict
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-ISSUE:       {issue}
-REASON:      {reason}
-PLATFORM:    {self.platform_info.distribution} {self.platform_info.distribution_version}
-
-SOLUTION:
-  {solution}
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-"""
-        raise DependencyValidationError(error_msg)
+        error_msg = _NETWORK_ERROR_TEMPLATE.format_map({
+            "issue": issue,
+            "reason": reason,
+            "solution": solution,
+            "platform": self._platform_str,
+        })
+        raise DependencyValidationError(error_msg) from None
     
     def _warn_capability(self, capability: str, status: str, note: str) -> None:
         """Warning for capabilities that can be fixed at runtime."""
@@ -879,31 +1140,10 @@ SOLUTION:
     
     def _get_install_command(self, tool: str) -> str:
         """Get installation command based on distribution."""
-        dist = self.platform_info.distribution.lower()
-        
-        if dist in ["ubuntu", "debian"]:
-            return f"sudo apt-get update\n    sudo apt-get install {tool}"
-        elif dist in ["fedora", "rhel", "centos"]:
-            return f"sudo dnf install {tool}"
-        elif dist == "arch":
-            return f"sudo pacman -S {tool}"
-        else:
-            return f"Install {tool} using your distribution's package manager"
+        return _INSTALL_COMMANDS.get(self._dist_lc, _INSTALL_COMMAND_FALLBACK).format(tool=tool)
     
-    def _get_tool_purpose(self, tool: str) -> str:
+    @staticmethod
+    def _get_tool_purpose(tool: str) -> str:
         """Get purpose description for a tool."""
-        purposes = {
-            "hostapd": "WiFi hotspot creation",
-            "dnsmasq": "DHCP and DNS server",
-            "iptables": "IPv4 packet filtering",
-            "ip6tables": "IPv6 packet filtering",
-            "tcpdump": "Raw packet capture",
-            "tshark": "Protocol dissection",
-            "redis-server": "Message queue backend",
-            "ntpd": "Network time synchronization",
-            "chronyd": "Network time synchronization",
-            "ip": "Network interface management",
-            "systemctl": "Service management",
-        }
-        return purposes.get(tool, "System operation")
+        return _TOOL_PURPOSES.get(tool, "System operation")
 
@@ -35,7 +35,7 @@ EXIT_NETWORK_ERROR = 24
 EXIT_SECURITY_ERROR = 25
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class ErrorContext:
     """Structured error context."""
     component: str
@@ -45,6 +45,9 @@ class ErrorContext:
     solution: str
     platform: str
     documentation: Optional[str] = None
+    
+    def __repr__(self) -> str:
+        return f"ErrorContext({self.component})"
 
 
 class AXTrafficError(Exception):
@@ -17,18 +17,61 @@ INNOVATION:
 - World-class structured logging with structlog
 - Backward compatible with print() statements
 - Dual mode: dev (human-readable) / production (JSON)
+- Production JSON rendered with orjson when installed (stdlib json otherwise)
 """
 
 import sys
-import structlog
+import logging
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
+
+# structlog is imported on first use so importing this module stays cheap.
+
+# Minimum level emitted by loggers configured through setup_logging()
+_min_level = logging.DEBUG
+
+# Whether setup_logging() has run (get_logger() falls back to dev mode)
+_configured = False
+
+# (mode, level) currently applied, so repeat setup_logging() calls are no-ops
+_active: Optional[Tuple[str, int]] = None
+
+# Processor chains built by setup_logging(), keyed by mode
+_processors: Dict[str, list] = {}
+
+
+def _build_processors(mode: str) -> list:
+    """Build the structlog processor chain for a logging mode."""
+    import structlog
+    
+    processors = [
+        structlog.stdlib.add_log_level,
+        structlog.processors.TimeStamper(fmt="iso"),
+        structlog.processors.StackInfoRenderer(),
+        structlog.processors.format_exc_info,
+    ]
+    
+    if mode == "dev":
+        processors.append(structlog.dev.ConsoleRenderer())
+    else:
+        try:
+            import orjson
+        except ImportError:
+            processors.append(structlog.processors.JSONRenderer())
+        else:
+            # PrintLogger writes str, orjson produces bytes
+            processors.append(structlog.processors.JSONRenderer(
+                serializer=lambda obj, **kw: orjson.dumps(obj, default=kw.get("default")).decode()
+            ))
+    
+    return processors
 
 
 def setup_logging(
     mode: str = "dev",
     log_file: Optional[str] = None,
-    enable_print: bool = None
+    enable_print: bool = None,
+    level: Optional[int] = None
 ):
     """
     Setup structured logging.
@@ -37,25 +80,28 @@ def setup_logging(
         mode: "dev" or "production"
         log_file: Path to log file (optional)
         enable_print: Force enable/disable print output (None = auto)
+        level: Minimum log level (None = DEBUG in dev, INFO in production)
     """
+    global _min_level, _configured, _active
+    import structlog
+    
     if enable_print is None:
         enable_print = (mode == "dev")
+    if level is None:
+        level = logging.DEBUG if mode == "dev" else logging.INFO
+    if _configured and _active == (mode, level):
+        return
+    _min_level = level
+    _active = (mode, level)
     
-    processors = [
-        structlog.stdlib.add_log_level,
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
-    ]
-    
-    if mode == "dev":
-        processors.append(structlog.dev.ConsoleRenderer())
-    else:
-        processors.append(structlog.processors.JSONRenderer())
+    processors = _processors.get(mode)
+    if processors is None:
+        processors = _processors[mode] = _build_processors(mode)
     
+    _configured = True
     structlog.configure(
         processors=processors,
-        wrapper_class=structlog.stdlib.BoundLogger,
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         context_class=dict,
         logger_factory=structlog.PrintLoggerFactory(),
         cache_logger_on_first_use=True,
@@ -63,10 +109,18 @@ def setup_logging(
 
 
 def get_logger(name: str):
-    """Get a logger instance."""
+    """Get a logger instance (configures dev-mode logging on first use)."""
+    import structlog
+    
+    if not _configured:
+        setup_logging(mode="dev")
     return structlog.get_logger(name)
 
 
-# Initialize with dev mode by default
-setup_logging(mode="dev")
-
+def is_enabled_for(level: int) -> bool:
+    """
+    Check if log calls at the given level are emitted.
+    
+    Lets hot paths skip building log arguments when the level is filtered.
+    """
+    return level >= _min_level
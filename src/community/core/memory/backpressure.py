@@ -24,6 +24,11 @@ class BackpressureController:
     to prevent memory exhaustion.
     """
     
+    __slots__ = (
+        "buffer",
+        "paused",
+    )
+    
     def __init__(self, buffer: RingBuffer):
         """
         Initialize backpressure controller.
@@ -42,17 +47,22 @@ class BackpressureController:
         Returns:
             True if buffer is >80% full (backpressure threshold)
         """
-        is_full = self.buffer.is_full()
+        buffer = self.buffer
+        is_full = buffer.current_size >= buffer.backpressure_threshold
+        
+        # Fast path: state unchanged, nothing to signal
+        if is_full is self.paused:
+            return is_full
         
-        if is_full and not self.paused:
+        if is_full:
             self.paused = True
             log.warning("backpressure_pause_signal", 
-                       buffer_size_mb=self.buffer.size_mb(),
-                       max_size_mb=self.buffer.max_size_mb())
-        elif not is_full and self.paused:
+                       buffer_size_mb=buffer.size_mb(),
+                       max_size_mb=buffer.max_size_mb_cached)
+        else:
             self.paused = False
             log.info("backpressure_resume_signal",
-                    buffer_size_mb=self.buffer.size_mb())
+                    buffer_size_mb=buffer.size_mb())
         
         return is_full
     
@@ -67,11 +77,13 @@ class BackpressureController:
         Returns:
             Dictionary with buffer metrics
         """
+        buffer = self.buffer
+        current_size = buffer.current_size
         return {
-            "size_mb": self.buffer.size_mb(),
-            "max_size_mb": self.buffer.max_size_mb(),
-            "usage_percent": (self.buffer.size_mb() / self.buffer.max_size_mb()) * 100,
+            "size_mb": buffer.size_mb(),
+            "max_size_mb": buffer.max_size_mb_cached,
+            "usage_percent": current_size * 100.0 / buffer.max_size_bytes,
             "paused": self.paused,
-            "threshold_mb": self.buffer.backpressure_threshold / (1024 * 1024)
+            "threshold_mb": buffer.threshold_mb_cached
         }
 
@@ -10,7 +10,8 @@ Circuit breaker to pause capture after consecutive PCAP export failures.
 This file is part of AX-TrafficAnalyzer Community Edition.
 """
 
-from ..logging import get_logger
+import logging
+from ..logging import get_logger, is_enabled_for
 
 log = get_logger(__name__)
 
@@ -23,6 +24,13 @@ class CircuitBreaker:
     Circuit can be manually reset after fixing the issue.
     """
     
+    __slots__ = (
+        "failure_threshold",
+        "consecutive_failures",
+        "is_open",
+        "_warn",
+    )
+    
     def __init__(self, failure_threshold: int = 3):
         """
         Initialize circuit breaker.
@@ -33,6 +41,7 @@ class CircuitBreaker:
         self.failure_threshold = failure_threshold
         self.consecutive_failures = 0
         self.is_open = False
+        self._warn = is_enabled_for(logging.WARNING)  # Cached log-level state
         log.debug("circuit_breaker_initialized", threshold=failure_threshold)
     
     def record_failure(self) -> None:
@@ -42,9 +51,10 @@ class CircuitBreaker:
         If failures reach threshold, circuit opens (pauses capture).
         """
         self.consecutive_failures += 1
-        log.warning("circuit_breaker_failure_recorded",
-                   consecutive_failures=self.consecutive_failures,
-                   threshold=self.failure_threshold)
+        if self._warn:
+            log.warning("circuit_breaker_failure_recorded",
+                       consecutive_failures=self.consecutive_failures,
+                       threshold=self.failure_threshold)
         
         if self.consecutive_failures >= self.failure_threshold:
             self.is_open = True
@@ -58,6 +68,10 @@ class CircuitBreaker:
         
         Resets failure count and closes circuit if open.
         """
+        # Fast path: nothing to reset (the common case)
+        if not self.consecutive_failures and not self.is_open:
+            return
+        
         if self.consecutive_failures > 0:
             log.info("circuit_breaker_success_recorded",
                     previous_failures=self.consecutive_failures)
@@ -89,10 +103,12 @@ class CircuitBreaker:
         Returns:
             Dictionary with circuit breaker metrics
         """
+        failures = self.consecutive_failures
+        remaining = self.failure_threshold - failures
         return {
             "is_open": self.is_open,
-            "consecutive_failures": self.consecutive_failures,
+            "consecutive_failures": failures,
             "threshold": self.failure_threshold,
-            "remaining_until_open": max(0, self.failure_threshold - self.consecutive_failures)
+            "remaining_until_open": remaining if remaining > 0 else 0
         }
 
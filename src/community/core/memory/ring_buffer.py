@@ -10,12 +10,17 @@ Fixed-size ring buffer with FIFO semantics for PCAP export.
 This file is part of AX-TrafficAnalyzer Community Edition.
 """
 
+import logging
+import os
 from collections import deque
-from typing import Optional
-from ..logging import get_logger
+from typing import Optional, Sequence
+from ..logging import get_logger, is_enabled_for
 
 log = get_logger(__name__)
 
+# Bytes -> megabytes scale factor
+_INV_MB = 1.0 / (1024 * 1024)
+
 
 class RingBuffer:
     """
@@ -23,8 +28,26 @@ class RingBuffer:
     
     When full, oldest data is dropped (ring behavior).
     Used for PCAP export buffering with backpressure control.
+    
+    Packet bytes live in a single preallocated bytearray addressed by
+    head/tail offsets; only the length of each packet is tracked per entry.
     """
     
+    __slots__ = (
+        "max_size_bytes",
+        "current_size",
+        "backpressure_threshold",
+        "max_size_mb_cached",
+        "threshold_mb_cached",
+        "_buf",
+        "_mv",
+        "_head",
+        "_tail",
+        "_frames",
+        "_debug",
+        "_warn",
+    )
+    
     def __init__(self, max_size_mb: int = 10):
         """
         Initialize ring buffer.
@@ -34,9 +57,20 @@ class RingBuffer:
         """
         self.max_size_bytes = max_size_mb * 1024 * 1024
         self.current_size = 0
-        self.buffer = deque()
         self.backpressure_threshold = int(self.max_size_bytes * 0.8)  # 80% threshold
-        log.debug("ring_buffer_initialized", max_size_mb=max_size_mb, threshold_mb=self.backpressure_threshold / (1024*1024))
+        self.max_size_mb_cached = self.max_size_bytes * _INV_MB
+        self.threshold_mb_cached = self.backpressure_threshold * _INV_MB
+        self._buf = bytearray(self.max_size_bytes)
+        self._mv = memoryview(self._buf)
+        self._head = 0  # Offset of oldest stored byte
+        self._tail = 0  # Offset where next packet is written
+        self._frames = deque()  # Packet lengths, oldest first
+        # Debug logging state is fixed once logging is configured; cache it so
+        # push/pop skip building log arguments when debug output is filtered
+        self._debug = is_enabled_for(logging.DEBUG)
+        self._warn = is_enabled_for(logging.WARNING)
+        if self._debug:
+            log.debug("ring_buffer_initialized", max_size_mb=max_size_mb, threshold_mb=self.threshold_mb_cached)
     
     def push(self, data: bytes) -> bool:
         """
@@ -51,26 +85,103 @@ class RingBuffer:
             True if added successfully, False if buffer is full (backpressure signal)
         """
         data_size = len(data)
+        max_b = self.max_size_bytes
+        cur = self.current_size
+        frames = self._frames
         
         # Check if adding would exceed max size
-        if self.current_size + data_size > self.max_size_bytes:
+        if cur + data_size > max_b:
             # Drop oldest data until we have space
-            while self.current_size + data_size > self.max_size_bytes and self.buffer:
-                dropped = self.buffer.popleft()
-                self.current_size -= len(dropped)
-                log.warning("ring_buffer_overflow", dropped_bytes=len(dropped))
+            popleft = frames.popleft
+            head = self._head
+            dropped_items = 0
+            while cur + data_size > max_b and frames:
+                dropped = popleft()
+                head += dropped
+                if head >= max_b:
+                    head -= max_b
+                cur -= dropped
+                dropped_items += 1
+            self._head = head
+            self.current_size = cur
+            if dropped_items and self._warn:
+                log.warning("ring_buffer_overflow", dropped_items=dropped_items)
             
             # If still too large, drop this data
-            if self.current_size + data_size > self.max_size_bytes:
-                log.error("ring_buffer_data_too_large", data_size=data_size, max_size=self.max_size_bytes)
+            if cur + data_size > max_b:
+                log.error("ring_buffer_data_too_large", data_size=data_size, max_size=max_b)
                 return False
         
-        # Add data
-        self.buffer.append(data)
-        self.current_size += data_size
-        log.debug("ring_buffer_pushed", data_size=data_size, current_size_mb=self.current_size / (1024*1024))
+        # Add data (split across the wrap point if needed)
+        tail = self._tail
+        end = tail + data_size
+        if end <= max_b:
+            self._mv[tail:end] = data
+        else:
+            first = max_b - tail
+            view = memoryview(data)
+            self._mv[tail:] = view[:first]
+            self._mv[:data_size - first] = view[first:]
+            end -= max_b
+        # end == max_b wraps to the start of the ring
+        self._tail = end if end < max_b else 0
+        frames.append(data_size)
+        self.current_size = cur + data_size
+        if self._debug:
+            log.debug("ring_buffer_pushed", data_size=data_size, current_size_mb=self.current_size * _INV_MB)
         return True
     
+    def push_many(self, chunks: Sequence[bytes]) -> int:
+        """
+        Add a batch of packets to buffer.
+        
+        Equivalent to calling push() for each chunk in order, but a batch
+        that fits the buffer is copied in with a single write.
+        
+        Args:
+            chunks: Packets to add (bytes), oldest first
+            
+        Returns:
+            Number of packets added (oversized packets are skipped)
+        """
+        sizes = list(map(len, chunks))
+        total = sum(sizes)
+        
+        # Batches larger than the whole buffer fall back to per-packet pushes
+        if total > self.max_size_bytes:
+            return sum(map(self.push, chunks))
+        
+        # Drop oldest data until the whole batch fits
+        if self.current_size + total > self.max_size_bytes:
+            dropped_items = 0
+            dropped_bytes = 0
+            while self.current_size + total > self.max_size_bytes:
+                dropped = self._frames.popleft()
+                self._head = self._advance(self._head, dropped)
+                self.current_size -= dropped
+                dropped_items += 1
+                dropped_bytes += dropped
+            if self._warn:
+                log.warning("ring_buffer_overflow", dropped_items=dropped_items, dropped_bytes=dropped_bytes)
+        
+        data = b"".join(chunks)
+        tail = self._tail
+        end = tail + total
+        if end <= self.max_size_bytes:
+            self._mv[tail:end] = data
+        else:
+            first = self.max_size_bytes - tail
+            view = memoryview(data)
+            self._mv[tail:] = view[:first]
+            self._mv[:total - first] = view[first:]
+        self._tail = self._advance(tail, total)
+        self._frames.extend(sizes)
+        self.current_size += total
+        if self._debug:
+            log.debug("ring_buffer_pushed_batch", count=len(sizes), data_size=total,
+                      current_size_mb=self.current_size * _INV_MB)
+        return len(sizes)
+    
     def pop(self) -> Optional[bytes]:
         """
         Remove and return oldest data from buffer.
@@ -78,14 +189,75 @@ class RingBuffer:
         Returns:
             Oldest data (bytes) or None if buffer is empty
         """
-        if not self.buffer:
+        if not self._frames:
             return None
         
-        data = self.buffer.popleft()
-        self.current_size -= len(data)
-        log.debug("ring_buffer_popped", data_size=len(data), remaining_size_mb=self.current_size / (1024*1024))
+        data_size = self._frames.popleft()
+        head = self._head
+        end = head + data_size
+        if end <= self.max_size_bytes:
+            data = bytes(self._mv[head:end])
+        else:
+            data = bytes(self._mv[head:]) + bytes(self._mv[:end - self.max_size_bytes])
+        self._head = self._advance(head, data_size)
+        self.current_size -= data_size
+        if self._debug:
+            log.debug("ring_buffer_popped", data_size=data_size, remaining_size_mb=self.current_size * _INV_MB)
         return data
     
+    def drain_to_fd(self, fd: int) -> int:
+        """
+        Write all buffered data to a file descriptor and empty the buffer.
+        
+        Packets are stored back to back, so the buffered bytes form at most
+        two contiguous segments of the ring; they are written straight from
+        the ring with os.writev, without per-packet copies. Packet boundaries
+        are not preserved, so the data must already carry its own framing.
+        
+        Args:
+            fd: Open file descriptor to write to
+            
+        Returns:
+            Number of bytes written
+            
+        Raises:
+            OSError: If the write fails (buffer is left unchanged)
+        """
+        if not self._frames:
+            return 0
+        
+        head = self._head
+        end = head + self.current_size
+        if end <= self.max_size_bytes:
+            segments = [self._mv[head:end]]
+        else:
+            segments = [self._mv[head:], self._mv[:end - self.max_size_bytes]]
+        
+        written = 0
+        while segments:
+            n = os.writev(fd, segments)
+            written += n
+            # Drop fully written segments and trim a partially written one
+            while segments and n >= len(segments[0]):
+                n -= len(segments[0])
+                segments.pop(0)
+            if n:
+                segments[0] = segments[0][n:]
+        
+        if self._debug:
+            log.debug("ring_buffer_drained", items=len(self._frames), data_size=written)
+        self._frames.clear()
+        self._head = self._tail = 0
+        self.current_size = 0
+        return written
+    
+    def _advance(self, offset: int, length: int) -> int:
+        """Advance a ring offset by length bytes, wrapping at capacity."""
+        offset += length
+        if offset >= self.max_size_bytes:
+            offset -= self.max_size_bytes
+        return offset
+    
     def is_full(self) -> bool:
         """
         Check if buffer is >80% full (backpressure threshold).
@@ -97,20 +269,21 @@ class RingBuffer:
     
     def is_empty(self) -> bool:
         """Check if buffer is empty."""
-        return len(self.buffer) == 0
+        # Frame count, not current_size: zero-length packets still count
+        return not self._frames
     
     def size_mb(self) -> float:
         """Get current size in megabytes."""
-        return self.current_size / (1024 * 1024)
+        return self.current_size * _INV_MB
     
     def max_size_mb(self) -> float:
         """Get maximum size in megabytes."""
-        return self.max_size_bytes / (1024 * 1024)
+        return self.max_size_mb_cached
     
     def clear(self) -> None:
         """Clear all data from buffer."""
-        dropped_count = len(self.buffer)
-        self.buffer.clear()
+        if is_enabled_for(logging.INFO):
+            log.info("ring_buffer_cleared", dropped_items=len(self._frames))
+        self._frames.clear()
+        self._head = self._tail = 0
         self.current_size = 0
-        log.info("ring_buffer_cleared", dropped_items=dropped_count)
-
@@ -10,7 +10,8 @@ Memory watermark monitoring (80% warning, 95% emergency).
 This file is part of AX-TrafficAnalyzer Community Edition.
 """
 
-import psutil
+import time
+from typing import Optional
 from ..logging import get_logger
 from ..errors import ResourceError
 
@@ -20,6 +21,12 @@ log = get_logger(__name__)
 WARNING_THRESHOLD = 0.80  # 80% - warn
 EMERGENCY_THRESHOLD = 0.95  # 95% - emergency cleanup
 
+# Bytes -> gigabytes scale factor
+_INV_GB = 1.0 / (1024 ** 3)
+
+# How long a check_memory() reading is reused before /proc/meminfo is re-read
+CHECK_CACHE_TTL = 0.1  # seconds
+
 
 class MemoryWatermarkMonitor:
     """
@@ -29,63 +36,106 @@ class MemoryWatermarkMonitor:
     at configurable thresholds.
     """
     
+    __slots__ = (
+        "warning_threshold",
+        "emergency_threshold",
+        "warning_triggered",
+        "emergency_triggered",
+        "_psutil",
+        "_cache_ttl_ns",
+        "_last_ns",
+        "_last_status",
+    )
+    
     def __init__(self, warning_threshold: float = WARNING_THRESHOLD,
-                 emergency_threshold: float = EMERGENCY_THRESHOLD):
+                 emergency_threshold: float = EMERGENCY_THRESHOLD,
+                 cache_ttl: float = CHECK_CACHE_TTL):
         """
         Initialize memory watermark monitor.
         
         Args:
             warning_threshold: Memory usage threshold for warning (default: 0.80 = 80%)
             emergency_threshold: Memory usage threshold for emergency (default: 0.95 = 95%)
+            cache_ttl: Seconds a reading is reused by check_memory (default: 0.1, 0 = no caching)
         """
         self.warning_threshold = warning_threshold
         self.emergency_threshold = emergency_threshold
         self.warning_triggered = False
         self.emergency_triggered = False
+        self._psutil = None  # Imported on first check_memory()
+        self._cache_ttl_ns = int(cache_ttl * 1_000_000_000)
+        self._last_ns = 0
+        self._last_status: Optional[dict] = None
         log.debug("memory_watermark_monitor_initialized",
                  warning_threshold=warning_threshold,
                  emergency_threshold=emergency_threshold)
     
-    def check_memory(self) -> dict:
+    def check_memory(self, full: bool = False) -> dict:
         """
         Check current memory usage.
         
+        Readings are reused for cache_ttl seconds. Emergency readings are
+        never cached, so the threshold is always re-checked.
+        
+        Crossing the emergency threshold is reported, not raised, so
+        monitoring loops can run cleanup; use check_memory_or_raise() to
+        fail fast instead.
+        
+        Args:
+            full: Always return the full metric set. By default a normal
+                reading only carries usage_percent, available_gb, status
+                and emergency.
+        
         Returns:
-            Dictionary with memory metrics and status
-            
-        Raises:
-            ResourceError: If memory usage exceeds emergency threshold
+            Dictionary with memory metrics, status and emergency flag
         """
-        mem = psutil.virtual_memory()
-        usage_percent = mem.percent / 100.0
-        available_gb = mem.available / (1024 ** 3)
-        total_gb = mem.total / (1024 ** 3)
+        now = time.monotonic_ns()
+        last = self._last_status
+        if last is not None and now - self._last_ns < self._cache_ttl_ns and (not full or "total_gb" in last):
+            return last
+        
+        if self._psutil is None:
+            import psutil
+            self._psutil = psutil
+        mem = self._psutil.virtual_memory()
+        usage_percent = mem.percent * 0.01
+        available_gb = mem.available * _INV_GB
+        
+        # Fast path: well below the warning threshold with no flags to reset
+        if (not full and usage_percent < self.warning_threshold
+                and not self.warning_triggered and not self.emergency_triggered):
+            status = {
+                "usage_percent": usage_percent,
+                "available_gb": available_gb,
+                "status": "normal",
+                "emergency": False
+            }
+            self._last_status = status
+            self._last_ns = now
+            return status
+        
+        total_gb = mem.total * _INV_GB
         
         status = {
             "usage_percent": usage_percent,
             "available_gb": available_gb,
             "total_gb": total_gb,
-            "used_gb": (mem.total - mem.available) / (1024 ** 3),
+            "used_gb": (mem.total - mem.available) * _INV_GB,
             "warning_threshold": self.warning_threshold,
             "emergency_threshold": self.emergency_threshold,
-            "status": "normal"
+            "status": "normal",
+            "emergency": usage_percent >= self.emergency_threshold
         }
         
-        # Check emergency threshold (fail-fast)
-        if usage_percent >= self.emergency_threshold:
+        # Check emergency threshold (fail-loud, caller decides on cleanup)
+        if status["emergency"]:
             if not self.emergency_triggered:
                 self.emergency_triggered = True
                 log.error("memory_emergency_threshold_exceeded",
                          usage_percent=usage_percent,
                          available_gb=available_gb)
             status["status"] = "emergency"
-            raise ResourceError(
-                f"System memory usage exceeds emergency threshold: {usage_percent*100:.1f}% "
-                f"(threshold: {self.emergency_threshold*100:.1f}%). "
-                f"Available: {available_gb:.2f}GB / {total_gb:.2f}GB. "
-                f"Emergency cleanup required.",
-                None
-            )
+            return status
         
         # Check warning threshold (fail-loud)
         if usage_percent >= self.warning_threshold:
@@ -105,9 +155,36 @@ class MemoryWatermarkMonitor:
                 log.info("memory_emergency_cleared", usage_percent=usage_percent)
             status["status"] = "normal"
         
+        self._last_status = status
+        self._last_ns = now
+        return status
+    
+    def check_memory_or_raise(self) -> dict:
+        """
+        Check current memory usage, failing fast at the emergency threshold.
+        
+        Returns:
+            Dictionary with memory metrics and status
+            
+        Raises:
+            ResourceError: If memory usage exceeds emergency threshold
+        """
+        status = self.check_memory(full=True)
+        if status["emergency"]:
+            raise ResourceError(
+                f"System memory usage exceeds emergency threshold: {status['usage_percent']*100:.1f}% "
+                f"(threshold: {self.emergency_threshold*100:.1f}%). "
+                f"Available: {status['available_gb']:.2f}GB / {status['total_gb']:.2f}GB. "
+                f"Emergency cleanup required.",
+                None
+            ) from None
         return status
     
+    def invalidate(self) -> None:
+        """Drop the cached reading so the next check_memory() re-reads memory."""
+        self._last_status = None
+    
     def get_status(self) -> dict:
         """Get current memory status."""
-        return self.check_memory()
+        return self.check_memory(full=True)
 
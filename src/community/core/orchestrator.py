@@ -7,12 +7,17 @@
 @classification Enterprise Security Auditor and Education
 
 Coordinates atomic startup and shutdown of all components.
-Handles signal registration (SIGINT, SIGTERM) and ensures cleanup.
+Handles signal registration (SIGINT, SIGTERM, SIGHUP, SIGQUIT) and ensures cleanup.
+Signal handlers only flag the shutdown; the main thread performs it.
+AsyncStartupOrchestrator does the same for coroutine-based components.
 """
 
+import asyncio
+import os
 import signal
-import sys
-from typing import List, Callable, Optional, Any
+import threading
+import time
+from typing import Awaitable, Callable, Optional, Any, Sequence
 from dataclasses import dataclass
 from .logging import get_logger
 from .errors import NetworkError
@@ -20,7 +25,12 @@ from .errors import NetworkError
 log = get_logger(__name__)
 
 
-@dataclass
+def _timing(name: str, t0: float) -> dict:
+    """Build a {name, duration_ms} entry for aggregate start/stop events."""
+    return {"name": name, "duration_ms": round((time.perf_counter() - t0) * 1000, 3)}
+
+
+@dataclass(slots=True, frozen=True)
 class Component:
     """Component with cleanup callback."""
     name: str
@@ -39,30 +49,120 @@ class StartupOrchestrator:
     Single signal handler registration - components do not register their own.
     """
     
+    # Termination signals handled (SIGHUP/SIGQUIT are POSIX-only)
+    _HANDLED_SIGNALS = tuple(
+        name for name in ("SIGINT", "SIGTERM", "SIGHUP", "SIGQUIT") if hasattr(signal, name)
+    )
+    # Signal number -> name, so the handler does no enum lookup in signal context
+    _SIGNAL_NAMES = {getattr(signal, name): name for name in _HANDLED_SIGNALS}
+    
     def __init__(self):
         """Initialize orchestrator."""
-        self.components: List[Component] = []
-        self.started_components: List[Component] = []  # Track what started successfully
+        self.components: Sequence[Component] = []  # Becomes a tuple once sealed
+        self._sealed = False
+        self._started_count = 0  # Components[:_started_count] started successfully
         self._shutdown_requested = False
+        self._shutdown_event = threading.Event()
         self._original_signal_handlers = {}
+        # Self-pipe, created on the first wakeup_fd() call (-1 until then)
+        self._wakeup_r = self._wakeup_w = -1
+        self._original_wakeup_fd = -1
         self._register_signal_handlers()
     
     def _register_signal_handlers(self) -> None:
         """Register signal handlers for graceful shutdown."""
         # Save original handlers
-        self._original_signal_handlers[signal.SIGINT] = signal.signal(signal.SIGINT, self._signal_handler)
-        self._original_signal_handlers[signal.SIGTERM] = signal.signal(signal.SIGTERM, self._signal_handler)
-        log.debug("signal_handlers_registered")
+        for name in self._HANDLED_SIGNALS:
+            sig = getattr(signal, name)
+            self._original_signal_handlers[sig] = signal.signal(sig, self._signal_handler)
+        log.debug("signal_handlers_registered", signals=self._HANDLED_SIGNALS)
     
     def _signal_handler(self, signum, frame) -> None:
-        """Handle termination signals (SIGINT, SIGTERM)."""
-        signal_name = signal.Signals(signum).name
-        log.info("shutdown_signal_received", signal=signal_name)
+        """
+        Handle termination signals (SIGINT, SIGTERM, SIGHUP, SIGQUIT).
+        
+        Only records the request; components are stopped by the main thread
+        (start() aborts, wait_for_shutdown() returns), never in signal context.
+        """
+        log.info("shutdown_signal_received", signal=self._SIGNAL_NAMES.get(signum, str(signum)))
         self._shutdown_requested = True
+        self._shutdown_event.set()
+    
+    def wakeup_fd(self) -> int:
+        """
+        Get a file descriptor that becomes readable when a signal arrives.
+        
+        Register it with select/selectors (or a capture loop) to wake up on
+        shutdown signals. Note that asyncio replaces the process wakeup fd
+        while a loop with signal handlers is running.
+        
+        The pipe and the process-wide wakeup fd are installed on the first
+        call, which must come from the main thread; close() releases them.
+        """
+        if self._wakeup_r < 0:
+            # Self-pipe: the interpreter writes a byte per signal, so event loops
+            # and blocking selects see the signal without waiting for bytecode
+            self._wakeup_r, self._wakeup_w = os.pipe()
+            os.set_blocking(self._wakeup_r, False)
+            os.set_blocking(self._wakeup_w, False)
+            self._original_wakeup_fd = signal.set_wakeup_fd(self._wakeup_w, warn_on_full_buffer=False)
+        return self._wakeup_r
+    
+    def close(self) -> None:
+        """Restore the original signal handlers and wakeup fd, and close the pipe."""
+        for sig, handler in self._original_signal_handlers.items():
+            signal.signal(sig, handler if handler is not None else signal.SIG_DFL)
+        self._original_signal_handlers.clear()
+        if self._wakeup_r < 0:
+            return
+        current = signal.set_wakeup_fd(self._original_wakeup_fd)
+        if current != self._wakeup_w:
+            # Someone else installed a wakeup fd since; leave theirs in place
+            signal.set_wakeup_fd(current)
+        os.close(self._wakeup_r)
+        os.close(self._wakeup_w)
+        self._wakeup_r = self._wakeup_w = -1
+    
+    def shutdown_requested(self) -> bool:
+        """Check if a termination signal has been received."""
+        return self._shutdown_requested
+    
+    def wait_for_shutdown_request(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until a termination signal arrives, without stopping anything.
+        
+        Safe to call from a watcher thread; stop() is left to the main thread.
+        
+        Args:
+            timeout: Maximum seconds to wait (None = wait forever)
+            
+        Returns:
+            True if shutdown was requested, False if the timeout expired first
+        """
+        return self._shutdown_event.wait(timeout)
+    
+    def wait_for_shutdown(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until a termination signal arrives, then stop all components.
+        
+        Call from the main thread (use wait_for_shutdown_request() elsewhere).
+        
+        Args:
+            timeout: Maximum seconds to wait (None = wait forever)
+            
+        Returns:
+            True if shutdown was requested and components were stopped,
+            False if the timeout expired first
+        """
+        if not self.wait_for_shutdown_request(timeout):
+            return False
         self.stop()
-        # Restore original handler and re-raise
-        signal.signal(signum, self._original_signal_handlers.get(signum, signal.SIG_DFL))
-        sys.exit(0)
+        return True
+    
+    @property
+    def started_components(self) -> Sequence[Component]:
+        """Components that started successfully, in start order."""
+        return self.components[:self._started_count]
     
     def register_component(
         self,
@@ -79,7 +179,12 @@ class StartupOrchestrator:
             start_func: Function to start component (raises exception on failure)
             stop_func: Function to stop component (must not raise)
             component_obj: Optional component object reference
+            
+        Raises:
+            RuntimeError: If called after the orchestrator was sealed (started)
         """
+        if self._sealed:
+            raise RuntimeError(f"Cannot register component '{name}' after orchestrator start")
         component = Component(
             name=name,
             start=start_func,
@@ -89,52 +194,71 @@ class StartupOrchestrator:
         self.components.append(component)
         log.debug("component_registered", name=name)
     
+    def seal(self) -> None:
+        """Freeze the component list; further registration raises RuntimeError."""
+        if not self._sealed:
+            self._sealed = True
+            self.components = tuple(self.components)
+    
     def start(self) -> None:
         """
         Start all components atomically.
         
         If any component fails, rollback all previously started components
-        in reverse order, then raise the exception.
+        in reverse order, then raise the exception. If a shutdown signal
+        arrives during startup, started components are rolled back and
+        start() returns early (check shutdown_requested()).
         """
+        self.seal()
         log.info("orchestrator_start_begin", component_count=len(self.components))
         
-        try:
-            for component in self.components:
-                log.info("starting_component", name=component.name)
-                try:
-                    component.start()
-                    self.started_components.append(component)
-                    log.info("component_started", name=component.name)
-                except Exception as e:
-                    log.error(
-                        "component_start_failed",
-                        name=component.name,
-                        error=str(e),
-                        error_type=type(e).__name__
-                    )
-                    # Rollback all started components
-                    self._rollback()
-                    raise NetworkError(
-                        f"Failed to start component '{component.name}': {e}",
-                        None
-                    ) from e
+        # Per-component timings, reported in one event once startup completes
+        timings = []
+        for component in self.components:
+            if self._shutdown_requested:
+                # Signal arrived mid-startup: undo what started and bail out
+                log.warning("orchestrator_start_aborted", reason="shutdown_requested")
+                self._rollback()
+                return
             
-            log.info("orchestrator_start_complete", started_count=len(self.started_components))
+            log.debug("starting_component", name=component.name)
+            t0 = time.perf_counter()
+            try:
+                component.start()
+                self._started_count += 1
+                timings.append(_timing(component.name, t0))
+                log.debug("component_started", name=component.name)
+            except Exception as e:
+                log.error(
+                    "component_start_failed",
+                    name=component.name,
+                    error=str(e),
+                    error_type=type(e).__name__
+                )
+                # Rollback all started components (exactly once)
+                self._rollback()
+                raise NetworkError(
+                    f"Failed to start component '{component.name}': {e}",
+                    None
+                ) from e
         
-        except Exception as e:
-            log.error("orchestrator_start_failed", error=str(e))
-            self._rollback()
-            raise
+        log.info("orchestrator_start_complete", started_count=self._started_count, components=timings)
     
     def _rollback(self) -> None:
         """Rollback all started components in reverse order."""
-        log.warning("orchestrator_rollback_begin", components_to_rollback=len(self.started_components))
+        # Take the list before stopping anything so a re-entrant call sees nothing to do
+        snapshot = self.components[:self._started_count][::-1]
+        self._started_count = 0
+        log.warning("orchestrator_rollback_begin", components_to_rollback=len(snapshot))
         
         # Stop in reverse order
-        for component in reversed(self.started_components):
+        timings = []
+        for component in snapshot:
+            t0 = time.perf_counter()
             try:
-                log.info("rolling_back_component", name=component.name)
+                log.debug("rolling_back_component", name=component.name)
                 component.stop()
+                timings.append(_timing(component.name, t0))
                 log.debug("component_rollback_complete", name=component.name)
             except Exception as e:
                 # Log but continue rollback
@@ -144,26 +268,31 @@ class StartupOrchestrator:
                     error=str(e)
                 )
         
-        self.started_components.clear()
-        log.warning("orchestrator_rollback_complete")
+        log.warning("orchestrator_rollback_complete", components=timings)
     
     def stop(self) -> None:
         """
         Gracefully stop all components in reverse order.
         
-        Called by signal handler or manually for graceful shutdown.
+        Called from the main thread (wait_for_shutdown() or main's cleanup).
         """
-        if not self.started_components:
+        if not self._started_count:
             log.debug("orchestrator_stop_no_components")
             return
         
-        log.info("orchestrator_stop_begin", component_count=len(self.started_components))
+        # Take the list before stopping anything so a re-entrant call sees nothing to do
+        snapshot = self.components[:self._started_count][::-1]
+        self._started_count = 0
+        log.info("orchestrator_stop_begin", component_count=len(snapshot))
         
         # Stop in reverse order
-        for component in reversed(self.started_components):
+        timings = []
+        for component in snapshot:
+            t0 = time.perf_counter()
             try:
-                log.info("stopping_component", name=component.name)
+                log.debug("stopping_component", name=component.name)
                 component.stop()
+                timings.append(_timing(component.name, t0))
                 log.debug("component_stopped", name=component.name)
             except Exception as e:
                 # Log but continue shutdown
@@ -173,8 +302,7 @@ class StartupOrchestrator:
                     error=str(e)
                 )
         
-        self.started_components.clear()
-        log.info("orchestrator_stop_complete")
+        log.info("orchestrator_stop_complete", components=timings)
     
     def cleanup(self) -> None:
         """
@@ -184,3 +312,176 @@ class StartupOrchestrator:
         """
         self.stop()
 
+
+
+class AsyncStartupOrchestrator:
+    """
+    asyncio-native twin of StartupOrchestrator for components whose
+    start/stop are coroutines.
+    
+    Same all-or-nothing startup and reverse-order rollback, but components
+    are awaited directly on the running loop and termination signals are
+    handled with loop.add_signal_handler (no signal.signal, no thread relay).
+    """
+    
+    _HANDLED_SIGNALS = StartupOrchestrator._HANDLED_SIGNALS
+    
+    def __init__(self):
+        """Initialize async orchestrator."""
+        self.components: Sequence[Component] = []  # Becomes a tuple once sealed
+        self._sealed = False
+        self._started_count = 0  # Components[:_started_count] started successfully
+        self._shutdown_requested = False
+        self._shutdown_event = asyncio.Event()
+        self._signal_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def _register_signal_handlers(self) -> None:
+        """Register signal handlers on the running loop (once)."""
+        if self._signal_loop is not None:
+            return
+        loop = asyncio.get_running_loop()
+        for name in self._HANDLED_SIGNALS:
+            try:
+                loop.add_signal_handler(getattr(signal, name), self._signal_handler, name)
+            except (NotImplementedError, RuntimeError) as e:
+                # Not supported on this platform/thread; shutdown stays manual
+                log.debug("async_signal_handler_unavailable", signal=name, error=str(e))
+        self._signal_loop = loop
+        log.debug("signal_handlers_registered", signals=self._HANDLED_SIGNALS)
+    
+    def _signal_handler(self, signal_name: str) -> None:
+        """Handle termination signals (runs as a loop callback, not in signal context)."""
+        log.info("shutdown_signal_received", signal=signal_name)
+        self._shutdown_requested = True
+        self._shutdown_event.set()
+    
+    def close(self) -> None:
+        """Remove the loop signal handlers installed by start()."""
+        if self._signal_loop is None:
+            return
+        for name in self._HANDLED_SIGNALS:
+            self._signal_loop.remove_signal_handler(getattr(signal, name))
+        self._signal_loop = None
+    
+    def shutdown_requested(self) -> bool:
+        """Check if a termination signal has been received."""
+        return self._shutdown_requested
+    
+    @property
+    def started_components(self) -> Sequence[Component]:
+        """Components that started successfully, in start order."""
+        return self.components[:self._started_count]
+    
+    def register_component(
+        self,
+        name: str,
+        start_func: Callable[[], Awaitable[None]],
+        stop_func: Callable[[], Awaitable[None]],
+        component_obj: Optional[Any] = None
+    ) -> None:
+        """
+        Register a component with async start/stop functions.
+        
+        Args:
+            name: Component name (for logging)
+            start_func: Coroutine function to start component (raises on failure)
+            stop_func: Coroutine function to stop component (must not raise)
+            component_obj: Optional component object reference
+            
+        Raises:
+            RuntimeError: If called after the orchestrator was sealed (started)
+        """
+        if self._sealed:
+            raise RuntimeError(f"Cannot register component '{name}' after orchestrator start")
+        self.components.append(Component(
+            name=name,
+            start=start_func,
+            stop=stop_func,
+            object=component_obj
+        ))
+        log.debug("component_registered", name=name)
+    
+    def seal(self) -> None:
+        """Freeze the component list; further registration raises RuntimeError."""
+        if not self._sealed:
+            self._sealed = True
+            self.components = tuple(self.components)
+    
+    async def start(self) -> None:
+        """
+        Start all components atomically.
+        
+        If any component fails, rollback all previously started components
+        in reverse order, then raise NetworkError. If a shutdown signal
+        arrives during startup, started components are rolled back and
+        start() returns early (check shutdown_requested()).
+        """
+        self.seal()
+        self._register_signal_handlers()
+        log.info("orchestrator_start_begin", component_count=len(self.components))
+        
+        timings = []
+        for component in self.components:
+            if self._shutdown_requested:
+                log.warning("orchestrator_start_aborted", reason="shutdown_requested")
+                await self._rollback()
+                return
+            
+            log.debug("starting_component", name=component.name)
+            t0 = time.perf_counter()
+            try:
+                await component.start()
+                self._started_count += 1
+                timings.append(_timing(component.name, t0))
+                log.debug("component_started", name=component.name)
+            except Exception as e:
+                log.error(
+                    "component_start_failed",
+                    name=component.name,
+                    error=str(e),
+                    error_type=type(e).__name__
+                )
+                await self._rollback()
+                raise NetworkError(
+                    f"Failed to start component '{component.name}': {e}",
+                    None
+                ) from e
+        
+        log.info("orchestrator_start_complete", started_count=self._started_count, components=timings)
+    
+    async def _rollback(self) -> None:
+        """Rollback all started components in reverse order."""
+        snapshot = self.components[:self._started_count][::-1]
+        self._started_count = 0
+        log.warning("orchestrator_rollback_begin", components_to_rollback=len(snapshot))
+        timings = await self._stop_each(snapshot, "component_rollback_failed")
+        log.warning("orchestrator_rollback_complete", components=timings)
+    
+    async def stop(self) -> None:
+        """Gracefully stop all started components in reverse order."""
+        if not self._started_count:
+            log.debug("orchestrator_stop_no_components")
+            return
+        
+        snapshot = self.components[:self._started_count][::-1]
+        self._started_count = 0
+        log.info("orchestrator_stop_begin", component_count=len(snapshot))
+        timings = await self._stop_each(snapshot, "component_stop_failed")
+        log.info("orchestrator_stop_complete", components=timings)
+    
+    async def _stop_each(self, components: Sequence[Component], failure_event: str) -> list:
+        """Await each component's stop(), logging (not raising) failures."""
+        timings = []
+        for component in components:
+            t0 = time.perf_counter()
+            try:
+                await component.stop()
+                timings.append(_timing(component.name, t0))
+            except Exception as e:
+                log.error(failure_event, name=component.name, error=str(e))
+        return timings
+    
+    async def run_until_shutdown(self) -> None:
+        """Wait for a termination signal, then stop all components."""
+        await self._shutdown_event.wait()
+        await self.stop()
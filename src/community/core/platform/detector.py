@@ -22,13 +22,66 @@ INNOVATION:
 import os
 import platform
 import sys
-import subprocess
 import re
+import threading
 from dataclasses import dataclass
 from typing import Optional, Tuple
 from pathlib import Path
 
 from ..errors import PlatformDetectionError
+from ..logging import get_logger
+
+log = get_logger(__name__)
+
+# os-release fields (values may be quoted)
+_OS_ID_RE = re.compile(r'^ID="?([^"\n]+)"?', re.M)
+_OS_VER_RE = re.compile(r'^VERSION_ID="?([^"\n]+)"?', re.M)
+
+# lsb-release fields (the file lsb_release itself reads)
+_LSB_ID_RE = re.compile(r'^DISTRIB_ID="?([^"\n]+)"?', re.M)
+_LSB_VER_RE = re.compile(r'^DISTRIB_RELEASE="?([^"\n]+)"?', re.M)
+
+# Host identification, read once (fixed for the process lifetime).
+# platform.uname() rather than os.uname(): it also works on native Windows,
+# which must be detected to fail fast.
+_UNAME = platform.uname()
+_PLATFORM_STR = f"{_UNAME.system} ({_UNAME.release})"
+
+# Fail-fast error message template (rendered with str.format_map)
+_FAIL_FAST_TEMPLATE = """
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+❌ CRITICAL ERROR: Platform validation failed
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+COMPONENT:    {component}
+VERSION REQ:  {version_req}
+FOUND:        {found}
+PLATFORM:     {platform_str}
+REQUIRED FOR: System operation
+
+WHY THIS FAILS:
+  {reason}
+
+SOLUTION:
+  {solution}
+
+DOCUMENTATION:
+  {documentation}
+
+ALTERNATIVE:
+  None - {component} is a core requirement and cannot be substituted.
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+_DEFAULT_DOCUMENTATION = "https://docs.ax-traffic-analyzer.com/installation/platform"
+
+# Distribution release files, in order of preference, with their patterns
+_RELEASE_FILES = (
+    ("/etc/os-release", _OS_ID_RE, _OS_VER_RE),
+    ("/usr/lib/os-release", _OS_ID_RE, _OS_VER_RE),
+    ("/etc/lsb-release", _LSB_ID_RE, _LSB_VER_RE),
+)
 
 
 @dataclass
@@ -63,7 +116,14 @@ class PlatformDetector:
     MAX_PYTHON_VERSION = (3, 13, 0)  # Exclusive upper bound
     MIN_KERNEL_VERSION = (5, 4, 0)
     
-    def __init__(self):
+    def __init__(self, verbose: bool = False):
+        """
+        Initialize platform detector.
+        
+        Args:
+            verbose: Print detection progress to the terminal (CLI use)
+        """
+        self.verbose = verbose
         self._platform_info: Optional[PlatformInfo] = None
     
     def detect(self) -> PlatformInfo:
@@ -77,21 +137,35 @@ class PlatformDetector:
             PlatformDetectionError: If platform is unsupported or detection fails
         """
         if self._platform_info is None:
-            self._platform_info = self._detect_platform()
+            info = self._detect_platform()
+            log.debug("platform_detected",
+                     os=info.os,
+                     is_wsl2=info.is_wsl2,
+                     distribution=info.distribution,
+                     distribution_version=info.distribution_version,
+                     kernel=info.kernel_version,
+                     architecture=info.architecture,
+                     python_version=info.python_version)
+            self._platform_info = info
         return self._platform_info
     
+    def _echo(self, line: str) -> None:
+        """Print a detection progress line in verbose mode."""
+        if self.verbose:
+            print(line)
+    
     def _detect_platform(self) -> PlatformInfo:
         """Internal platform detection logic."""
-        print("🔍 Detecting platform...")
+        self._echo("🔍 Detecting platform...")
         
         # Detect OS
-        os_type = platform.system()
-        print(f"  ├─ OS type: {os_type}")
+        os_type = _UNAME.system
+        self._echo(f"  ├─ OS type: {os_type}")
         
         # Detect Python version
         python_version = sys.version_info
         python_version_str = f"{python_version.major}.{python_version.minor}.{python_version.micro}"
-        print(f"  ├─ Python version: {python_version_str}")
+        self._echo(f"  ├─ Python version: {python_version_str}")
         
         # Validate Python version
         if python_version < self.MIN_PYTHON_VERSION:
@@ -113,13 +187,13 @@ class PlatformDetector:
             )
         
         # Detect architecture
-        architecture = platform.machine()
-        print(f"  ├─ Architecture: {architecture}")
+        architecture = _UNAME.machine
+        self._echo(f"  ├─ Architecture: {architecture}")
         
         if os_type == "Windows":
             # Check if WSL2
             is_wsl2, wsl_distro = self._detect_wsl2()
-            print(f"  ├─ WSL2 detected: {is_wsl2}")
+            self._echo(f"  ├─ WSL2 detected: {is_wsl2}")
             
             if not is_wsl2:
                 # Native Windows - NOT SUPPORTED
@@ -134,8 +208,8 @@ class PlatformDetector:
             
             # WSL2 - continue with Linux path
             kernel_version, distribution, distro_version = self._detect_linux_info()
-            print(f"  ├─ Distribution: {distribution} {distro_version}")
-            print(f"  └─ Kernel: {kernel_version}")
+            self._echo(f"  ├─ Distribution: {distribution} {distro_version}")
+            self._echo(f"  └─ Kernel: {kernel_version}")
             return PlatformInfo(
                 os="Linux",
                 is_wsl2=True,
@@ -153,8 +227,8 @@ class PlatformDetector:
         elif os_type == "Linux":
             # Native Linux
             kernel_version, distribution, distro_version = self._detect_linux_info()
-            print(f"  ├─ Distribution: {distribution} {distro_version}")
-            print(f"  ├─ Kernel: {kernel_version}")
+            self._echo(f"  ├─ Distribution: {distribution} {distro_version}")
+            self._echo(f"  ├─ Kernel: {kernel_version}")
             
             # Validate kernel version
             kernel_tuple = self._parse_version(kernel_version)
@@ -167,7 +241,7 @@ class PlatformDetector:
                     solution=f"Upgrade kernel to {self.MIN_KERNEL_VERSION[0]}.{self.MIN_KERNEL_VERSION[1]}+"
                 )
             
-            print(f"  └─ Platform detection complete ✓")
+            self._echo(f"  └─ Platform detection complete ✓")
             return PlatformInfo(
                 os="Linux",
                 is_wsl2=False,
@@ -194,63 +268,66 @@ class PlatformDetector:
     
     def _detect_wsl2(self) -> Tuple[bool, Optional[str]]:
         """Detect if running in WSL2."""
+        # WSL sets these in every session; no filesystem access needed
+        environ = os.environ
+        if "WSL_DISTRO_NAME" in environ or "WSL_INTEROP" in environ:
+            return True, environ.get("WSL_DISTRO_NAME")
+        
+        # Without the WSL interop handler this is not WSL; skip reading /proc
+        if not os.path.exists("/proc/sys/fs/binfmt_misc/WSLInterop"):
+            return False, None
+        
         # Check /proc/version for WSL indicators
         try:
             with open("/proc/version", "r") as f:
                 proc_version = f.read().lower()
                 if "microsoft" in proc_version or "wsl" in proc_version:
                     # Get WSL distribution name
-                    wsl_distro = os.environ.get("WSL_DISTRO_NAME") or os.environ.get("WSLENV")
+                    wsl_distro = environ.get("WSL_DISTRO_NAME") or environ.get("WSLENV")
                     return True, wsl_distro
         except FileNotFoundError:
             pass
         
-        # Check for Windows filesystem mount
-        if Path("/mnt/c/Windows").exists():
-            wsl_distro = os.environ.get("WSL_DISTRO_NAME")
-            return True, wsl_distro
-        
         return False, None
     
     def _detect_linux_info(self) -> Tuple[str, str, str]:
         """Detect Linux kernel version and distribution."""
         # Get kernel version
-        kernel_version = platform.release()
+        kernel_version = _UNAME.release
         
-        # Get distribution info from /etc/os-release
+        # Get distribution info from the first release file present
         distribution = "Unknown"
         distro_version = "Unknown"
         
-        try:
-            with open("/etc/os-release", "r") as f:
-                for line in f:
-                    line = line.strip()
-                    if line.startswith("ID="):
-                        distribution = line.split("=", 1)[1].strip('"')
-                    elif line.startswith("VERSION_ID="):
-                        distro_version = line.split("=", 1)[1].strip('"')
-        except FileNotFoundError:
-            # Try alternative methods
+        for path, id_re, ver_re in _RELEASE_FILES:
             try:
-                result = subprocess.run(
-                    ["lsb_release", "-is"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                if result.returncode == 0:
-                    distribution = result.stdout.strip()
-            except (FileNotFoundError, subprocess.TimeoutExpired):
-                pass
+                text = Path(path).read_text()
+            except OSError:
+                continue
+            match = id_re.search(text)
+            if match:
+                distribution = match.group(1).strip()
+            match = ver_re.search(text)
+            if match:
+                distro_version = match.group(1).strip()
+            break
+        else:
+            log.warning("distribution_release_file_not_found",
+                       searched=[path for path, _, _ in _RELEASE_FILES])
         
         return kernel_version, distribution, distro_version
     
     def _parse_version(self, version_str: str) -> Tuple[int, int, int]:
         """Parse version string to tuple."""
-        # Extract version numbers (e.g., "5.15.0-157-generic" -> (5, 15, 0))
-        match = re.match(r"(\d+)\.(\d+)\.(\d+)", version_str)
-        if match:
-            return (int(match.group(1)), int(match.group(2)), int(match.group(3)))
+        # Extract version numbers (e.g., "5.15.0-157-generic" -> (5, 15, 0),
+        # "6.1.0+rpt-rpi-v8" -> (6, 1, 0)); the patch number is its leading digits
+        major, _, rest = version_str.partition(".")
+        minor, _, rest = rest.partition(".")
+        end = 0
+        while end < len(rest) and rest[end].isdecimal():
+            end += 1
+        if major.isdecimal() and minor.isdecimal() and end:
+            return (int(major), int(minor), int(rest[:end]))
         return (0, 0, 0)
     
     def _fail_fast(
@@ -267,45 +344,33 @@ class PlatformDetector:
         
         Format matches DESIGN_PLAN.md specification.
         """
-        platform_str = f"{platform.system()} ({platform.release()})"
+        platform_str = _PLATFORM_STR
         if self._platform_info and self._platform_info.distribution:
-            platform_str = f"{platform.system()} ({self._platform_info.distribution} {self._platform_info.distribution_version})"
+            platform_str = f"{_UNAME.system} ({self._platform_info.distribution} {self._platform_info.distribution_version})"
         
-        error_msg = f"""
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-❌ CRITICAL ERROR: Platform validation failed
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-COMPONENT:    {component}
-VERSION REQ:  {version_req}
-FOUND:        {found}
-PLATFORM:     {platform_str}
-REQUIRED FOR: System operation
-
-WHY THIS FAILS:
-  {reason}
-
-SOLUTION:
-  {solution}
-
-DOCUMENTATION:
-  {documentation or "https://docs.ax-traffic-analyzer.com/installation/platform"}
-
-ALTERNATIVE:
-  None - {component} is a core requirement and cannot be substituted.
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-"""
+        error_msg = _FAIL_FAST_TEMPLATE.format_map({
+            "component": component,
+            "version_req": version_req,
+            "found": found,
+            "platform_str": platform_str,
+            "reason": reason,
+            "solution": solution,
+            "documentation": documentation or _DEFAULT_DOCUMENTATION,
+        })
         raise PlatformDetectionError(error_msg)
 
 
-# Singleton instance
-_detector_instance: Optional[PlatformDetector] = None
+# Process-wide detection result (detected once, on first request)
+_PLATFORM_INFO: Optional[PlatformInfo] = None
+_DETECT_LOCK = threading.Lock()
 
 
-def get_platform_info() -> PlatformInfo:
+def get_platform_info(verbose: bool = False) -> PlatformInfo:
     """
-    Get platform information (singleton pattern).
+    Get platform information (detected once per process).
+    
+    Args:
+        verbose: Print detection progress if this call performs detection
     
     Returns:
         PlatformInfo: Platform information
@@ -313,8 +378,11 @@ def get_platform_info() -> PlatformInfo:
     Raises:
         PlatformDetectionError: If platform is unsupported
     """
-    global _detector_instance
-    if _detector_instance is None:
-        _detector_instance = PlatformDetector()
-    return _detector_instance.detect()
+    global _PLATFORM_INFO
+    if _PLATFORM_INFO is not None:
+        return _PLATFORM_INFO
+    with _DETECT_LOCK:
+        if _PLATFORM_INFO is None:
+            _PLATFORM_INFO = PlatformDetector(verbose=verbose).detect()
+    return _PLATFORM_INFO
 
@@ -20,6 +20,10 @@ from .keyring_manager import KeyringManager
 
 log = get_logger(__name__)
 
+# Fixed lines of the private key placeholder file (key ID goes in between)
+_KEY_HEADER = b"# Private key stored in system keyring\n"
+_KEY_FOOTER = b"# Use KeyringManager.retrieve_key() to access\n"
+
 
 class CertificateSecurityManager:
     """
@@ -50,9 +54,16 @@ class CertificateSecurityManager:
     def _ensure_cert_directory(self) -> None:
         """Ensure certificate directory exists with correct permissions."""
         try:
-            if not self.cert_dir.exists():
-                self.cert_dir.mkdir(parents=True, mode=0o700)
+            try:
+                st = os.stat(self.cert_dir)
+            except FileNotFoundError:
+                os.makedirs(self.cert_dir, mode=0o700)
                 log.info("cert_directory_created", path=str(self.cert_dir))
+                st = os.stat(self.cert_dir)  # umask may have narrowed the mode
+            
+            # Set permissions (0700) only if they differ
+            if (st.st_mode & 0o777) != 0o700:
+                os.chmod(self.cert_dir, 0o700)
             
             # Verify writable
             if not os.access(self.cert_dir, os.W_OK):
@@ -61,8 +72,6 @@ class CertificateSecurityManager:
                     None
                 )
             
-            # Set permissions (0700)
-            os.chmod(self.cert_dir, 0o700)
             log.debug("cert_directory_validated", path=str(self.cert_dir))
         except Exception as e:
             raise ConfigurationError(
@@ -93,14 +102,8 @@ class CertificateSecurityManager:
             
             # Create placeholder file with 0600 permissions
             key_file = self.cert_dir / f"{key_id}.key"
-            with open(key_file, 'wb') as f:
-                # Write placeholder (actual key is in keyring)
-                f.write(b"# Private key stored in system keyring\n")
-                f.write(f"# Key ID: {key_id}\n".encode())
-                f.write(b"# Use KeyringManager.retrieve_key() to access\n")
-            
-            # Set 0600 permissions
-            os.chmod(key_file, 0o600)
+            # Write placeholder (actual key is in keyring)
+            self._write_file(key_file, b"".join((_KEY_HEADER, f"# Key ID: {key_id}\n".encode(), _KEY_FOOTER)), 0o600)
             log.info("private_key_stored", key_id=key_id, file=str(key_file))
             return str(key_file)
         except Exception as e:
@@ -148,11 +151,8 @@ class CertificateSecurityManager:
         """
         try:
             cert_file = self.cert_dir / f"{cert_id}.pem"
-            with open(cert_file, 'wb') as f:
-                f.write(cert_pem)
-            
-            # Set 0644 permissions (certificate is public)
-            os.chmod(cert_file, 0o644)
+            # 0644 permissions (certificate is public)
+            self._write_file(cert_file, cert_pem, 0o644)
             log.info("certificate_stored", cert_id=cert_id, file=str(cert_file))
             return str(cert_file)
         except Exception as e:
@@ -161,6 +161,21 @@ class CertificateSecurityManager:
                 None
             )
     
+    @staticmethod
+    def _write_file(path: Path, data: bytes, mode: int) -> None:
+        """
+        Write a file that has the given permissions from the moment it exists.
+        
+        New files are created with the mode directly (no window with default
+        permissions); the mode is only re-applied if the file already existed
+        with different permissions or the umask narrowed it.
+        """
+        fd = os.open(path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, mode)
+        with os.fdopen(fd, 'wb') as f:
+            if (os.fstat(fd).st_mode & 0o777) != mode:
+                os.fchmod(fd, mode)
+            f.write(data)
+    
     def get_cert_path(self, cert_id: str) -> Path:
         """Get path to certificate file."""
         return self.cert_dir / f"{cert_id}.pem"
@@ -10,10 +10,15 @@ JWT token management with secure secret storage in keyring.
 This file is part of AX-TrafficAnalyzer Community Edition.
 """
 
+import base64
+import binascii
+import hashlib
+import hmac
+import json
 import secrets
-from datetime import datetime, timedelta
-from typing import Optional, Dict
-from jose import jwt, JWTError  # python-jose package imports as 'jose'
+import time
+from datetime import timedelta
+from typing import Optional, Dict, Union
 from .keyring_manager import KeyringManager
 from ..errors import SecurityError
 from ..logging import get_logger
@@ -25,6 +30,35 @@ JWT_SECRET_KEY = "jwt-secret"
 JWT_ALGORITHM = "HS256"
 
 
+def _b64url_encode(data: bytes) -> bytes:
+    """Unpadded base64url encoding (RFC 7515 section 2)."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64url_decode(data: bytes) -> bytes:
+    """Decode unpadded base64url, restoring the stripped padding."""
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+
+# Compact JSON, same separators python-jose uses, so tokens stay byte-compatible
+_dumps = json.JSONEncoder(separators=(",", ":")).encode
+
+# Claims (de)serialization: orjson when installed, compact stdlib JSON otherwise.
+# Both return/accept UTF-8 bytes so the codec below doesn't care which is used.
+try:
+    import orjson
+    _dump_claims = orjson.dumps
+    _load_claims = orjson.loads
+except ImportError:
+    def _dump_claims(claims: Dict) -> bytes:
+        return _dumps(claims).encode("utf-8")
+    _load_claims = json.loads
+
+
+class _InvalidTokenError(Exception):
+    """Token failed structural, signature or expiry checks."""
+
+
 class JWTManager:
     """
     JWT token manager with secure secret storage.
@@ -44,8 +78,66 @@ class JWTManager:
         self.keyring_manager = keyring_manager
         self.token_expiry_hours = token_expiry_hours
         self.secret_key = self._get_or_create_secret()
+        # Key material and the JWS header never change for the lifetime of the
+        # manager, so derive them once instead of per token
+        self._secret_bytes = self._to_bytes(self.secret_key)
+        self._header_b64 = _b64url_encode(
+            _dumps({"alg": JWT_ALGORITHM, "typ": "JWT"}).encode("ascii")
+        )
         log.debug("jwt_manager_initialized", expiry_hours=token_expiry_hours)
     
+    @staticmethod
+    def _to_bytes(secret: Union[str, bytes]) -> bytes:
+        """Keyring returns bytes, env/generated secrets are str."""
+        return secret if isinstance(secret, bytes) else secret.encode("utf-8")
+    
+    def _sign(self, signing_input: bytes) -> bytes:
+        """HMAC-SHA256 over the JWS signing input."""
+        return hmac.new(self._secret_bytes, signing_input, hashlib.sha256).digest()
+    
+    def _encode(self, payload: Dict) -> str:
+        """Encode payload as a compact HS256 JWS."""
+        signing_input = self._header_b64 + b"." + _b64url_encode(_dump_claims(payload))
+        return (signing_input + b"." + _b64url_encode(self._sign(signing_input))).decode("ascii")
+    
+    def _decode(self, token: str) -> Dict:
+        """
+        Verify a compact HS256 JWS and return its claims.
+        
+        Raises:
+            _InvalidTokenError: If token is malformed, signed with another algorithm,
+                has a bad signature, or is expired
+        """
+        try:
+            raw = token.encode("ascii") if isinstance(token, str) else token
+            signing_input, signature_b64 = raw.rsplit(b".", 1)
+            header_b64, payload_b64 = signing_input.split(b".", 1)
+            signature = _b64url_decode(signature_b64)
+            if header_b64 != self._header_b64:
+                header = json.loads(_b64url_decode(header_b64))
+                if not isinstance(header, dict) or header.get("alg") != JWT_ALGORITHM:
+                    raise _InvalidTokenError("The specified alg value is not allowed")
+        except (ValueError, binascii.Error) as e:
+            raise _InvalidTokenError(f"Malformed token: {e}") from None
+        
+        if not hmac.compare_digest(signature, self._sign(signing_input)):
+            raise _InvalidTokenError("Signature verification failed.")
+        
+        try:
+            payload = _load_claims(_b64url_decode(payload_b64))
+        except (ValueError, binascii.Error) as e:
+            raise _InvalidTokenError(f"Invalid payload string: {e}") from None
+        if not isinstance(payload, dict):
+            raise _InvalidTokenError("Invalid payload string: must be a json object")
+        
+        exp = payload.get("exp")
+        if exp is not None:
+            if not isinstance(exp, (int, float)) or isinstance(exp, bool):
+                raise _InvalidTokenError("Expiration Time claim (exp) must be an integer.")
+            if exp <= time.time():
+                raise _InvalidTokenError("Signature has expired.")
+        return payload
+    
     def _get_or_create_secret(self) -> str:
         """
         Get JWT secret from keyring or create new one.
@@ -108,17 +200,18 @@ class JWTManager:
         if expires_delta is None:
             expires_delta = timedelta(hours=self.token_expiry_hours)
         
-        expire = datetime.utcnow() + expires_delta
+        now = int(time.time())
+        expire = now + int(expires_delta.total_seconds())
         
         payload = {
             "sub": user_id,  # Subject (user ID)
             "role": role,
-            "exp": expire,  # Expiration time
-            "iat": datetime.utcnow(),  # Issued at
+            "exp": expire,  # Expiration time (NumericDate)
+            "iat": now,  # Issued at (NumericDate)
         }
         
-        token = jwt.encode(payload, self.secret_key, algorithm=JWT_ALGORITHM)
-        log.debug("jwt_token_created", user_id=user_id, role=role, expires_at=expire.isoformat())
+        token = self._encode(payload)
+        log.debug("jwt_token_created", user_id=user_id, role=role, expires_at=expire)
         return token
     
     def verify_token(self, token: str) -> Dict:
@@ -135,14 +228,10 @@ class JWTManager:
             SecurityError: If token invalid, expired, or verification fails
         """
         try:
-            payload = jwt.decode(
-                token,
-                self.secret_key,
-                algorithms=[JWT_ALGORITHM]
-            )
+            payload = self._decode(token)
             log.debug("jwt_token_verified", user_id=payload.get("sub"), role=payload.get("role"))
             return payload
-        except JWTError as e:
+        except _InvalidTokenError as e:
             log.warning("jwt_token_verification_failed", error=str(e))
             raise SecurityError(
                 f"Invalid or expired token: {e}",
@@ -12,9 +12,13 @@ This file is part of AX-TrafficAnalyzer Community Edition.
 """
 
 import keyring
-import subprocess
-from typing import Optional
+import os
+import threading
+import time
+from base64 import b64encode as _b64e, b64decode as _b64d
+from typing import Dict, Optional, Tuple
 from pathlib import Path
+from shutil import which
 
 from ..errors import SecurityError
 from ..logging import get_logger
@@ -25,6 +29,16 @@ log = get_logger(__name__)
 # Keyring service name
 KEYRING_SERVICE = "ax-traffic-analyzer"
 
+# Set to "1" to skip the keyring write/read self-test (CI, headless tests)
+SKIP_KEYRING_TEST_ENV = "AX_SKIP_KEYRING_TEST"
+
+# How long a retrieved key is served from memory before hitting the backend again
+KEY_CACHE_TTL_SECONDS = 300.0
+
+# Backends whose write/read self-test already passed in this process; every
+# probe is three DBus/DPAPI round-trips, so later managers skip it
+_VALIDATED_BACKENDS: set[str] = set()
+
 
 class KeyringManager:
     """
@@ -45,6 +59,13 @@ class KeyringManager:
             SecurityError: If keyring unavailable or validation fails
         """
         self.platform_info = platform_info
+        # key_id -> (monotonic fetch time, key bytes); backend calls are IPC/DBus
+        # round-trips, so repeated lookups of the same key are served from here
+        self._cache: Dict[str, Tuple[float, bytes]] = {}
+        self._cache_ttl = KEY_CACHE_TTL_SECONDS
+        # Held across backend calls so a stale read cannot repopulate the
+        # cache after a concurrent store/delete
+        self._cache_lock = threading.Lock()
         self._validate_keyring_available()
         log.debug("keyring_manager_initialized", platform=platform_info.os, is_wsl2=platform_info.is_wsl2)
     
@@ -55,19 +76,20 @@ class KeyringManager:
             backend = keyring.get_keyring()
             backend_name = backend.name
             log.debug("keyring_backend_detected", backend=backend_name)
+            if backend_name in _VALIDATED_BACKENDS:
+                return
             
             # Platform-specific validation
             if self.platform_info.is_native_linux:
                 # Linux: Check for libsecret-tool (optional, but preferred)
-                result = subprocess.run(
-                    ["which", "libsecret-tool"],
-                    capture_output=True,
-                    timeout=5
-                )
-                if result.returncode != 0:
+                if which("libsecret-tool") is None:
                     log.warning("libsecret_tool_not_found", 
                                note="Keyring will use default backend")
             
+            if os.environ.get(SKIP_KEYRING_TEST_ENV) == "1":
+                log.warning("keyring_test_skipped", env=SKIP_KEYRING_TEST_ENV)
+                return
+            
             # Test write/read
             test_key = "ax-traffic-test-key"
             test_value = "test-value"
@@ -81,6 +103,7 @@ class KeyringManager:
                     )
                 keyring.delete_password(KEYRING_SERVICE, test_key)
                 log.debug("keyring_test_passed")
+                _VALIDATED_BACKENDS.add(backend_name)
             except Exception as e:
                 raise SecurityError(
                     f"Keyring test failed: {e}. "
@@ -114,10 +137,12 @@ class KeyringManager:
         """
         try:
             # Convert bytes to base64 string for keyring storage
-            import base64
-            key_str = base64.b64encode(key_data).decode('utf-8')
+            key_str = _b64e(key_data).decode('ascii')
             
-            keyring.set_password(KEYRING_SERVICE, key_id, key_str)
+            with self._cache_lock:
+                self._cache.pop(key_id, None)
+                keyring.set_password(KEYRING_SERVICE, key_id, key_str)
+                self._cache[key_id] = (time.monotonic(), bytes(key_data))
             log.info("key_stored", key_id=key_id, service=KEYRING_SERVICE)
         except Exception as e:
             raise SecurityError(
@@ -138,26 +163,32 @@ class KeyringManager:
         Raises:
             SecurityError: If key not found or retrieval fails
         """
-        try:
-            key_str = keyring.get_password(KEYRING_SERVICE, key_id)
-            if key_str is None:
+        with self._cache_lock:
+            entry = self._cache.get(key_id)
+            if entry is not None and time.monotonic() - entry[0] < self._cache_ttl:
+                return entry[1]
+            
+            try:
+                key_str = keyring.get_password(KEYRING_SERVICE, key_id)
+                if key_str is None:
+                    self._cache.pop(key_id, None)
+                    raise SecurityError(
+                        f"Key '{key_id}' not found in keyring",
+                        None
+                    )
+                
+                # Convert from base64 string back to bytes (b64decode accepts str)
+                key_data = _b64d(key_str)
+                self._cache[key_id] = (time.monotonic(), key_data)
+                log.debug("key_retrieved", key_id=key_id)
+                return key_data
+            except SecurityError:
+                raise
+            except Exception as e:
                 raise SecurityError(
-                    f"Key '{key_id}' not found in keyring",
+                    f"Failed to retrieve key '{key_id}' from keyring: {e}",
                     None
                 )
-            
-            # Convert from base64 string back to bytes
-            import base64
-            key_data = base64.b64decode(key_str.encode('utf-8'))
-            log.debug("key_retrieved", key_id=key_id)
-            return key_data
-        except SecurityError:
-            raise
-        except Exception as e:
-            raise SecurityError(
-                f"Failed to retrieve key '{key_id}' from keyring: {e}",
-                None
-            )
     
     def delete_key(self, key_id: str) -> None:
         """
@@ -166,11 +197,13 @@ class KeyringManager:
         Args:
             key_id: Unique identifier for the key
         """
-        try:
-            keyring.delete_password(KEYRING_SERVICE, key_id)
-            log.info("key_deleted", key_id=key_id)
-        except keyring.errors.PasswordDeleteError:
-            log.warning("key_delete_not_found", key_id=key_id)
-        except Exception as e:
-            log.error("key_delete_failed", key_id=key_id, error=str(e))
+        with self._cache_lock:
+            self._cache.pop(key_id, None)
+            try:
+                keyring.delete_password(KEYRING_SERVICE, key_id)
+                log.info("key_deleted", key_id=key_id)
+            except keyring.errors.PasswordDeleteError:
+                log.warning("key_delete_not_found", key_id=key_id)
+            except Exception as e:
+                log.error("key_delete_failed", key_id=key_id, error=str(e))
 
@@ -11,12 +11,17 @@ This file is part of AX-TrafficAnalyzer Community Edition.
 """
 
 from pathlib import Path
-from typing import Optional
-from sqlalchemy import select, create_engine
+from typing import Optional, Tuple
+from sqlalchemy import select, create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import StaticPool
 from ..core.logging import get_logger
 
 log = get_logger(__name__)
 
+# Existence probe: stops at the first row instead of counting the table
+_USER_EXISTS_SQL = text("SELECT 1 FROM users LIMIT 1")
+
 
 class FirstRunDetector:
     """
@@ -35,6 +40,9 @@ class FirstRunDetector:
         """
         self.db_path = Path(db_path)
         self.flag_file = Path(flag_file)
+        self._engine: Optional[Engine] = None
+        # (db mtime_ns or -1, flag exists, result) from the last check
+        self._cached: Optional[Tuple[int, bool, bool]] = None
         log.debug("first_run_detector_initialized", db_path=str(db_path), flag_file=str(flag_file))
     
     def is_first_run(self) -> bool:
@@ -44,9 +52,24 @@ class FirstRunDetector:
         Returns:
             True if first run (no DB, no flag, or empty users table)
         """
-        db_exists = self.db_path.exists()
+        # Any write to the DB bumps its mtime, so (mtime, flag) identifies
+        # a state we already answered for without reopening the DB
+        try:
+            db_mtime = self.db_path.stat().st_mtime_ns
+        except OSError:
+            db_mtime = -1
         flag_exists = self.flag_file.exists()
         
+        cached = self._cached
+        if cached is not None and cached[0] == db_mtime and cached[1] == flag_exists:
+            return cached[2]
+        
+        result = self._check_first_run(db_mtime != -1, flag_exists)
+        self._cached = (db_mtime, flag_exists, result)
+        return result
+    
+    def _check_first_run(self, db_exists: bool, flag_exists: bool) -> bool:
+        """Uncached first-run check (see is_first_run)."""
         # If neither exists, definitely first run
         if not db_exists and not flag_exists:
             log.info("first_run_detected", reason="no_db_no_flag")
@@ -55,19 +78,23 @@ class FirstRunDetector:
         # If DB exists, check if users table is empty
         if db_exists:
             try:
-                engine = create_engine(f"sqlite:///{self.db_path}")
-                with engine.connect() as conn:
+                # One engine (and one pooled connection) per detector, so
+                # repeated polling doesn't rebuild pool and dialect each time
+                if self._engine is None:
+                    self._engine = create_engine(
+                        f"sqlite:///{self.db_path}",
+                        poolclass=StaticPool,
+                        connect_args={"check_same_thread": False},
+                    )
+                with self._engine.connect() as conn:
                     # Check if users table exists and has records
-                    from sqlalchemy import text
-                    result = conn.execute(text("SELECT COUNT(*) FROM users"))
-                    user_count = result.scalar()
+                    row = conn.execute(_USER_EXISTS_SQL).first()
                     
-                    if user_count == 0:
+                    if row is None:
                         log.info("first_run_detected", reason="no_users_in_db")
                         return True
-                    else:
-                        log.debug("first_run_check", users_found=user_count, is_first_run=False)
-                        return False
+                    log.debug("first_run_check", users_found=True, is_first_run=False)
+                    return False
             except Exception as e:
                 # If table doesn't exist or error, treat as first run
                 log.debug("first_run_check_error", error=str(e), treating_as_first_run=True)
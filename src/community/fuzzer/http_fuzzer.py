@@ -11,9 +11,12 @@ This file is part of AX-TrafficAnalyzer Community Edition.
 """
 
 import asyncio
-from typing import Dict, Any, List, Optional
+from array import array
+from itertools import chain, compress
+from typing import Dict, Any, Iterator, List, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
+from time import perf_counter
 from uuid import uuid4
 from enum import Enum
 from .mutation import MutationEngine, Mutation, MutationType
@@ -22,6 +25,9 @@ from ..core.logging import get_logger
 
 log = get_logger(__name__)
 
+# Auth/forbidden responses to a mutation might indicate a bypass attempt
+_AUTH_STATUSES = frozenset((401, 403))
+
 
 class FuzzingStrategy(str, Enum):
     """Fuzzing strategies."""
@@ -31,7 +37,17 @@ class FuzzingStrategy(str, Enum):
     ALL = "all"
 
 
-@dataclass
+# Which mutation sources each strategy draws from
+_FUZZ_HEADERS, _FUZZ_PARAMS, _FUZZ_BODY = 0b001, 0b010, 0b100
+_STRATEGY_FLAGS = {
+    FuzzingStrategy.HEADERS: _FUZZ_HEADERS,
+    FuzzingStrategy.PARAMS: _FUZZ_PARAMS,
+    FuzzingStrategy.BODY: _FUZZ_BODY,
+    FuzzingStrategy.ALL: _FUZZ_HEADERS | _FUZZ_PARAMS | _FUZZ_BODY,
+}
+
+
+@dataclass(slots=True)
 class FuzzingResult:
     """Result of a single fuzzing attempt."""
     mutation: Mutation
@@ -42,6 +58,11 @@ class FuzzingResult:
     duration_ms: float
     anomaly_score: float = 0.0
     notes: List[str] = field(default_factory=list)
+    # Truncated once here; to_dict is called on every results poll
+    mutated_value_preview: str = field(init=False, repr=False)
+    
+    def __post_init__(self) -> None:
+        self.mutated_value_preview = self.mutation.mutated_value[:100]
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -50,7 +71,7 @@ class FuzzingResult:
             "location": self.mutation.location,
             "field_name": self.mutation.field_name,
             "original_value": self.mutation.original_value,
-            "mutated_value": self.mutation.mutated_value[:100],  # Truncate
+            "mutated_value": self.mutated_value_preview,
             "original_status": self.original_status,
             "fuzzed_status": self.fuzzed_status,
             "response_diff": self.response_diff,
@@ -61,9 +82,14 @@ class FuzzingResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class FuzzingSession:
-    """Fuzzing session tracking."""
+    """
+    Fuzzing session tracking.
+    
+    anomaly_scores mirrors results (same order) as a packed float64 column so
+    score filtering scans one contiguous buffer instead of every result object.
+    """
     session_id: str
     flow_id: str
     strategy: FuzzingStrategy
@@ -74,6 +100,16 @@ class FuzzingSession:
     results: List[FuzzingResult] = field(default_factory=list)
     started_at: datetime = field(default_factory=datetime.utcnow)
     completed_at: Optional[datetime] = None
+    anomaly_scores: array = field(default_factory=lambda: array("d"), repr=False)
+    
+    def record(self, result: FuzzingResult) -> None:
+        """Append a completed mutation result and update counters."""
+        self.results.append(result)
+        self.anomaly_scores.append(result.anomaly_score)
+        self.completed_mutations += 1
+        
+        if result.anomaly_score > 0.5:
+            self.anomalies_found += 1
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -126,6 +162,8 @@ class HTTPFuzzer:
         self.max_concurrent = max_concurrent
         self.delay_ms = delay_ms
         self._semaphore = asyncio.Semaphore(max_concurrent)
+        # Loop time at which the next request may start (shared rate limit)
+        self._next_send_at = 0.0
         
         # Active sessions
         self.sessions: Dict[str, FuzzingSession] = {}
@@ -169,11 +207,13 @@ class HTTPFuzzer:
         )
         
         try:
-            # Generate mutations
+            # Mutations are generated lazily and pulled by the workers, so
+            # only about max_concurrent of them are alive at any time;
+            # total_mutations grows as they are produced
             mutations = self._generate_mutations(flow_data, strategy)
-            session.total_mutations = len(mutations)
+            first = next(mutations, None)
             
-            if not mutations:
+            if first is None:
                 session.status = "completed"
                 session.completed_at = datetime.utcnow()
                 return session
@@ -182,25 +222,25 @@ class HTTPFuzzer:
             baseline = await self.replayer.replay_flow(flow_id)
             baseline_status = baseline.status_code or 0
             
-            # Execute mutations
-            for mutation_data in mutations:
-                if session.status == "stopped":
-                    break
-                
-                result = await self._execute_mutation(
-                    flow_data,
-                    mutation_data,
-                    baseline_status
+            # Execute mutations concurrently: max_concurrent workers share the
+            # generator, the semaphore caps in-flight requests and
+            # _wait_for_send_slot keeps starts delay_ms apart
+            # A failing worker cancels the rest: the session is failed anyway,
+            # so there is no point in sending the remaining mutations
+            mutations = chain((first,), mutations)
+            workers = [
+                asyncio.ensure_future(
+                    self._mutation_worker(session, flow_data, mutations, baseline_status)
                 )
-                
-                session.results.append(result)
-                session.completed_mutations += 1
-                
-                if result.anomaly_score > 0.5:
-                    session.anomalies_found += 1
-                
-                # Rate limiting
-                await asyncio.sleep(self.delay_ms / 1000)
+                for _ in range(self.max_concurrent)
+            ]
+            try:
+                # gather raises the first failure but leaves the siblings running
+                await asyncio.gather(*workers)
+            finally:
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
             
             session.status = "completed"
             session.completed_at = datetime.utcnow()
@@ -219,13 +259,52 @@ class HTTPFuzzer:
         
         return session
     
+    async def _mutation_worker(
+        self,
+        session: FuzzingSession,
+        flow_data: Dict[str, Any],
+        mutations: Iterator[Dict[str, Any]],
+        baseline_status: int
+    ) -> None:
+        """
+        Pull mutations from the shared iterator until it is exhausted.
+        
+        next() never awaits, so workers on one event loop can share a plain
+        generator; each result is recorded on the session as it completes.
+        """
+        for mutation_data in mutations:
+            if session.status == "stopped":
+                return
+            session.total_mutations += 1
+            
+            result = await self._execute_mutation(
+                flow_data,
+                mutation_data,
+                baseline_status,
+                session
+            )
+            if result is not None:
+                session.record(result)
+    
+    async def _wait_for_send_slot(self) -> None:
+        """Space request starts delay_ms apart across all in-flight mutations."""
+        if self.delay_ms <= 0:
+            return
+        
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_send_at)
+        self._next_send_at = slot + self.delay_ms / 1000
+        if slot > now:
+            await asyncio.sleep(slot - now)
+    
     def _generate_mutations(
         self,
         flow_data: Dict[str, Any],
         strategy: FuzzingStrategy
-    ) -> List[Dict[str, Any]]:
-        """Generate mutations based on strategy."""
-        mutations = []
+    ) -> Iterator[Dict[str, Any]]:
+        """Lazily generate mutations based on strategy."""
+        flags = _STRATEGY_FLAGS[strategy]
+        sources = []
         
         headers = flow_data.get("request_headers", {}) or {}
         url = flow_data.get("url", "")
@@ -235,51 +314,50 @@ class HTTPFuzzer:
         if isinstance(body, str):
             body = body.encode("utf-8")
         
-        if strategy in [FuzzingStrategy.HEADERS, FuzzingStrategy.ALL]:
-            mutations.extend(self.mutation_engine.mutate_headers(headers))
+        if flags & _FUZZ_HEADERS:
+            sources.append(self.mutation_engine.iter_header_mutations(headers))
         
-        if strategy in [FuzzingStrategy.PARAMS, FuzzingStrategy.ALL]:
-            mutations.extend(self.mutation_engine.mutate_params(url))
+        if flags & _FUZZ_PARAMS:
+            sources.append(self.mutation_engine.iter_param_mutations(url))
         
-        if strategy in [FuzzingStrategy.BODY, FuzzingStrategy.ALL]:
-            if body:
-                mutations.extend(
-                    self.mutation_engine.mutate_body(body, content_type)
-                )
+        if flags & _FUZZ_BODY and body:
+            sources.append(
+                self.mutation_engine.iter_body_mutations(body, content_type)
+            )
         
-        return mutations
+        return chain.from_iterable(sources)
     
     async def _execute_mutation(
         self,
         flow_data: Dict[str, Any],
         mutation_data: Dict[str, Any],
-        baseline_status: int
-    ) -> FuzzingResult:
-        """Execute a single mutation and analyze result."""
-        mutation = mutation_data["mutation"]
-        
-        # Build modifications
-        modifications = {}
-        
-        if "headers" in mutation_data:
-            modifications["headers"] = mutation_data["headers"]
+        baseline_status: int,
+        session: Optional[FuzzingSession] = None
+    ) -> Optional[FuzzingResult]:
+        """
+        Execute a single mutation and analyze result.
         
-        if "url" in mutation_data:
-            modifications["url"] = mutation_data["url"]
+        Returns None if the session was stopped before the request was sent.
+        """
+        mutation = mutation_data["mutation"]
         
-        if "body" in mutation_data:
-            modifications["body"] = mutation_data["body"]
+        # Built once by MutationEngine when the mutation was generated
+        modifications = mutation_data["modifications"]
         
         # Execute replay with modifications
         async with self._semaphore:
-            start_time = datetime.utcnow()
+            await self._wait_for_send_slot()
+            if session is not None and session.status == "stopped":
+                return None
+            
+            start = perf_counter()
             
             result = await self.replayer.replay_flow(
                 flow_data.get("flow_id", ""),
                 modifications
             )
             
-            duration_ms = (datetime.utcnow() - start_time).total_seconds() * 1000
+            duration_ms = (perf_counter() - start) * 1000.0
         
         # Analyze result
         fuzzed_status = result.status_code or 0
@@ -325,10 +403,16 @@ class HTTPFuzzer:
         
         Score from 0.0 (normal) to 1.0 (highly anomalous).
         """
+        status_changed = fuzzed_status != baseline_status
+        
+        # Common case: same status, no error, normal timing
+        if not (status_changed or error_detected or duration_ms > 5000):
+            return 0.0
+        
         score = 0.0
         
         # Status code change
-        if fuzzed_status != baseline_status:
+        if status_changed:
             score += 0.3
             
             # Server error is more significant
@@ -336,7 +420,7 @@ class HTTPFuzzer:
                 score += 0.3
             
             # Auth/forbidden might indicate bypass attempt
-            if fuzzed_status in [401, 403]:
+            if fuzzed_status in _AUTH_STATUSES:
                 score += 0.1
         
         # Error detection
@@ -391,8 +475,11 @@ class HTTPFuzzer:
         if not session:
             return []
         
-        return [
-            r.to_dict() for r in session.results
-            if r.anomaly_score >= min_anomaly_score
-        ]
+        results = session.results
+        if min_anomaly_score <= 0.0:
+            return [r.to_dict() for r in results]
+        
+        # Filter on the packed score column; compress/map keep the scan in C
+        keep = map(float(min_anomaly_score).__le__, session.anomaly_scores)
+        return [r.to_dict() for r in compress(results, keep)]
 
@@ -12,7 +12,9 @@ This file is part of AX-TrafficAnalyzer Community Edition.
 
 import json
 import urllib.parse
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, Iterator, List, Any, Optional, Sequence, Tuple
 from dataclasses import dataclass
 from enum import Enum
 from ..core.logging import get_logger
@@ -31,7 +33,7 @@ class MutationType(str, Enum):
     BOUNDARY_TEST = "boundary_test"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Mutation:
     """A single mutation."""
     mutation_type: MutationType
@@ -100,6 +102,80 @@ PAYLOADS = {
     ],
 }
 
+# PAYLOADS is constant, so encode every payload once at import: as a JSON
+# string literal (bytes), as a query value (quote_plus) and as a form body
+# value (quote_plus, bytes)
+_JSON_PAYLOADS = {
+    p: json.dumps(p).encode("utf-8") for payloads in PAYLOADS.values() for p in payloads
+}
+_QUOTED_PAYLOADS = {
+    p: urllib.parse.quote_plus(p) for payloads in PAYLOADS.values() for p in payloads
+}
+_FORM_PAYLOADS = {p: q.encode("ascii") for p, q in _QUOTED_PAYLOADS.items()}
+
+# Mutation types that make sense inside a header value
+_HEADER_TYPES = frozenset({
+    MutationType.XSS,
+    MutationType.SQL_INJECTION,
+    MutationType.HEADER_INJECTION,
+})
+
+# Headers never mutated (would break the request framing)
+_SKIP_HEADERS = frozenset({"host", "content-length", "connection"})
+
+
+@lru_cache(maxsize=1024)
+def _parse_url_and_query(
+    url: str
+) -> Tuple[urllib.parse.ParseResult, Tuple[Tuple[str, Tuple[str, ...]], ...]]:
+    """Parse a URL and its query (blank values kept) into immutable parts."""
+    parsed = urllib.parse.urlparse(url)
+    params = urllib.parse.parse_qs(parsed.query, keep_blank_values=True)
+    return parsed, tuple((k, tuple(v)) for k, v in params.items())
+
+
+def _query_templates(params: Dict[str, Sequence[str]]) -> List[Tuple[str, str, str]]:
+    """
+    Split a parse_qs() result into per-field (name, head, tail) templates.
+    
+    head + quote_plus(value) + tail equals urlencode({k: v[0], ...}) with that
+    field's value replaced, so the unchanged fields are encoded once per
+    field rather than once per payload.
+    """
+    quote_plus = urllib.parse.quote_plus
+    encoded = [f"{quote_plus(k)}={quote_plus(v[0])}" for k, v in params.items()]
+    templates = []
+    for i, name in enumerate(params):
+        prefix = "&".join(encoded[:i])
+        suffix = "&".join(encoded[i + 1:])
+        head = f"{prefix}&{quote_plus(name)}=" if prefix else f"{quote_plus(name)}="
+        tail = f"&{suffix}" if suffix else ""
+        templates.append((name, head, tail))
+    return templates
+
+
+def _json_templates(data: Dict[str, Any]) -> List[Tuple[str, Any, bytes, bytes]]:
+    """
+    Split a decoded JSON object into per-field (name, value, head, tail)
+    templates for its string-valued fields.
+    
+    head + json.dumps(value).encode() + tail equals json.dumps(data).encode()
+    with that field's value replaced, so the rest of the document is
+    serialized once instead of once per payload.
+    """
+    dumps = json.dumps
+    items = [f"{dumps(k)}: {dumps(v)}" for k, v in data.items()]
+    templates = []
+    for i, (name, value) in enumerate(data.items()):
+        if not isinstance(value, str):
+            continue
+        prefix = ", ".join(items[:i])
+        suffix = ", ".join(items[i + 1:])
+        head = f"{{{prefix}, {dumps(name)}: " if prefix else f"{{{dumps(name)}: "
+        tail = f", {suffix}}}" if suffix else "}"
+        templates.append((name, value, head.encode("utf-8"), tail.encode("utf-8")))
+    return templates
+
 
 class MutationEngine:
     """
@@ -110,18 +186,52 @@ class MutationEngine:
     - URL parameters
     - Request body (JSON, form data)
     - Path segments
+    
+    Each mutation dict carries the mutated field ("headers", "url" or
+    "body"), a ready-to-send "modifications" dict for RequestReplayer and
+    the Mutation metadata.
     """
     
-    def __init__(self, mutation_types: Optional[List[MutationType]] = None):
+    def __init__(
+        self,
+        mutation_types: Optional[List[MutationType]] = None,
+        max_payload_expansion_bytes: Optional[int] = None
+    ):
         """
         Initialize mutation engine.
         
         Args:
             mutation_types: Types of mutations to generate (all if None)
+            max_payload_expansion_bytes: Skip payloads whose length times the
+                number of mutated fields exceeds this (unlimited if None)
         """
         self.mutation_types = mutation_types or list(MutationType)
+        self.max_payload_expansion_bytes = max_payload_expansion_bytes
+        # (type, payload) pairs are fixed for the engine's lifetime, so flatten
+        # them once instead of re-walking PAYLOADS for every field
+        self._all_pairs = [
+            (t, p) for t in self.mutation_types for p in PAYLOADS.get(t, ())
+        ]
+        self._header_pairs = [
+            (t, p) for t, p in self._all_pairs if t in _HEADER_TYPES
+        ]
         log.info("mutation_engine_initialized", types=len(self.mutation_types))
     
+    def _pairs_for(
+        self,
+        pairs: List[Tuple[MutationType, str]],
+        field_count: int
+    ) -> List[Tuple[MutationType, str]]:
+        """Drop payloads that would expand past max_payload_expansion_bytes."""
+        limit = self.max_payload_expansion_bytes
+        if limit is None:
+            return pairs
+        return [(t, p) for t, p in pairs if len(p) * field_count <= limit]
+    
+    def _descriptions(self, where: str, field_name: str) -> Dict[MutationType, str]:
+        """Build each type's description for one field, shared by its payloads."""
+        return {t: f"{t.value} in {where} {field_name}" for t in self.mutation_types}
+    
     def mutate_headers(
         self,
         headers: Dict[str, str]
@@ -135,38 +245,43 @@ class MutationEngine:
         Returns:
             List of mutated header dictionaries with metadata
         """
-        mutations = []
+        return list(self.iter_header_mutations(headers))
+    
+    def iter_header_mutations(
+        self,
+        headers: Dict[str, str]
+    ) -> Iterator[Dict[str, Any]]:
+        """Lazily yield header mutations (see mutate_headers)."""
+        # No header-safe type with payloads configured: nothing to walk
+        if not self._header_pairs or not headers:
+            return
         
-        for header_name, header_value in headers.items():
+        mutable = [
+            (name, value) for name, value in headers.items()
             # Skip certain headers
-            if header_name.lower() in ["host", "content-length", "connection"]:
-                continue
+            if name.lower() not in _SKIP_HEADERS
+        ]
+        pairs = self._pairs_for(self._header_pairs, len(mutable))
+        
+        for header_name, header_value in mutable:
+            descriptions = self._descriptions("header", header_name)
             
-            for mutation_type in self.mutation_types:
-                if mutation_type not in [
-                    MutationType.XSS,
-                    MutationType.SQL_INJECTION,
-                    MutationType.HEADER_INJECTION
-                ]:
-                    continue
+            for mutation_type, payload in pairs:
+                mutated_headers = headers.copy()
+                mutated_headers[header_name] = payload
                 
-                for payload in PAYLOADS.get(mutation_type, []):
-                    mutated_headers = headers.copy()
-                    mutated_headers[header_name] = payload
-                    
-                    mutations.append({
-                        "headers": mutated_headers,
-                        "mutation": Mutation(
-                            mutation_type=mutation_type,
-                            original_value=header_value,
-                            mutated_value=payload,
-                            location="header",
-                            field_name=header_name,
-                            description=f"{mutation_type.value} in header {header_name}"
-                        )
-                    })
-        
-        return mutations
+                yield {
+                    "headers": mutated_headers,
+                    "modifications": {"headers": mutated_headers},
+                    "mutation": Mutation(
+                        mutation_type=mutation_type,
+                        original_value=header_value,
+                        mutated_value=payload,
+                        location="header",
+                        field_name=header_name,
+                        description=descriptions[mutation_type]
+                    )
+                }
     
     def mutate_params(self, url: str) -> List[Dict[str, Any]]:
         """
@@ -178,47 +293,78 @@ class MutationEngine:
         Returns:
             List of mutated URLs with metadata
         """
-        mutations = []
+        return list(self.iter_param_mutations(url))
+    
+    def mutate_params_soa(self, url: str) -> Tuple[List[str], List[Mutation]]:
+        """
+        Generate URL parameter mutations as parallel lists.
         
-        parsed = urllib.parse.urlparse(url)
-        params = urllib.parse.parse_qs(parsed.query, keep_blank_values=True)
+        Same mutations as mutate_params, without a result dict per mutation.
         
-        if not params:
-            return mutations
+        Args:
+            url: Original URL
+            
+        Returns:
+            (mutated URLs, Mutation metadata), index-aligned
+        """
+        urls: List[str] = []
+        mutations: List[Mutation] = []
+        for mutated_url, mutation in self._iter_param_urls(url):
+            urls.append(mutated_url)
+            mutations.append(mutation)
+        return urls, mutations
+    
+    def iter_param_mutations(self, url: str) -> Iterator[Dict[str, Any]]:
+        """Lazily yield URL parameter mutations (see mutate_params)."""
+        for mutated_url, mutation in self._iter_param_urls(url):
+            yield {
+                "url": mutated_url,
+                "modifications": {"url": mutated_url},
+                "mutation": mutation
+            }
+    
+    def _iter_param_urls(self, url: str) -> Iterator[Tuple[str, Mutation]]:
+        """Yield (mutated URL, Mutation) for every param and payload."""
+        if not self._all_pairs:
+            return
+        
+        parsed, query = _parse_url_and_query(url)
+        
+        if not query:
+            return
         
-        for param_name, param_values in params.items():
+        params = dict(query)
+        
+        # Only the query changes between mutations; everything around it is
+        # fixed (urlunparse drops an empty query/fragment the same way)
+        base = urllib.parse.urlunparse((
+            parsed.scheme,
+            parsed.netloc,
+            parsed.path,
+            parsed.params,
+            "",
+            ""
+        ))
+        fragment = f"#{parsed.fragment}" if parsed.fragment else ""
+        pairs = self._pairs_for(self._all_pairs, len(params))
+        
+        for param_name, head, tail in _query_templates(params):
+            param_values = params[param_name]
             original_value = param_values[0] if param_values else ""
+            descriptions = self._descriptions("param", param_name)
             
-            for mutation_type in self.mutation_types:
-                for payload in PAYLOADS.get(mutation_type, []):
-                    # Create mutated params
-                    mutated_params = {k: v[0] for k, v in params.items()}
-                    mutated_params[param_name] = payload
-                    
-                    # Rebuild URL
-                    new_query = urllib.parse.urlencode(mutated_params)
-                    mutated_url = urllib.parse.urlunparse((
-                        parsed.scheme,
-                        parsed.netloc,
-                        parsed.path,
-                        parsed.params,
-                        new_query,
-                        parsed.fragment
-                    ))
-                    
-                    mutations.append({
-                        "url": mutated_url,
-                        "mutation": Mutation(
-                            mutation_type=mutation_type,
-                            original_value=original_value,
-                            mutated_value=payload,
-                            location="param",
-                            field_name=param_name,
-                            description=f"{mutation_type.value} in param {param_name}"
-                        )
-                    })
-        
-        return mutations
+            for mutation_type, payload in pairs:
+                yield (
+                    f"{base}?{head}{_QUOTED_PAYLOADS[payload]}{tail}{fragment}",
+                    Mutation(
+                        mutation_type=mutation_type,
+                        original_value=original_value,
+                        mutated_value=payload,
+                        location="param",
+                        field_name=param_name,
+                        description=descriptions[mutation_type]
+                    )
+                )
     
     def mutate_body(
         self,
@@ -235,89 +381,111 @@ class MutationEngine:
         Returns:
             List of mutated bodies with metadata
         """
-        mutations = []
-        
-        if not body:
-            return mutations
+        return list(self.iter_body_mutations(body, content_type))
+    
+    def iter_body_mutations(
+        self,
+        body: bytes,
+        content_type: str
+    ) -> Iterator[Dict[str, Any]]:
+        """Lazily yield request body mutations (see mutate_body)."""
+        if not body or not self._all_pairs:
+            return iter(())
         
         # Handle JSON bodies
         if "application/json" in content_type:
-            mutations.extend(self._mutate_json_body(body))
+            return self._mutate_json_body(body)
         
         # Handle form data
         elif "application/x-www-form-urlencoded" in content_type:
-            mutations.extend(self._mutate_form_body(body))
+            return self._mutate_form_body(body)
         
-        return mutations
+        return iter(())
     
-    def _mutate_json_body(self, body: bytes) -> List[Dict[str, Any]]:
+    def _mutate_json_body(self, body: bytes) -> Iterator[Dict[str, Any]]:
         """Mutate JSON request body."""
-        mutations = []
-        
         try:
             data = json.loads(body.decode("utf-8"))
         except (json.JSONDecodeError, UnicodeDecodeError):
-            return mutations
+            return
         
         if not isinstance(data, dict):
-            return mutations
+            return
         
-        for field_name, field_value in data.items():
-            if not isinstance(field_value, str):
-                continue
-            
-            for mutation_type in self.mutation_types:
-                for payload in PAYLOADS.get(mutation_type, []):
-                    mutated_data = data.copy()
-                    mutated_data[field_name] = payload
-                    
-                    mutations.append({
-                        "body": json.dumps(mutated_data).encode("utf-8"),
-                        "mutation": Mutation(
-                            mutation_type=mutation_type,
-                            original_value=str(field_value),
-                            mutated_value=payload,
-                            location="body",
-                            field_name=field_name,
-                            description=f"{mutation_type.value} in JSON field {field_name}"
-                        )
-                    })
+        templates = _json_templates(data)
+        pairs = self._pairs_for(self._all_pairs, len(templates))
         
-        return mutations
+        for field_name, field_value, head, tail in templates:
+            descriptions = self._descriptions("JSON field", field_name)
+            
+            for mutation_type, payload in pairs:
+                mutated_body = head + _JSON_PAYLOADS[payload] + tail
+                yield {
+                    "body": mutated_body,
+                    "modifications": {"body": mutated_body},
+                    "mutation": Mutation(
+                        mutation_type=mutation_type,
+                        original_value=str(field_value),
+                        mutated_value=payload,
+                        location="body",
+                        field_name=field_name,
+                        description=descriptions[mutation_type]
+                    )
+                }
     
-    def _mutate_form_body(self, body: bytes) -> List[Dict[str, Any]]:
+    def _mutate_form_body(self, body: bytes) -> Iterator[Dict[str, Any]]:
         """Mutate form-urlencoded request body."""
-        mutations = []
-        
         try:
             params = urllib.parse.parse_qs(
                 body.decode("utf-8"),
                 keep_blank_values=True
             )
         except UnicodeDecodeError:
-            return mutations
+            return
         
-        for field_name, field_values in params.items():
+        pairs = self._pairs_for(self._all_pairs, len(params))
+        
+        for field_name, head, tail in _query_templates(params):
+            field_values = params[field_name]
             original_value = field_values[0] if field_values else ""
+            # quote_plus output is ASCII, so the template encodes once per field
+            head_bytes = head.encode("ascii")
+            tail_bytes = tail.encode("ascii")
+            descriptions = self._descriptions("form field", field_name)
             
-            for mutation_type in self.mutation_types:
-                for payload in PAYLOADS.get(mutation_type, []):
-                    mutated_params = {k: v[0] for k, v in params.items()}
-                    mutated_params[field_name] = payload
-                    
-                    mutations.append({
-                        "body": urllib.parse.urlencode(mutated_params).encode("utf-8"),
-                        "mutation": Mutation(
-                            mutation_type=mutation_type,
-                            original_value=original_value,
-                            mutated_value=payload,
-                            location="body",
-                            field_name=field_name,
-                            description=f"{mutation_type.value} in form field {field_name}"
-                        )
-                    })
+            for mutation_type, payload in pairs:
+                mutated_body = head_bytes + _FORM_PAYLOADS[payload] + tail_bytes
+                yield {
+                    "body": mutated_body,
+                    "modifications": {"body": mutated_body},
+                    "mutation": Mutation(
+                        mutation_type=mutation_type,
+                        original_value=original_value,
+                        mutated_value=payload,
+                        location="body",
+                        field_name=field_name,
+                        description=descriptions[mutation_type]
+                    )
+                }
+    
+    def mutate_stream(
+        self,
+        headers: Dict[str, str],
+        url: str,
+        body: Optional[bytes] = None,
+        content_type: str = ""
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield header, param and body mutations in that order.
         
-        return mutations
+        Callers that only need the first K mutations stop early without
+        paying for the rest.
+        """
+        return chain(
+            self.iter_header_mutations(headers),
+            self.iter_param_mutations(url),
+            self.iter_body_mutations(body or b"", content_type)
+        )
     
     def get_mutation_count(
         self,
@@ -339,27 +507,23 @@ class MutationEngine:
             Estimated mutation count
         """
         count = 0
+        all_payloads = len(self._all_pairs)
         
         # Count header mutations
-        mutable_headers = [
-            h for h in headers.keys()
-            if h.lower() not in ["host", "content-length", "connection"]
-        ]
-        count += len(mutable_headers) * sum(
-            len(PAYLOADS.get(t, []))
-            for t in self.mutation_types
-            if t in [MutationType.XSS, MutationType.SQL_INJECTION, MutationType.HEADER_INJECTION]
-        )
+        if self._header_pairs:
+            mutable_headers = sum(1 for h in headers if h.lower() not in _SKIP_HEADERS)
+            count += mutable_headers * len(self._header_pairs)
         
-        # Count param mutations
-        parsed = urllib.parse.urlparse(url)
-        params = urllib.parse.parse_qs(parsed.query)
-        count += len(params) * sum(len(PAYLOADS.get(t, [])) for t in self.mutation_types)
+        # Count param mutations (the parse is cached and reused by
+        # iter_param_mutations; URLs without a query skip it entirely)
+        if all_payloads and "?" in url:
+            _, query = _parse_url_and_query(url)
+            count += len(query) * all_payloads
         
         # Count body mutations (estimate)
         if body:
             # Rough estimate based on body size
-            count += 10 * sum(len(PAYLOADS.get(t, [])) for t in self.mutation_types)
+            count += 10 * all_payloads
         
         return count
 
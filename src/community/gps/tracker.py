@@ -6,17 +6,25 @@ GPS location tracking using gpsd daemon.
 FAIL-FAST: Raises error if gpsd not available when enabled.
 """
 
+import json
+import select
 import shutil
+import socket
 import threading
-import time
-from typing import Optional, Callable
-from datetime import datetime
+from typing import Any, Dict, Optional, Callable
 import structlog
 
 from .types import Location
 
 log = structlog.get_logger(__name__)
 
+# Ask gpsd to stream JSON reports instead of answering one poll at a time
+_WATCH_ENABLE = b'?WATCH={"enable":true,"json":true}\n'
+_RECV_SIZE = 8192
+
+# Hosts where gpsd has to be installed on this machine
+_LOCAL_HOSTS = frozenset({"localhost", "127.0.0.1", "::1"})
+
 
 class GPSTrackerError(Exception):
     """GPS tracker error with actionable message."""
@@ -27,7 +35,7 @@ class GPSTracker:
     """
     GPS location tracker using gpsd.
     
-    FAIL-FAST: Constructor raises if gpsd not available.
+    FAIL-FAST: Constructor raises if a local gpsd is not installed.
     """
     
     def __init__(
@@ -44,34 +52,24 @@ class GPSTracker:
         Args:
             host: gpsd host
             port: gpsd port
-            poll_interval: Seconds between location polls
+            poll_interval: Max seconds to wait for gpsd data before
+                re-checking whether the tracker was stopped
             timeout: Connection timeout
             on_location: Callback for new locations
             
         Raises:
-            GPSTrackerError: If gpsd not found
+            GPSTrackerError: If host is local and gpsd not found
         """
         log.info("[GPS] Initializing GPS tracker", host=host, port=port)
         
-        # FAIL-FAST: Check gpsd exists
-        if not shutil.which("gpsd"):
+        # FAIL-FAST: Check gpsd exists (a remote gpsd is only checked on connect)
+        if host in _LOCAL_HOSTS and not shutil.which("gpsd"):
             raise GPSTrackerError(
                 "gpsd not found in PATH.\n"
                 "Install with: sudo apt install gpsd gpsd-clients\n"
                 "Or disable GPS tracking in config.json"
             )
         
-        # Try to import gpsd library
-        try:
-            import gpsd as gpsd_lib
-            self._gpsd = gpsd_lib
-        except ImportError:
-            raise GPSTrackerError(
-                "gpsd-py3 library not installed.\n"
-                "Install with: pip install gpsd-py3\n"
-                "Or disable GPS tracking in config.json"
-            )
-        
         self.host = host
         self.port = port
         self.poll_interval = poll_interval
@@ -80,8 +78,10 @@ class GPSTracker:
         
         self._running = False
         self._thread: Optional[threading.Thread] = None
+        # Written only by the tracking thread; a single attribute store is
+        # atomic, and Location is frozen, so readers need no lock
         self._current_location: Optional[Location] = None
-        self._lock = threading.Lock()
+        self._location_updated = threading.Event()
         self._connected = False
         
         log.info("[GPS] GPS tracker initialized")
@@ -115,56 +115,98 @@ class GPSTracker:
         """Main tracking loop - runs in background thread."""
         log.debug("[GPS] Tracking loop started")
         
-        # Connect to gpsd
+        # Connect to gpsd and enable streaming (WATCH) mode
         try:
-            self._gpsd.connect(host=self.host, port=self.port)
+            sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+            sock.sendall(_WATCH_ENABLE)
             self._connected = True
             log.info("[GPS] Connected to gpsd", host=self.host, port=self.port)
-        except Exception as e:
+        except OSError as e:
             log.error("[GPS] Failed to connect to gpsd", error=str(e))
             self._running = False
             return
         
-        while self._running:
-            try:
-                packet = self._gpsd.get_current()
-                
-                if packet.mode >= 2:  # 2D or 3D fix
-                    location = Location(
-                        latitude=packet.lat,
-                        longitude=packet.lon,
-                        altitude=packet.alt if packet.mode >= 3 else None,
-                        speed=packet.speed() if hasattr(packet, 'speed') else None,
-                        heading=packet.track if hasattr(packet, 'track') else None,
-                        accuracy=packet.error.get('x', None) if hasattr(packet, 'error') else None,
-                        timestamp=datetime.now()
-                    )
+        # gpsd pushes one JSON object per line; block on the socket with a
+        # timeout so stop() is still noticed when no reports arrive
+        pending = b""
+        with sock:
+            while self._running:
+                try:
+                    readable, _, _ = select.select([sock], [], [], self.poll_interval)
+                    if not readable:
+                        continue
                     
-                    with self._lock:
-                        self._current_location = location
-                    
-                    log.debug("[GPS] Location updated", location=str(location))
-                    
-                    if self.on_location:
-                        try:
-                            self.on_location(location)
-                        except Exception as e:
-                            log.warning("[GPS] Callback error", error=str(e))
-                else:
-                    log.debug("[GPS] No GPS fix", mode=packet.mode)
+                    chunk = sock.recv(_RECV_SIZE)
+                except OSError as e:
+                    log.warning("[GPS] Read error", error=str(e))
+                    break
                 
-            except Exception as e:
-                log.warning("[GPS] Poll error", error=str(e))
-            
-            time.sleep(self.poll_interval)
+                if not chunk:
+                    log.warning("[GPS] gpsd closed the connection")
+                    break
+                
+                *lines, pending = (pending + chunk).split(b"\n")
+                for line in lines:
+                    if line.strip():
+                        self._handle_report(line)
         
+        self._connected = False
         log.debug("[GPS] Tracking loop ended")
     
+    def _handle_report(self, line: bytes) -> None:
+        """Update the current location from one gpsd JSON report."""
+        try:
+            report: Dict[str, Any] = json.loads(line)
+        except ValueError as e:
+            log.warning("[GPS] Malformed gpsd report", error=str(e))
+            return
+        
+        if report.get("class") != "TPV":
+            return
+        
+        mode = report.get("mode", 0)
+        lat, lon = report.get("lat"), report.get("lon")
+        if mode < 2 or lat is None or lon is None:  # Need a 2D or 3D fix
+            log.debug("[GPS] No GPS fix", mode=mode)
+            return
+        
+        location = Location(
+            latitude=lat,
+            longitude=lon,
+            altitude=report.get("altMSL", report.get("alt")) if mode >= 3 else None,
+            speed=report.get("speed"),
+            heading=report.get("track"),
+            accuracy=report.get("epx")
+        )
+        
+        self._current_location = location
+        self._location_updated.set()
+        
+        log.debug("[GPS] Location updated", location=str(location))
+        
+        if self.on_location:
+            try:
+                self.on_location(location)
+            except Exception as e:
+                log.warning("[GPS] Callback error", error=str(e))
+    
     @property
     def current_location(self) -> Optional[Location]:
         """Get current location (thread-safe)."""
-        with self._lock:
-            return self._current_location
+        return self._current_location
+    
+    def wait_for_location(self, timeout: Optional[float] = None) -> Optional[Location]:
+        """
+        Block until the first fix arrives.
+        
+        Args:
+            timeout: Max seconds to wait (forever if None)
+            
+        Returns:
+            Current location, or None if no fix arrived in time
+        """
+        self._location_updated.wait(timeout)
+        return self._current_location
     
     @property
     def is_connected(self) -> bool:
@@ -3,12 +3,13 @@ AX-TrafficAnalyzer - GPS Types
 Copyright © 2025 MMeTech (Macau) Ltd.
 """
 
+import time
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Location:
     """GPS location data."""
     latitude: float
@@ -17,11 +18,19 @@ class Location:
     speed: Optional[float] = None  # m/s
     heading: Optional[float] = None  # degrees
     accuracy: Optional[float] = None  # meters
-    timestamp: datetime = None
+    timestamp_ns: int = 0  # Unix epoch nanoseconds
     
     def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = datetime.now()
+        if not self.timestamp_ns:
+            object.__setattr__(self, "timestamp_ns", time.time_ns())
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Fix time as an aware UTC datetime, built on access."""
+        seconds, nanos = divmod(self.timestamp_ns, 1_000_000_000)
+        return datetime.fromtimestamp(seconds, tz=timezone.utc).replace(
+            microsecond=nanos // 1000
+        )
     
     def to_dict(self) -> dict:
         return {
@@ -31,7 +40,7 @@ class Location:
             "speed": self.speed,
             "heading": self.heading,
             "accuracy": self.accuracy,
-            "timestamp": self.timestamp.isoformat() if self.timestamp else None
+            "timestamp": self.timestamp.isoformat()
         }
     
     def __str__(self) -> str:
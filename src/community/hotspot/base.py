@@ -14,7 +14,7 @@ from typing import List, Dict, Optional
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ClientInfo:
     """Information about a connected client."""
     mac_address: str
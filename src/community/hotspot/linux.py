@@ -11,7 +11,9 @@ Uses hostapd and dnsmasq managed as systemd services.
 """
 
 import os
+import select
 import subprocess
+import tempfile
 from pathlib import Path
 from typing import List, Dict
 from .base import HotspotBase, ClientInfo
@@ -20,6 +22,14 @@ from ..core.logging import get_logger
 
 log = get_logger(__name__)
 
+# Conditional import - pyroute2 is optional, ip(8) is used without it
+try:
+    from pyroute2 import IPRoute
+    from pyroute2.netlink.exceptions import NetlinkError
+    PYROUTE2_AVAILABLE = True
+except ImportError:
+    PYROUTE2_AVAILABLE = False
+
 # Systemd service names
 HOSTAPD_SERVICE = "ax-traffic-hostapd"
 DNSMASQ_SERVICE = "ax-traffic-dnsmasq"
@@ -30,6 +40,54 @@ HOSTAPD_CONF_FILE = HOSTAPD_CONF_DIR / "hostapd.conf"
 DNSMASQ_CONF_FILE = DNSMASQ_CONF_DIR / "dnsmasq.conf"
 DNSMASQ_LEASES_FILE = Path("/var/lib/misc/dnsmasq.leases")
 
+# Interface setup as one process: check the interface, add the gateway
+# address unless already assigned, bring the link up. Interface and gateway
+# arrive as $1/$2 (never interpolated); each step fails with its own code.
+_SETUP_INTERFACE_SCRIPT = """\
+addrs=$(ip -o addr show dev "$1") || exit 10
+case "$addrs" in
+    *"inet $2/"*) echo already_configured ;;
+    *) ip addr add "$2/24" dev "$1" || exit 11 ;;
+esac
+ip link set "$1" up || exit 12
+"""
+_SETUP_INTERFACE_NOT_FOUND = 10
+_SETUP_INTERFACE_ADDR_FAILED = 11
+
+
+def _write_if_changed(path: Path, content: str) -> bool:
+    """
+    Atomically replace path with content unless it already matches.
+    
+    Returns:
+        True if the file was written
+    """
+    data = content.encode("utf-8")
+    mode = 0o644
+    try:
+        if path.read_bytes() == data:
+            return False
+        mode = path.stat().st_mode & 0o7777  # Keep the existing permissions
+    except FileNotFoundError:
+        pass
+    
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f".{path.name}.", delete=False) as tmp:
+        tmp.write(data)
+    try:
+        os.chmod(tmp.name, mode)
+        os.replace(tmp.name, path)
+    except OSError:
+        os.unlink(tmp.name)
+        raise
+    return True
+
+
+def _pidfd_exited(pidfd: int) -> bool:
+    """A pidfd polls readable once its process has exited."""
+    poller = select.poll()
+    poller.register(pidfd, select.POLLIN)
+    return bool(poller.poll(0))
+
 
 class LinuxHotspot(HotspotBase):
     """Linux hotspot implementation using systemd (hostapd and dnsmasq)."""
@@ -60,6 +118,10 @@ class LinuxHotspot(HotspotBase):
                 None
             )
         
+        # pidfds of each unit's main process, so is_running() can probe
+        # liveness without spawning systemctl every time
+        self._main_pidfds: Dict[str, int] = {}
+        
         # Ensure directories exist
         HOSTAPD_CONF_DIR.mkdir(parents=True, exist_ok=True)
         DNSMASQ_CONF_DIR.mkdir(parents=True, exist_ok=True)
@@ -163,15 +225,24 @@ WantedBy=multi-user.target
 """
         return service_file
     
-    def _create_systemd_service(self, service_name: str, service_content: str) -> None:
-        """Create systemd service file and enable it."""
+    def _create_systemd_service(self, service_name: str, service_content: str) -> bool:
+        """
+        Write systemd service file unless unchanged.
+        
+        Returns:
+            True if written (call _daemon_reload once afterwards)
+        """
         service_file_path = SYSTEMD_SERVICE_DIR / f"{service_name}.service"
         
         # Write service file
-        service_file_path.write_text(service_content)
+        if not _write_if_changed(service_file_path, service_content):
+            log.debug("systemd_service_file_unchanged", service=service_name)
+            return False
         log.debug("systemd_service_file_created", service=service_name, path=str(service_file_path))
-        
-        # Reload systemd
+        return True
+    
+    def _daemon_reload(self) -> None:
+        """Reload systemd so newly written unit files take effect."""
         result = subprocess.run(
             ["systemctl", "daemon-reload"],
             capture_output=True,
@@ -198,50 +269,65 @@ WantedBy=multi-user.target
             parts = base_ip.rsplit(".", 1)
             gateway = f"{parts[0]}.1"
         
-        # Check if interface already has IP configured
+        if PYROUTE2_AVAILABLE:
+            self._setup_interface_netlink(interface, gateway)
+        else:
+            self._setup_interface_ip(interface, gateway)
+        log.debug("interface_brought_up", interface=interface)
+    
+    def _setup_interface_netlink(self, interface: str, gateway: str) -> None:
+        """Configure the interface with direct netlink requests (pyroute2)."""
+        try:
+            with IPRoute() as ipr:
+                links = ipr.link_lookup(ifname=interface)
+                if not links:
+                    raise NetworkError(
+                        f"Interface {interface} not found. Ensure WiFi adapter is connected.",
+                        None
+                    )
+                index = links[0]
+                
+                if any(a.get_attr("IFA_ADDRESS") == gateway for a in ipr.get_addr(index=index)):
+                    log.debug("interface_already_configured", interface=interface, ip=gateway)
+                else:
+                    ipr.addr("add", index=index, address=gateway, prefixlen=24)
+                    log.debug("interface_configured", interface=interface, ip=gateway)
+                
+                ipr.link("set", index=index, state="up")
+        except NetlinkError as e:
+            raise NetworkError(
+                f"Failed to configure interface {interface}: {e}",
+                None
+            )
+    
+    def _setup_interface_ip(self, interface: str, gateway: str) -> None:
+        """Configure the interface with ip(8), all steps in one shell."""
         result = subprocess.run(
-            ["ip", "addr", "show", interface],
+            ["sh", "-c", _SETUP_INTERFACE_SCRIPT, "sh", interface, gateway],
             capture_output=True,
             text=True,
-            timeout=5
+            timeout=10
         )
-        if result.returncode != 0:
+        if result.returncode == _SETUP_INTERFACE_NOT_FOUND:
             raise NetworkError(
                 f"Interface {interface} not found. Ensure WiFi adapter is connected.",
                 None
             )
-        
-        # Check if IP already assigned
-        if gateway in result.stdout:
-            log.debug("interface_already_configured", interface=interface, ip=gateway)
-        else:
-            # Configure interface IP
-            result = subprocess.run(
-                ["ip", "addr", "add", f"{gateway}/24", "dev", interface],
-                capture_output=True,
-                text=True,
-                timeout=5
+        if result.returncode == _SETUP_INTERFACE_ADDR_FAILED:
+            raise NetworkError(
+                f"Failed to configure interface {interface}: {result.stderr}",
+                None
             )
-            if result.returncode != 0:
-                raise NetworkError(
-                    f"Failed to configure interface {interface}: {result.stderr}",
-                    None
-                )
-            log.debug("interface_configured", interface=interface, ip=gateway)
-        
-        # Bring interface up
-        result = subprocess.run(
-            ["ip", "link", "set", interface, "up"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
         if result.returncode != 0:
             raise NetworkError(
                 f"Failed to bring interface {interface} up: {result.stderr}",
                 None
             )
-        log.debug("interface_brought_up", interface=interface)
+        
+        if "already_configured" in result.stdout:
+            log.debug("interface_already_configured", interface=interface, ip=gateway)
+        else:
+            log.debug("interface_configured", interface=interface, ip=gateway)
     
     def _is_service_running(self, service_name: str) -> bool:
         """Check if systemd service is running."""
@@ -253,6 +339,47 @@ WantedBy=multi-user.target
         )
         return result.returncode == 0
     
+    def _main_pid(self, service_name: str) -> int:
+        """Get a service's main PID from systemd (0 if not running)."""
+        result = subprocess.run(
+            ["systemctl", "show", "--property=MainPID", "--value", service_name],
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+        try:
+            return int(result.stdout.strip() or 0)
+        except ValueError:
+            return 0
+    
+    def _is_service_alive(self, service_name: str) -> bool:
+        """Check a service via its cached main-process pidfd, asking systemd on a miss."""
+        pidfd = self._main_pidfds.get(service_name)
+        if pidfd is not None:
+            if not _pidfd_exited(pidfd):
+                return True
+            # Main process exited (stopped or restarted) - look it up again
+            os.close(self._main_pidfds.pop(service_name))
+        
+        pid = self._main_pid(service_name)
+        if not pid:
+            return False
+        
+        try:
+            self._main_pidfds[service_name] = os.pidfd_open(pid)
+        except ProcessLookupError:
+            return False
+        except (AttributeError, OSError):
+            # No pidfd support (non-Linux or kernel < 5.3)
+            return self._is_service_running(service_name)
+        return True
+    
+    def _forget_main_pids(self) -> None:
+        """Close cached pidfds."""
+        for pidfd in self._main_pidfds.values():
+            os.close(pidfd)
+        self._main_pidfds.clear()
+    
     def start(self) -> None:
         """Start the WiFi hotspot using systemd."""
         log.info("starting_hotspot", interface=self.config.get("interface"))
@@ -265,74 +392,65 @@ WantedBy=multi-user.target
         dnsmasq_config = self._generate_dnsmasq_config()
         
         # Write configuration files
-        HOSTAPD_CONF_FILE.write_text(hostapd_config)
-        DNSMASQ_CONF_FILE.write_text(dnsmasq_config)
+        _write_if_changed(HOSTAPD_CONF_FILE, hostapd_config)
+        _write_if_changed(DNSMASQ_CONF_FILE, dnsmasq_config)
         log.debug("config_files_written")
         
-        # Create and start hostapd service
+        # Write both unit files, then reload systemd once if either changed
         hostapd_service_content = self._generate_systemd_service(
             HOSTAPD_SERVICE,
             ["/usr/sbin/hostapd", str(HOSTAPD_CONF_FILE)],
             "AX Traffic Analyzer Hotspot (hostapd)"
         )
-        self._create_systemd_service(HOSTAPD_SERVICE, hostapd_service_content)
-        
-        result = subprocess.run(
-            ["systemctl", "start", HOSTAPD_SERVICE],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        if result.returncode != 0:
-            raise NetworkError(
-                f"Failed to start hostapd service: {result.stderr}",
-                None
-            )
-        log.info("hostapd_service_started")
+        units_changed = self._create_systemd_service(HOSTAPD_SERVICE, hostapd_service_content)
         
-        # Create and start dnsmasq service
         dnsmasq_service_content = self._generate_systemd_service(
             DNSMASQ_SERVICE,
             ["/usr/sbin/dnsmasq", "--conf-file", str(DNSMASQ_CONF_FILE)],
             "AX Traffic Analyzer Hotspot (dnsmasq)"
         )
-        self._create_systemd_service(DNSMASQ_SERVICE, dnsmasq_service_content)
+        if self._create_systemd_service(DNSMASQ_SERVICE, dnsmasq_service_content):
+            units_changed = True
+        if units_changed:
+            self._daemon_reload()
         
+        # Start both services in one systemctl call
         result = subprocess.run(
-            ["systemctl", "start", DNSMASQ_SERVICE],
+            ["systemctl", "start", HOSTAPD_SERVICE, DNSMASQ_SERVICE],
             capture_output=True,
             text=True,
             timeout=10
         )
         if result.returncode != 0:
-            # Stop hostapd if dnsmasq fails
-            self._stop_service(HOSTAPD_SERVICE)
+            # Don't leave one half of the hotspot running
+            self._stop_services(DNSMASQ_SERVICE, HOSTAPD_SERVICE)
             raise NetworkError(
-                f"Failed to start dnsmasq service: {result.stderr}",
+                f"Failed to start hotspot services: {result.stderr}",
                 None
             )
+        log.info("hostapd_service_started")
         log.info("dnsmasq_service_started")
         log.info("hotspot_started", interface=self.config.get("interface"))
     
-    def _stop_service(self, service_name: str) -> None:
-        """Stop a systemd service."""
+    def _stop_services(self, *service_names: str) -> None:
+        """Stop systemd services with a single systemctl call."""
         result = subprocess.run(
-            ["systemctl", "stop", service_name],
+            ["systemctl", "stop", *service_names],
             capture_output=True,
             text=True,
             timeout=10
         )
         if result.returncode != 0:
             # Log but don't raise - cleanup should not fail
-            log.warning("service_stop_failed", service=service_name, error=result.stderr)
+            log.warning("service_stop_failed", services=list(service_names), error=result.stderr)
         else:
-            log.debug("service_stopped", service=service_name)
+            log.debug("service_stopped", services=list(service_names))
     
     def stop(self) -> None:
         """Stop the WiFi hotspot using systemd."""
         log.info("stopping_hotspot")
-        self._stop_service(DNSMASQ_SERVICE)
-        self._stop_service(HOSTAPD_SERVICE)
+        self._forget_main_pids()
+        self._stop_services(DNSMASQ_SERVICE, HOSTAPD_SERVICE)
         log.info("hotspot_stopped")
     
     def restart(self) -> None:
@@ -344,7 +462,7 @@ WantedBy=multi-user.target
     
     def is_running(self) -> bool:
         """Check if hotspot is running."""
-        return self._is_service_running(HOSTAPD_SERVICE) and self._is_service_running(DNSMASQ_SERVICE)
+        return self._is_service_alive(HOSTAPD_SERVICE) and self._is_service_alive(DNSMASQ_SERVICE)
     
     def get_clients(self) -> List[ClientInfo]:
         """Get list of connected clients from dnsmasq leases."""
@@ -353,18 +471,16 @@ WantedBy=multi-user.target
             return clients
         
         try:
-            for line in DNSMASQ_LEASES_FILE.read_text().splitlines():
-                parts = line.split()
+            # Split raw bytes and decode only the fields kept; the trailing
+            # client-id column is never split or decoded
+            for line in DNSMASQ_LEASES_FILE.read_bytes().splitlines():
+                parts = line.split(None, 4)
                 if len(parts) >= 4:
-                    lease_time = int(parts[0])
-                    mac = parts[1]
-                    ip = parts[2]
-                    hostname = parts[3] if len(parts) > 3 else None
                     clients.append(ClientInfo(
-                        mac_address=mac,
-                        ip_address=ip,
-                        hostname=hostname,
-                        connected_at=lease_time
+                        mac_address=parts[1].decode("ascii"),
+                        ip_address=parts[2].decode("ascii"),
+                        hostname=parts[3].decode("utf-8"),
+                        connected_at=int(parts[0])
                     ))
         except Exception as e:
             log.warning("failed_to_parse_leases", error=str(e))
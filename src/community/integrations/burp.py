@@ -11,15 +11,21 @@ This file is part of AX-TrafficAnalyzer Community Edition.
 """
 
 import base64
+import io
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from datetime import datetime
-from xml.etree import ElementTree as ET
-from xml.dom import minidom
+from xml.sax.saxutils import XMLGenerator
 from ..core.logging import get_logger
 
 log = get_logger(__name__)
 
+# Fixed markup, shared by every item
+_NO_ATTRS: Dict[str, str] = {}
+_BASE64_ATTRS = {"base64": "true"}
+_ITEM_INDENT = "\n  "
+_FIELD_INDENT = "\n    "
+
 
 class BurpExporter:
     """
@@ -62,22 +68,22 @@ class BurpExporter:
             timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
             output_file = str(self.output_dir / f"burp_export_{session_id}_{timestamp}.xml")
         
-        # Create root element
-        root = ET.Element("items")
-        root.set("burpVersion", "2023.0")
-        root.set("exportTime", datetime.utcnow().isoformat())
-        
-        for flow in flows:
-            item = self._create_item_element(flow)
-            root.append(item)
-        
-        # Write XML
-        xml_str = ET.tostring(root, encoding="unicode")
-        # nosec B318 - XML is generated internally, not from untrusted input
-        pretty_xml = minidom.parseString(xml_str).toprettyxml(indent="  ")  # nosec B318
-        
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(pretty_xml)
+        # Stream items straight to the file, indenting as we go, instead of
+        # building a tree and re-parsing it to pretty-print
+        with open(output_file, "wb", buffering=1 << 20) as f:
+            xg = XMLGenerator(f, encoding="utf-8", short_empty_elements=True)
+            xg.startDocument()
+            xg.startElement("items", {
+                "burpVersion": "2023.0",
+                "exportTime": datetime.utcnow().isoformat()
+            })
+            
+            for flow in flows:
+                self._emit_item(xg, flow)
+            
+            xg.characters("\n")
+            xg.endElement("items")
+            xg.endDocument()
         
         log.info(
             "burp_export_complete",
@@ -109,79 +115,54 @@ class BurpExporter:
             output_file
         )
     
-    def _create_item_element(self, flow: Dict[str, Any]) -> ET.Element:
-        """Create Burp item element from flow."""
-        item = ET.Element("item")
+    def _emit_item(self, xg: XMLGenerator, flow: Dict[str, Any]) -> None:
+        """Write one Burp item element for a flow."""
+        xg.characters(_ITEM_INDENT)
+        xg.startElement("item", _NO_ATTRS)
+        for tag, attrs, text in self._item_fields(flow):
+            xg.characters(_FIELD_INDENT)
+            xg.startElement(tag, attrs)
+            if text:
+                xg.characters(text)
+            xg.endElement(tag)
+        xg.characters(_ITEM_INDENT)
+        xg.endElement("item")
+    
+    def _item_fields(self, flow: Dict[str, Any]) -> Iterator[Tuple[str, Dict[str, str], str]]:
+        """Yield (tag, attributes, text) for each child of a Burp item."""
+        url = flow.get("url", "")
+        path = flow.get("path", "/")
         
         # Time
-        time_elem = ET.SubElement(item, "time")
         timestamp = flow.get("timestamp")
         if isinstance(timestamp, datetime):
-            time_elem.text = timestamp.isoformat()
+            yield "time", _NO_ATTRS, timestamp.isoformat()
         elif isinstance(timestamp, str):
-            time_elem.text = timestamp
+            yield "time", _NO_ATTRS, timestamp
         else:
-            time_elem.text = datetime.utcnow().isoformat()
+            yield "time", _NO_ATTRS, datetime.utcnow().isoformat()
         
-        # URL
-        url_elem = ET.SubElement(item, "url")
-        url_elem.text = flow.get("url", "")
-        
-        # Host
-        host = ET.SubElement(item, "host")
-        host.set("ip", flow.get("server_ip", ""))
-        host.text = flow.get("host", "")
-        
-        # Port
-        port_elem = ET.SubElement(item, "port")
-        port = self._extract_port(flow.get("url", ""))
-        port_elem.text = str(port)
-        
-        # Protocol
-        protocol_elem = ET.SubElement(item, "protocol")
-        protocol_elem.text = "https" if flow.get("url", "").startswith("https") else "http"
-        
-        # Method
-        method_elem = ET.SubElement(item, "method")
-        method_elem.text = flow.get("method", "GET")
-        
-        # Path
-        path_elem = ET.SubElement(item, "path")
-        path_elem.text = flow.get("path", "/")
-        
-        # Extension
-        extension_elem = ET.SubElement(item, "extension")
-        extension_elem.text = self._extract_extension(flow.get("path", ""))
+        yield "url", _NO_ATTRS, url
+        yield "host", {"ip": flow.get("server_ip", "")}, flow.get("host", "")
+        yield "port", _NO_ATTRS, str(self._extract_port(url))
+        yield "protocol", _NO_ATTRS, "https" if url.startswith("https") else "http"
+        yield "method", _NO_ATTRS, flow.get("method", "GET")
+        yield "path", _NO_ATTRS, path
+        yield "extension", _NO_ATTRS, self._extract_extension(flow.get("path", ""))
         
         # Request
-        request_elem = ET.SubElement(item, "request")
-        request_elem.set("base64", "true")
         request_data = self._build_raw_request(flow)
-        request_elem.text = base64.b64encode(request_data).decode("ascii")
-        
-        # Status
-        status_elem = ET.SubElement(item, "status")
-        status_elem.text = str(flow.get("status_code", 0))
+        yield "request", _BASE64_ATTRS, base64.b64encode(request_data).decode("ascii")
         
-        # Response length
-        responselength_elem = ET.SubElement(item, "responselength")
-        responselength_elem.text = str(flow.get("response_size", 0))
-        
-        # MIME type
-        mimetype_elem = ET.SubElement(item, "mimetype")
-        mimetype_elem.text = flow.get("content_type", "")
+        yield "status", _NO_ATTRS, str(flow.get("status_code", 0))
+        yield "responselength", _NO_ATTRS, str(flow.get("response_size", 0))
+        yield "mimetype", _NO_ATTRS, flow.get("content_type", "")
         
         # Response
-        response_elem = ET.SubElement(item, "response")
-        response_elem.set("base64", "true")
         response_data = self._build_raw_response(flow)
-        response_elem.text = base64.b64encode(response_data).decode("ascii")
-        
-        # Comment
-        comment_elem = ET.SubElement(item, "comment")
-        comment_elem.text = f"Exported from AX-TrafficAnalyzer - Flow ID: {flow.get('flow_id', '')}"
+        yield "response", _BASE64_ATTRS, base64.b64encode(response_data).decode("ascii")
         
-        return item
+        yield "comment", _NO_ATTRS, f"Exported from AX-TrafficAnalyzer - Flow ID: {flow.get('flow_id', '')}"
     
     def _build_raw_request(self, flow: Dict[str, Any]) -> bytes:
         """Build raw HTTP request from flow."""
@@ -189,56 +170,48 @@ class BurpExporter:
         path = flow.get("path", "/")
         host = flow.get("host", "")
         headers = flow.get("request_headers", {}) or {}
-        body = flow.get("request_body")
         
-        # Build request line
-        lines = [f"{method} {path} HTTP/1.1"]
+        buf = io.BytesIO()
+        
+        # Request line
+        buf.write(f"{method} {path} HTTP/1.1\r\n".encode("utf-8"))
         
         # Add Host header if not present
         if "Host" not in headers and "host" not in headers:
-            lines.append(f"Host: {host}")
-        
-        # Add headers
-        for name, value in headers.items():
-            lines.append(f"{name}: {value}")
-        
-        # Join with CRLF
-        request = "\r\n".join(lines) + "\r\n\r\n"
+            buf.write(f"Host: {host}\r\n".encode("utf-8"))
         
-        # Add body if present
-        if body:
-            if isinstance(body, str):
-                request += body
-            elif isinstance(body, bytes):
-                return request.encode("utf-8") + body
-        
-        return request.encode("utf-8")
+        self._write_head_and_body(buf, headers, flow.get("request_body"))
+        return buf.getvalue()
     
     def _build_raw_response(self, flow: Dict[str, Any]) -> bytes:
         """Build raw HTTP response from flow."""
         status_code = flow.get("status_code", 200)
-        headers = flow.get("response_headers", {}) or {}
-        body = flow.get("response_body")
         
-        # Build status line
+        buf = io.BytesIO()
+        
+        # Status line
         status_text = self._get_status_text(status_code)
-        lines = [f"HTTP/1.1 {status_code} {status_text}"]
+        buf.write(f"HTTP/1.1 {status_code} {status_text}\r\n".encode("utf-8"))
         
-        # Add headers
+        self._write_head_and_body(
+            buf,
+            flow.get("response_headers", {}) or {},
+            flow.get("response_body")
+        )
+        return buf.getvalue()
+    
+    def _write_head_and_body(self, buf: io.BytesIO, headers: Dict[str, Any], body: Any) -> None:
+        """Write header lines, the blank line and the body (if any) as bytes."""
+        write = buf.write
         for name, value in headers.items():
-            lines.append(f"{name}: {value}")
-        
-        # Join with CRLF
-        response = "\r\n".join(lines) + "\r\n\r\n"
+            write(f"{name}: {value}\r\n".encode("utf-8"))
+        write(b"\r\n")
         
-        # Add body if present
         if body:
             if isinstance(body, str):
-                response += body
+                write(body.encode("utf-8"))
             elif isinstance(body, bytes):
-                return response.encode("utf-8") + body
-        
-        return response.encode("utf-8")
+                write(body)
     
     def _extract_port(self, url: str) -> int:
         """Extract port from URL."""
@@ -10,11 +10,12 @@ Main application that orchestrates all Phase 1 components.
 """
 
 import sys
+import threading
 from pathlib import Path
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from uvicorn import run as uvicorn_run
+from uvicorn import Config as UvicornConfig, Server as UvicornServer
 from .core import (
     get_platform_info,
     DependencyValidator,
@@ -82,7 +83,7 @@ def main():
         
         # 1. Platform detection (Phase 0)
         log.info("detecting_platform")
-        platform = get_platform_info()
+        platform = get_platform_info(verbose=True)
         log.info("platform_detected", distribution=platform.distribution, version=platform.distribution_version)
         
         # 2. Dependency validation (Phase 0)
@@ -434,6 +435,9 @@ def main():
         # 8. Start orchestrator (atomic startup)
         log.info("starting_orchestrator")
         orchestrator.start()
+        if orchestrator.shutdown_requested():
+            log.info("startup_interrupted_by_signal")
+            return
         log.info("orchestrator_started")
         
         # 9. Store component references in app.state for health API and dependencies
@@ -519,7 +523,23 @@ def main():
         else:
             log.debug("ssl_disabled", mode=config.get("mode"))
         
-        uvicorn_run(**uvicorn_kwargs)
+        # A signal during steps 9-11 is only flagged; honour it before uvicorn
+        # takes over SIGINT/SIGTERM (finally stops the started components)
+        if orchestrator.shutdown_requested():
+            log.info("startup_interrupted_by_signal")
+            return
+        
+        server = UvicornServer(UvicornConfig(**uvicorn_kwargs))
+        # uvicorn only handles SIGINT/SIGTERM; SIGHUP/SIGQUIT stay flagged by
+        # the orchestrator, so a watcher thread asks uvicorn to exit on them
+        # (components are stopped by the finally block below, on this thread)
+        threading.Thread(
+            target=_watch_shutdown,
+            args=(orchestrator, server),
+            name="shutdown-watcher",
+            daemon=True
+        ).start()
+        server.run()
         
     except KeyboardInterrupt:
         log.info("keyboard_interrupt_received")
@@ -536,9 +556,18 @@ def main():
                 orchestrator.stop()
             except Exception as e:
                 log.error("cleanup_failed", error=str(e))
+            # Restore signal handlers and release the wakeup pipe, if any
+            orchestrator.close()
         log.info("application_shutdown_complete")
 
 
+def _watch_shutdown(orchestrator: StartupOrchestrator, server: UvicornServer) -> None:
+    """Ask uvicorn to exit once the orchestrator flags a shutdown signal."""
+    orchestrator.wait_for_shutdown_request()
+    log.info("shutdown_watcher_stopping_api_server")
+    server.should_exit = True
+
+
 def _start_iptables(iptables: IPTablesManager) -> None:
     """Start iptables manager."""
     log.info("starting_iptables")
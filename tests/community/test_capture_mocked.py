@@ -93,6 +93,28 @@ class TestPCAPExporterMocked:
         from community.capture.pcap.exporter import StreamingPCAPExporter
         assert hasattr(StreamingPCAPExporter, 'export_packet')
 
+    def test_export_packets_writes_burst_in_order(self, tmp_path):
+        """Test export_packets writes every packet in order and returns the count."""
+        from community.capture.pcap.exporter import StreamingPCAPExporter
+        exporter = StreamingPCAPExporter(output_dir=str(tmp_path))
+        exporter.writer = MagicMock()
+        packets = [b"pkt-1", b"pkt-2", b"pkt-3"]
+
+        assert exporter.export_packets(packets) == 3
+        written = [c.args[0] for c in exporter.writer.write_packet.call_args_list]
+        assert written == packets
+        assert exporter.circuit_breaker.consecutive_failures == 0
+
+    def test_export_packets_writer_failure_returns_partial_count(self, tmp_path):
+        """Test a writer failure records a circuit-breaker failure and returns the partial count."""
+        from community.capture.pcap.exporter import StreamingPCAPExporter
+        exporter = StreamingPCAPExporter(output_dir=str(tmp_path))
+        exporter.writer = MagicMock()
+        exporter.writer.write_packet.side_effect = [None, OSError("disk full")]
+
+        assert exporter.export_packets([b"pkt-1", b"pkt-2", b"pkt-3"]) == 1
+        assert exporter.circuit_breaker.consecutive_failures == 1
+
 
 class TestPCAPMonitorMocked:
     """Test PCAPFileMonitor with mocks."""
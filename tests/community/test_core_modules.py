@@ -56,6 +56,82 @@ class TestPlatformDetector:
         assert platform is not None
         assert hasattr(platform, 'os')
 
+    def test_platform_detector_quiet_by_default(self, capsys):
+        """Test detection prints nothing unless verbose."""
+        from community.core.platform.detector import PlatformDetector
+        PlatformDetector().detect()
+        assert "Detecting platform" not in capsys.readouterr().out
+        PlatformDetector(verbose=True).detect()
+        assert "Detecting platform" in capsys.readouterr().out
+
+    def test_detect_linux_info_parses_os_release(self):
+        """Test os-release ID/VERSION_ID parsing (quoted and unquoted)."""
+        from pathlib import Path
+        from community.core.platform.detector import PlatformDetector
+        text = 'NAME="Ubuntu"\nVERSION_ID="22.04"\nID=ubuntu\nID_LIKE=debian\n'
+        with patch.object(Path, 'read_text', return_value=text):
+            _, distribution, version = PlatformDetector()._detect_linux_info()
+        assert (distribution, version) == ("ubuntu", "22.04")
+
+    def test_detect_linux_info_falls_back_to_lsb_release(self):
+        """Test /etc/lsb-release is used when no os-release file exists."""
+        from pathlib import Path
+        from community.core.platform.detector import PlatformDetector
+
+        def read_text(path):
+            if str(path) == "/etc/lsb-release":
+                return 'DISTRIB_ID=Ubuntu\nDISTRIB_RELEASE=20.04\n'
+            raise FileNotFoundError(str(path))
+
+        with patch.object(Path, 'read_text', autospec=True, side_effect=read_text), \
+             patch('subprocess.run') as mock_run:
+            _, distribution, version = PlatformDetector()._detect_linux_info()
+        assert (distribution, version) == ("Ubuntu", "20.04")
+        mock_run.assert_not_called()
+
+    def test_detect_wsl2_env_fast_path(self):
+        """Test WSL env vars short-circuit WSL2 detection."""
+        from community.core.platform.detector import PlatformDetector
+        detector = PlatformDetector()
+        with patch.dict('os.environ', {"WSL_DISTRO_NAME": "Ubuntu"}), \
+             patch('builtins.open') as mock_open:
+            assert detector._detect_wsl2() == (True, "Ubuntu")
+        mock_open.assert_not_called()
+        with patch.dict('os.environ', clear=True), \
+             patch('os.path.exists', return_value=False), \
+             patch('builtins.open') as mock_open:
+            assert detector._detect_wsl2() == (False, None)
+        mock_open.assert_not_called()
+
+    def test_fail_fast_message(self):
+        """Test platform fail-fast message carries the details and default docs."""
+        from community.core.errors import PlatformDetectionError
+        from community.core.platform.detector import PlatformDetector
+        with pytest.raises(PlatformDetectionError) as exc_info:
+            PlatformDetector()._fail_fast(
+                component="Kernel", version_req=">= 5.4", found="4.19",
+                reason="Kernel version too old", solution="Upgrade kernel"
+            )
+        message = str(exc_info.value)
+        assert "COMPONENT:    Kernel" in message
+        assert "FOUND:        4.19" in message
+        assert "https://docs.ax-traffic-analyzer.com/installation/platform" in message
+
+    def test_parse_kernel_version(self):
+        """Test kernel version parsing keeps the leading X.Y.Z digits."""
+        from community.core.platform.detector import PlatformDetector
+        detector = PlatformDetector()
+        assert detector._parse_version("5.15.0-157-generic") == (5, 15, 0)
+        assert detector._parse_version("5.15.90.1-microsoft-standard-WSL2") == (5, 15, 90)
+        assert detector._parse_version("6.1.0+rpt-rpi-v8") == (6, 1, 0)
+        assert detector._parse_version("5.15") == (0, 0, 0)
+        assert detector._parse_version("unknown") == (0, 0, 0)
+
+    def test_get_platform_info_cached(self):
+        """Test get_platform_info returns the same object every call."""
+        from community.core.platform.detector import get_platform_info
+        assert get_platform_info() is get_platform_info()
+
 
 class TestMemoryModules:
     """Test memory management modules."""
@@ -73,11 +149,72 @@ class TestMemoryModules:
         buffer.push(b"item2")
         assert not buffer.is_empty()
 
+    def test_ring_buffer_wraps_and_drops_oldest(self):
+        """Test RingBuffer keeps FIFO order across the wrap point."""
+        from community.core.memory.ring_buffer import RingBuffer
+        buffer = RingBuffer(max_size_mb=1)
+        chunk = buffer.max_size_bytes // 3
+        packets = [bytes([i]) * chunk for i in range(5)]
+        for packet in packets:
+            assert buffer.push(packet)
+        # Only the newest three fit; the oldest two were dropped
+        assert buffer.current_size == 3 * chunk
+        assert [buffer.pop() for _ in range(3)] == packets[2:]
+        assert buffer.pop() is None
+        assert buffer.is_empty()
+
+    def test_ring_buffer_push_many_matches_push(self):
+        """Test RingBuffer.push_many behaves like repeated push."""
+        from community.core.memory.ring_buffer import RingBuffer
+        chunk = (1024 * 1024) // 3
+        packets = [bytes([i]) * chunk for i in range(5)]
+        single = RingBuffer(max_size_mb=1)
+        batched = RingBuffer(max_size_mb=1)
+        for packet in packets[:2]:
+            single.push(packet)
+            batched.push(packet)
+        for packet in packets[2:]:
+            single.push(packet)
+        assert batched.push_many(packets[2:]) == 3
+        assert batched.current_size == single.current_size
+        assert [batched.pop() for _ in range(3)] == [single.pop() for _ in range(3)]
+        assert batched.is_empty()
+
+    def test_ring_buffer_drain_to_fd(self, tmp_path):
+        """Test RingBuffer.drain_to_fd writes wrapped data in order."""
+        import os
+        from community.core.memory.ring_buffer import RingBuffer
+        buffer = RingBuffer(max_size_mb=1)
+        chunk = buffer.max_size_bytes // 3
+        packets = [bytes([i]) * chunk for i in range(4)]
+        buffer.push_many(packets)  # Last packet wraps around the ring
+        out = tmp_path / "drain.bin"
+        fd = os.open(out, os.O_WRONLY | os.O_CREAT, 0o600)
+        try:
+            assert buffer.drain_to_fd(fd) == 3 * chunk
+        finally:
+            os.close(fd)
+        assert out.read_bytes() == b"".join(packets[1:])
+        assert buffer.is_empty()
+        assert buffer.current_size == 0
+
     def test_backpressure_import(self):
         """Test BackpressureController can be imported."""
         from community.core.memory.backpressure import BackpressureController
         assert BackpressureController is not None
 
+    def test_backpressure_buffer_status(self):
+        """Test get_buffer_status reports fill level from cached values."""
+        from community.core.memory.backpressure import BackpressureController
+        from community.core.memory.ring_buffer import RingBuffer
+        buffer = RingBuffer(max_size_mb=1)
+        buffer.push(b"x" * (buffer.max_size_bytes // 4))
+        status = BackpressureController(buffer).get_buffer_status()
+        assert status["max_size_mb"] == 1.0
+        assert status["threshold_mb"] == buffer.backpressure_threshold / (1024 * 1024)
+        assert status["usage_percent"] == 25.0
+        assert status["paused"] is False
+
     def test_circuit_breaker_import(self):
         """Test CircuitBreaker can be imported."""
         from community.core.memory.circuit_breaker import CircuitBreaker
@@ -95,6 +232,37 @@ class TestMemoryModules:
         from community.core.memory.watermarks import MemoryWatermarkMonitor
         assert MemoryWatermarkMonitor is not None
 
+    def test_watermarks_reading_cached_until_invalidated(self):
+        """Test check_memory reuses a reading within the TTL."""
+        from unittest.mock import MagicMock, patch
+        from community.core.memory.watermarks import MemoryWatermarkMonitor
+        mem = MagicMock(percent=40.0, available=6 * 1024**3, total=10 * 1024**3)
+        monitor = MemoryWatermarkMonitor(cache_ttl=60)
+        with patch('psutil.virtual_memory', return_value=mem) as mock_vm:
+            first = monitor.check_memory()
+            assert monitor.check_memory() is first
+            assert mock_vm.call_count == 1
+            monitor.invalidate()
+            monitor.check_memory()
+            assert mock_vm.call_count == 2
+        assert first["status"] == "normal"
+        assert "total_gb" not in first
+        assert "total_gb" in monitor.get_status()
+
+
+    def test_watermarks_emergency_reported_not_raised(self):
+        """Test check_memory flags emergencies; check_memory_or_raise raises."""
+        from unittest.mock import MagicMock, patch
+        from community.core.errors import ResourceError
+        from community.core.memory.watermarks import MemoryWatermarkMonitor
+        mem = MagicMock(percent=97.0, available=0.3 * 1024**3, total=10 * 1024**3)
+        monitor = MemoryWatermarkMonitor()
+        with patch('psutil.virtual_memory', return_value=mem):
+            status = monitor.check_memory()
+            assert status["emergency"] is True
+            assert status["status"] == "emergency"
+            with pytest.raises(ResourceError):
+                monitor.check_memory_or_raise()
 
 class TestConcurrencyModules:
     """Test concurrency modules."""
@@ -129,16 +297,161 @@ class TestSecurityModules:
         from community.core.security.jwt_manager import JWTManager
         assert JWTManager is not None
 
+    def test_jwt_manager_roundtrip_jose_compatible(self):
+        """Test direct HS256 tokens interoperate with python-jose."""
+        from jose import jwt
+        from community.core.security.jwt_manager import JWTManager
+        from community.core.errors import SecurityError
+
+        manager = JWTManager(None)
+        token = manager.create_token("user-1", "admin")
+        claims = jwt.decode(token, manager.secret_key, algorithms=["HS256"])
+        assert claims["sub"] == "user-1"
+        assert isinstance(claims["iat"], int)
+        assert claims["exp"] - claims["iat"] == 24 * 3600
+        assert manager.verify_token(token)["role"] == "admin"
+
+        foreign = jwt.encode({"sub": "u", "role": "viewer", "exp": 2**31}, manager.secret_key, algorithm="HS256")
+        assert manager.verify_token(foreign)["role"] == "viewer"
+
+        header, payload, signature = token.split(".")
+        with pytest.raises(SecurityError):
+            manager.verify_token(f"{header}.{payload}.{signature[::-1]}")
+        hs512 = jwt.encode({"sub": "u"}, manager.secret_key, algorithm="HS512")
+        with pytest.raises(SecurityError):
+            manager.verify_token(hs512)
+        with pytest.raises(SecurityError):
+            manager.verify_token("not-a-token")
+
+    def test_jwt_manager_rejects_expired(self):
+        """Test expired tokens are rejected."""
+        from datetime import timedelta
+        from community.core.security.jwt_manager import JWTManager
+        from community.core.errors import SecurityError
+
+        manager = JWTManager(None)
+        token = manager.create_token("user-1", "admin", expires_delta=timedelta(seconds=-5))
+        with pytest.raises(SecurityError, match="expired"):
+            manager.verify_token(token)
+
     def test_keyring_manager_import(self):
         """Test KeyringManager can be imported."""
         from community.core.security.keyring_manager import KeyringManager
         assert KeyringManager is not None
 
+    def test_keyring_manager_caches_retrieved_keys(self):
+        """Test retrieve_key is served from cache until store/delete invalidates it."""
+        import keyring
+        from community.core.security.keyring_manager import KeyringManager
+        from community.core.errors import SecurityError
+
+        store = {}
+        with patch.object(KeyringManager, '_validate_keyring_available'), \
+             patch.object(keyring, 'get_password', side_effect=lambda s, k: store.get(k)) as get_password, \
+             patch.object(keyring, 'set_password', side_effect=lambda s, k, v: store.__setitem__(k, v)), \
+             patch.object(keyring, 'delete_password', side_effect=lambda s, k: store.pop(k)):
+            manager = KeyringManager(MagicMock(os="linux", is_wsl2=False))
+            store["k"] = "c2VjcmV0"  # base64 of b"secret"
+            assert manager.retrieve_key("k") == b"secret"
+            assert manager.retrieve_key("k") == b"secret"
+            assert get_password.call_count == 1
+
+            manager.store_key("k", b"rotated")
+            assert manager.retrieve_key("k") == b"rotated"
+            assert get_password.call_count == 1
+
+            manager.delete_key("k")
+            with pytest.raises(SecurityError):
+                manager.retrieve_key("k")
+
+    def test_keyring_self_test_runs_once_per_backend(self):
+        """Test the keyring write/read probe is skipped once a backend passed."""
+        import keyring
+        from community.core.security import keyring_manager
+        from community.core.security.keyring_manager import KeyringManager
+
+        backend = MagicMock()
+        backend.name = "test-backend"
+        platform = MagicMock(os="linux", is_wsl2=False, is_native_linux=False)
+        with patch.object(keyring, 'get_keyring', return_value=backend), \
+             patch.object(keyring, 'set_password') as set_password, \
+             patch.object(keyring, 'get_password', return_value="test-value"), \
+             patch.object(keyring, 'delete_password'), \
+             patch.object(keyring_manager, '_VALIDATED_BACKENDS', set()):
+            KeyringManager(platform)
+            KeyringManager(platform)
+        assert set_password.call_count == 1
+
     def test_cert_security_import(self):
         """Test CertificateSecurityManager can be imported."""
         from community.core.security.cert_security import CertificateSecurityManager
         assert CertificateSecurityManager is not None
 
+    def test_cert_directory_permissions(self, tmp_path):
+        """Test cert directory is created 0700 and existing modes are fixed."""
+        import os
+        from community.core.security.cert_security import CertificateSecurityManager
+        created = tmp_path / "new-certs"
+        CertificateSecurityManager(MagicMock(), cert_dir=str(created))
+        assert created.stat().st_mode & 0o777 == 0o700
+        existing = tmp_path / "old-certs"
+        existing.mkdir(mode=0o755)
+        os.chmod(existing, 0o755)
+        CertificateSecurityManager(MagicMock(), cert_dir=str(existing))
+        assert existing.stat().st_mode & 0o777 == 0o700
+
+    def test_cert_files_written_with_final_mode(self, tmp_path):
+        """Test key placeholders are 0600 and certificates 0644, even if pre-existing."""
+        import os
+        from community.core.security.cert_security import CertificateSecurityManager
+        manager = CertificateSecurityManager(MagicMock(), cert_dir=str(tmp_path))
+        key_path = manager.store_private_key("ca-key", b"secret")
+        assert os.stat(key_path).st_mode & 0o777 == 0o600
+        assert b"ca-key" in open(key_path, 'rb').read()
+        cert_file = tmp_path / "ca.pem"
+        cert_file.write_bytes(b"old")
+        os.chmod(cert_file, 0o600)
+        cert_path = manager.store_certificate("ca", b"PEM")
+        assert os.stat(cert_path).st_mode & 0o777 == 0o644
+        assert open(cert_path, 'rb').read() == b"PEM"
+
+
+class TestFirstRunDetector:
+    """Test first-run detection."""
+
+    def test_is_first_run_tracks_users_table(self, tmp_path):
+        """Test first run follows the users table, is cached and reuses one engine."""
+        import os
+        import sqlite3
+        from community.core.setup import FirstRunDetector
+        db_path = tmp_path / "ax.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE users (id INTEGER PRIMARY KEY)")
+        conn.commit()
+
+        detector = FirstRunDetector(str(db_path), flag_file=str(tmp_path / ".initialized"))
+        assert detector.is_first_run()
+        engine = detector._engine
+        with patch.object(detector, '_check_first_run') as check:
+            assert detector.is_first_run()
+        check.assert_not_called()
+
+        conn.execute("INSERT INTO users (id) VALUES (1)")
+        conn.commit()
+        conn.close()
+        # Writes can land within one mtime tick of the first check
+        mtime_ns = os.stat(db_path).st_mtime_ns + 1_000_000
+        os.utime(db_path, ns=(mtime_ns, mtime_ns))
+        assert not detector.is_first_run()
+        assert detector._engine is engine
+
+    def test_is_first_run_without_db(self, tmp_path):
+        """Test missing database and flag means first run."""
+        from community.core.setup import FirstRunDetector
+        detector = FirstRunDetector(str(tmp_path / "ax.db"), flag_file=str(tmp_path / ".initialized"))
+        assert detector.is_first_run()
+        assert detector._engine is None
+
 
 class TestErrorHandling:
     """Test error handling modules."""
@@ -185,6 +498,18 @@ class TestLogging:
         assert hasattr(log, 'info')
         assert hasattr(log, 'error')
 
+    def test_level_filtering_by_mode(self):
+        """Test production mode filters debug while dev mode emits it."""
+        import logging
+        from community.core.logging import setup_logging, is_enabled_for
+        try:
+            setup_logging(mode="production")
+            assert not is_enabled_for(logging.DEBUG)
+            assert is_enabled_for(logging.INFO)
+        finally:
+            setup_logging(mode="dev")
+        assert is_enabled_for(logging.DEBUG)
+
 
 class TestAnalysisBase:
     """Test analysis base classes."""
@@ -168,3 +168,133 @@ class TestDependencyValidatorAttributes:
         from community.core.dependencies import DependencyValidator
         assert hasattr(DependencyValidator, 'SYSTEM_TOOLS')
 
+
+
+class TestToolVersionDetection:
+    """Test system tool version extraction."""
+
+    @patch('subprocess.run')
+    def test_version_read_from_stderr(self, mock_run):
+        """Test version is found when the tool prints to stderr."""
+        import subprocess
+        mock_run.return_value = MagicMock(returncode=1, stdout=b"hostapd v2.10\n")
+
+        from community.core.dependencies import DependencyValidator
+        validator = DependencyValidator()
+        assert validator._get_tool_version("hostapd") == "2.10"
+        assert mock_run.call_count == 1
+        assert mock_run.call_args[1]["stderr"] == subprocess.STDOUT
+
+    @patch('subprocess.run')
+    def test_version_falls_back_to_next_flag(self, mock_run):
+        """Test later flags are tried when earlier output has no version."""
+        mock_run.side_effect = [
+            MagicMock(returncode=2, stdout=b"unknown option"),
+            MagicMock(returncode=0, stdout=b"tool 4.9.3"),
+        ]
+
+        from community.core.dependencies import DependencyValidator
+        validator = DependencyValidator()
+        assert validator._get_tool_version("tool") == "4.9.3"
+        assert mock_run.call_args_list[1][0][0] == ["tool", "-V"]
+
+    @patch('subprocess.run', side_effect=FileNotFoundError)
+    def test_run_reports_missing_command(self, mock_run):
+        """Test probe helper maps a missing binary to return code 127."""
+        from community.core.dependencies import DependencyValidator
+        assert DependencyValidator()._run(["getenforce"]) == (127, b"")
+
+
+class TestDependencyTables:
+    """Test dependency table layout and category gating."""
+
+    def test_dependency_check_has_slots(self):
+        """Test DependencyCheck instances carry no per-instance __dict__."""
+        from community.core.dependencies import DependencyCheck
+        check = DependencyCheck(name="tool", required=True, found=True)
+        assert not hasattr(check, "__dict__")
+
+    def test_optional_packages_skipped_when_disabled(self):
+        """Test database/capture packages are skipped when features are off."""
+        from community.core.dependencies import DependencyValidator
+        validator = DependencyValidator()
+        config = {"database": {"enabled": False}, "capture": {"enabled": False}}
+        assert not validator._should_validate_package("alembic", "database", config)
+        assert not validator._should_validate_package("python-libpcap", "capture", config)
+        assert validator._should_validate_package("fastapi", "core", config)
+
+
+class TestDirectoryValidation:
+    """Test required directory creation and permission handling."""
+
+    def test_validate_directories_creates_and_fixes_mode(self, tmp_path, monkeypatch):
+        """Test missing dirs are created and loose modes tightened to 0700."""
+        import os
+        from community.core.dependencies import DependencyValidator
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "certs").mkdir(mode=0o755)
+        os.chmod(tmp_path / "certs", 0o755)
+
+        DependencyValidator().validate_directories({"storage": {"pcap_dir": "./pcaps"}})
+
+        for name in ("certs", "captures/raw", "captures/decrypted", "logs", "pcaps"):
+            assert (tmp_path / name).is_dir()
+        assert os.stat(tmp_path / "certs").st_mode & 0o777 == 0o700
+
+    def test_validate_directories_skips_chmod_when_mode_correct(self, tmp_path, monkeypatch):
+        """Test chmod is not issued for directories already at 0700."""
+        from community.core.dependencies import DependencyValidator
+        monkeypatch.chdir(tmp_path)
+        validator = DependencyValidator()
+        validator.validate_directories({})
+
+        with patch('os.chmod') as mock_chmod:
+            validator.validate_directories({})
+        mock_chmod.assert_not_called()
+
+
+class TestListeningPorts:
+    """Test /proc/net/tcp listening-port parsing."""
+
+    def test_listening_ports_parsed_from_proc(self):
+        """Test only LISTEN (0A) sockets are reported, with hex ports decoded."""
+        from unittest.mock import mock_open
+        from community.core.dependencies import DependencyValidator
+        tcp = (
+            "  sl  local_address rem_address   st tx_queue rx_queue\n"
+            "   0: 00000000:1F90 00000000:0000 0A 00000000:00000000\n"
+            "   1: 0100007F:2383 0100007F:D2F0 01 00000000:00000000\n"
+        )
+        with patch('builtins.open', mock_open(read_data=tcp)):
+            ports = DependencyValidator()._get_listening_ports()
+        assert ports == {8080}
+
+    def test_listening_ports_none_without_proc(self):
+        """Test None is returned when /proc/net/tcp cannot be read."""
+        from community.core.dependencies import DependencyValidator
+        with patch('builtins.open', side_effect=FileNotFoundError):
+            assert DependencyValidator()._get_listening_ports() is None
+
+
+class TestSystemSnapshot:
+    """Test the shared system snapshot."""
+
+    def test_snapshot_collected_once(self):
+        """Test repeated access reuses the first collected snapshot."""
+        from community.core.dependencies import DependencyValidator, SystemSnapshot
+        validator = DependencyValidator()
+        with patch.object(DependencyValidator, '_collect_snapshot',
+                          return_value=MagicMock(spec=SystemSnapshot)) as mock_collect:
+            first = validator.snapshot
+            assert validator.snapshot is first
+        mock_collect.assert_called_once()
+
+    @patch('subprocess.run', side_effect=FileNotFoundError)
+    def test_snapshot_marks_missing_security_tools(self, mock_run):
+        """Test missing getenforce/aa-status are recorded as not installed."""
+        from community.core.dependencies import DependencyValidator
+        snapshot = DependencyValidator()._collect_snapshot()
+        assert snapshot.selinux_mode is None
+        assert snapshot.apparmor_status == "missing"
+        assert snapshot.ip_addrs is None
+        assert snapshot.netns_supported is False
@@ -106,6 +106,196 @@ class TestDnsmasqConfig:
         assert LinuxHotspot is not None
 
 
+class TestLinuxHotspotSetupInterface:
+    """Test interface setup runs as a single shell invocation."""
+
+    @pytest.fixture
+    def fake_ip(self, tmp_path, monkeypatch):
+        """Put a fake ip(8) on PATH that logs its argv."""
+        log_file = tmp_path / "ip.log"
+        ip = tmp_path / "ip"
+        ip.write_text(
+            "#!/bin/sh\n"
+            f'echo "$*" >> {log_file}\n'
+            'case "$*" in\n'
+            '    "-o addr show dev missing0") exit 1 ;;\n'
+            '    "-o addr show dev"*) echo "3: $5    inet 192.168.4.10/24 scope global" ;;\n'
+            "esac\n"
+        )
+        ip.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{tmp_path}:/usr/bin:/bin")
+        return log_file
+
+    def _hotspot(self, interface):
+        from community.hotspot.linux import LinuxHotspot
+        hotspot = LinuxHotspot.__new__(LinuxHotspot)
+        hotspot.config = {"interface": interface, "gateway": "192.168.4.1"}
+        return hotspot
+
+    @pytest.fixture(autouse=True)
+    def without_pyroute2(self):
+        """Exercise the ip(8) fallback regardless of what is installed."""
+        from community.hotspot import linux
+        with patch.object(linux, "PYROUTE2_AVAILABLE", False):
+            yield
+
+    def test_setup_interface_adds_missing_gateway(self, fake_ip):
+        """Test gateway is added when only a similar address is assigned."""
+        import subprocess
+        
+        with patch('subprocess.run', wraps=subprocess.run) as mock_run:
+            self._hotspot("wlan0")._setup_interface()
+        
+        assert mock_run.call_count == 1
+        assert fake_ip.read_text().splitlines() == [
+            "-o addr show dev wlan0",
+            "addr add 192.168.4.1/24 dev wlan0",
+            "link set wlan0 up",
+        ]
+
+    def test_setup_interface_missing_interface(self, fake_ip):
+        """Test a missing interface raises NetworkError."""
+        from community.core.errors import NetworkError
+        
+        with pytest.raises(NetworkError, match="not found"):
+            self._hotspot("missing0")._setup_interface()
+        
+        assert fake_ip.read_text().splitlines() == ["-o addr show dev missing0"]
+
+    def test_setup_interface_uses_netlink_when_available(self):
+        """Test pyroute2 path adds the gateway and sets the link up without ip(8)."""
+        from community.hotspot import linux
+        ipr = MagicMock()
+        ipr.__enter__.return_value = ipr
+        ipr.link_lookup.return_value = [3]
+        ipr.get_addr.return_value = []
+        
+        with patch.object(linux, "PYROUTE2_AVAILABLE", True), \
+                patch.object(linux, "IPRoute", return_value=ipr, create=True), \
+                patch.object(linux, "NetlinkError", OSError, create=True), \
+                patch('subprocess.run') as mock_run:
+            self._hotspot("wlan0")._setup_interface()
+        
+        mock_run.assert_not_called()
+        ipr.addr.assert_called_once_with("add", index=3, address="192.168.4.1", prefixlen=24)
+        ipr.link.assert_called_once_with("set", index=3, state="up")
+
+
+class TestLinuxHotspotServices:
+    """Test systemd operations are batched."""
+
+    @pytest.fixture
+    def hotspot(self, tmp_path):
+        """LinuxHotspot writing its files under tmp_path."""
+        from community.hotspot import linux
+        hotspot = linux.LinuxHotspot.__new__(linux.LinuxHotspot)
+        hotspot.config = {"interface": "wlan0", "password": "testpassword123"}
+        with patch.object(linux, "HOSTAPD_CONF_FILE", tmp_path / "hostapd.conf"), \
+                patch.object(linux, "DNSMASQ_CONF_FILE", tmp_path / "dnsmasq.conf"), \
+                patch.object(linux, "SYSTEMD_SERVICE_DIR", tmp_path), \
+                patch.object(hotspot, "_setup_interface"):
+            yield hotspot
+
+    def test_start_reloads_once_and_starts_both_units(self, hotspot, tmp_path):
+        """Test start issues one daemon-reload and one multi-unit start."""
+        from community.hotspot.linux import HOSTAPD_SERVICE, DNSMASQ_SERVICE
+        
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+            hotspot.start()
+        
+        assert [c.args[0] for c in mock_run.call_args_list] == [
+            ["systemctl", "daemon-reload"],
+            ["systemctl", "start", HOSTAPD_SERVICE, DNSMASQ_SERVICE],
+        ]
+        assert (tmp_path / f"{HOSTAPD_SERVICE}.service").exists()
+        assert (tmp_path / f"{DNSMASQ_SERVICE}.service").exists()
+
+    def test_restart_with_unchanged_units_skips_reload(self, hotspot, tmp_path):
+        """Test a second start with identical units does not daemon-reload."""
+        from community.hotspot.linux import HOSTAPD_SERVICE
+        
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+            hotspot.start()
+            unit = tmp_path / f"{HOSTAPD_SERVICE}.service"
+            mtime = unit.stat().st_mtime_ns
+            mock_run.reset_mock()
+            hotspot.start()
+        
+        assert [c.args[0][1] for c in mock_run.call_args_list] == ["start"]
+        assert unit.stat().st_mtime_ns == mtime
+        assert not list(tmp_path.glob(".*"))
+
+    def test_start_failure_stops_both_units(self, hotspot):
+        """Test a failed start rolls back with a single stop call."""
+        from community.core.errors import NetworkError
+        from community.hotspot.linux import HOSTAPD_SERVICE, DNSMASQ_SERVICE
+        
+        with patch('subprocess.run') as mock_run:
+            mock_run.side_effect = [
+                MagicMock(returncode=0, stdout="", stderr=""),
+                MagicMock(returncode=1, stdout="", stderr="unit failed"),
+                MagicMock(returncode=0, stdout="", stderr=""),
+            ]
+            with pytest.raises(NetworkError, match="unit failed"):
+                hotspot.start()
+        
+        assert mock_run.call_args_list[-1].args[0] == [
+            "systemctl", "stop", DNSMASQ_SERVICE, HOSTAPD_SERVICE
+        ]
+
+
+class TestLinuxHotspotIsRunning:
+    """Test is_running probes cached pidfds instead of systemctl."""
+
+    def test_is_running_caches_main_pid(self):
+        """Test systemd is asked once per unit until the main process exits."""
+        import subprocess
+        from community.hotspot.linux import LinuxHotspot
+        hotspot = LinuxHotspot.__new__(LinuxHotspot)
+        hotspot._main_pidfds = {}
+        child = subprocess.Popen(["sleep", "30"])
+        
+        try:
+            with patch.object(hotspot, "_main_pid", return_value=child.pid) as mock_pid:
+                assert hotspot.is_running()
+                assert hotspot.is_running()
+                assert mock_pid.call_count == 2
+                
+                child.kill()
+                child.wait()
+                mock_pid.return_value = 0
+                assert not hotspot.is_running()
+        finally:
+            child.kill()
+            child.wait()
+            hotspot._forget_main_pids()
+
+
+class TestLinuxHotspotClients:
+    """Test dnsmasq lease parsing."""
+
+    def test_get_clients_parses_leases(self, tmp_path):
+        """Test leases become ClientInfo entries and short lines are skipped."""
+        from community.hotspot import linux
+        leases = tmp_path / "dnsmasq.leases"
+        leases.write_bytes(
+            b"1700000000 aa:bb:cc:dd:ee:ff 192.168.4.10 phone 01:aa:bb:cc:dd:ee:ff\n"
+            b"1700000100 11:22:33:44:55:66 192.168.4.11 * *\n"
+            b"garbage\n"
+        )
+        hotspot = linux.LinuxHotspot.__new__(linux.LinuxHotspot)
+        
+        with patch.object(linux, "DNSMASQ_LEASES_FILE", leases):
+            clients = hotspot.get_clients()
+        
+        assert [(c.mac_address, c.ip_address, c.hostname, c.connected_at) for c in clients] == [
+            ("aa:bb:cc:dd:ee:ff", "192.168.4.10", "phone", 1700000000),
+            ("11:22:33:44:55:66", "192.168.4.11", "*", 1700000100),
+        ]
+
+
 class TestLinuxHotspotWithMockedSubprocess:
     """Test LinuxHotspot with mocked subprocess."""
 
@@ -17,14 +17,20 @@ from unittest.mock import Mock, patch
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
-from community.core.orchestrator import StartupOrchestrator
+from community.core.orchestrator import StartupOrchestrator, AsyncStartupOrchestrator
 from community.storage.disk_monitor import DiskSpaceManager
 
 
-def test_orchestrator_component_registration():
-    """Test component registration with orchestrator."""
+@pytest.fixture
+def orchestrator():
+    """StartupOrchestrator whose signal handlers are restored after the test."""
     orchestrator = StartupOrchestrator()
-    
+    yield orchestrator
+    orchestrator.close()
+
+
+def test_orchestrator_component_registration(orchestrator):
+    """Test component registration with orchestrator."""
     start_mock = Mock()
     stop_mock = Mock()
     
@@ -38,10 +44,8 @@ def test_orchestrator_component_registration():
     assert orchestrator.components[0].name == "test_component"
 
 
-def test_orchestrator_startup_rollback():
+def test_orchestrator_startup_rollback(orchestrator):
     """Test orchestrator rollback on component failure."""
-    orchestrator = StartupOrchestrator()
-    
     # First component succeeds
     start1 = Mock()
     stop1 = Mock()
@@ -65,10 +69,8 @@ def test_orchestrator_startup_rollback():
     assert len(orchestrator.started_components) == 0
 
 
-def test_orchestrator_graceful_shutdown():
+def test_orchestrator_graceful_shutdown(orchestrator):
     """Test orchestrator graceful shutdown."""
-    orchestrator = StartupOrchestrator()
-    
     start_mock = Mock()
     stop_mock = Mock()
     
@@ -83,6 +85,182 @@ def test_orchestrator_graceful_shutdown():
     assert len(orchestrator.started_components) == 0
 
 
+def test_orchestrator_rollback_not_reentrant(orchestrator):
+    """Test a stop() that re-enters rollback does not stop anything twice."""
+    stop1 = Mock()
+    stop2 = Mock(side_effect=lambda: orchestrator._rollback())
+    orchestrator.register_component("component1", Mock(), stop1)
+    orchestrator.register_component("component2", Mock(), stop2)
+    orchestrator.register_component("component3", Mock(side_effect=Exception("boom")), Mock())
+    
+    with pytest.raises(Exception, match="boom"):
+        orchestrator.start()
+    
+    stop1.assert_called_once()
+    stop2.assert_called_once()
+    assert len(orchestrator.started_components) == 0
+
+
+def test_orchestrator_stop_not_reentrant(orchestrator):
+    """Test a stop() that re-enters stop() does not stop anything twice."""
+    stop1 = Mock()
+    stop2 = Mock(side_effect=lambda: orchestrator.stop())
+    orchestrator.register_component("component1", Mock(), stop1)
+    orchestrator.register_component("component2", Mock(), stop2)
+    orchestrator.start()
+    
+    orchestrator.stop()
+    
+    stop1.assert_called_once()
+    stop2.assert_called_once()
+    assert len(orchestrator.started_components) == 0
+
+
+def test_orchestrator_signal_defers_shutdown_to_main_thread(orchestrator):
+    """Test signal handler only flags shutdown; wait_for_shutdown stops."""
+    import signal
+    
+    stop_mock = Mock()
+    orchestrator.register_component("test", Mock(), stop_mock)
+    orchestrator.start()
+    
+    assert orchestrator.wait_for_shutdown(timeout=0) is False
+    orchestrator._signal_handler(signal.SIGTERM, None)
+    stop_mock.assert_not_called()
+    assert orchestrator.shutdown_requested()
+    
+    assert orchestrator.wait_for_shutdown(timeout=0) is True
+    stop_mock.assert_called_once()
+
+
+def test_orchestrator_wait_for_shutdown_request_does_not_stop(orchestrator):
+    """Test the watcher-side wait returns on a signal but leaves stop() to the caller."""
+    import signal
+    stop_mock = Mock()
+    orchestrator.register_component("test", Mock(), stop_mock)
+    orchestrator.start()
+    
+    assert orchestrator.wait_for_shutdown_request(timeout=0) is False
+    orchestrator._signal_handler(signal.SIGHUP, None)
+    assert orchestrator.wait_for_shutdown_request(timeout=0) is True
+    stop_mock.assert_not_called()
+    assert len(orchestrator.started_components) == 1
+
+
+def test_orchestrator_start_aborts_after_signal(orchestrator):
+    """Test start() stops launching components once shutdown is requested."""
+    import signal
+    
+    stop1 = Mock()
+    start2 = Mock()
+    orchestrator.register_component(
+        "component1", lambda: orchestrator._signal_handler(signal.SIGINT, None), stop1
+    )
+    orchestrator.register_component("component2", start2, Mock())
+    
+    orchestrator.start()
+    
+    start2.assert_not_called()
+    stop1.assert_called_once()
+    assert len(orchestrator.started_components) == 0
+
+
+def test_orchestrator_registers_posix_termination_signals(orchestrator):
+    """Test SIGHUP and SIGQUIT are handled alongside SIGINT/SIGTERM."""
+    import signal
+    
+    for sig in (signal.SIGINT, signal.SIGTERM, signal.SIGHUP, signal.SIGQUIT):
+        assert sig in orchestrator._original_signal_handlers
+        assert signal.getsignal(sig) == orchestrator._signal_handler
+
+
+def test_orchestrator_wakeup_fd_readable_on_signal():
+    """Test a delivered signal makes the wakeup fd readable."""
+    import os
+    import select
+    import signal
+    orchestrator = StartupOrchestrator()
+    try:
+        fd = orchestrator.wakeup_fd()
+        assert select.select([fd], [], [], 0)[0] == []
+        
+        os.kill(os.getpid(), signal.SIGHUP)
+        
+        assert select.select([fd], [], [], 1)[0] == [fd]
+        assert os.read(fd, 16) == bytes([signal.SIGHUP])
+        assert orchestrator.shutdown_requested()
+    finally:
+        orchestrator.close()
+
+
+def test_orchestrator_wakeup_pipe_is_lazy():
+    """Test no pipe or wakeup fd is installed until wakeup_fd() is called."""
+    import signal
+    previous = signal.set_wakeup_fd(-1)
+    try:
+        orchestrator = StartupOrchestrator()
+        assert orchestrator._wakeup_r == -1
+        assert signal.set_wakeup_fd(-1) == -1
+        
+        orchestrator.close()
+        assert signal.getsignal(signal.SIGHUP) != orchestrator._signal_handler
+    finally:
+        signal.set_wakeup_fd(previous)
+
+
+def test_orchestrator_rejects_registration_after_start(orchestrator):
+    """Test start() seals the component list."""
+    orchestrator.register_component("test", Mock(), Mock())
+    orchestrator.start()
+    
+    assert isinstance(orchestrator.components, tuple)
+    with pytest.raises(RuntimeError):
+        orchestrator.register_component("late", Mock(), Mock())
+
+
+def test_async_orchestrator_rollback_and_signal_shutdown():
+    """Test async orchestrator awaits components and stops on a loop signal."""
+    import asyncio
+    import os
+    import signal
+    
+    async def scenario():
+        calls = []
+        
+        def component(name, fail=False):
+            async def start():
+                if fail:
+                    raise Exception("boom")
+                calls.append(("start", name))
+            
+            async def stop():
+                calls.append(("stop", name))
+            return start, stop
+        
+        failing = AsyncStartupOrchestrator()
+        failing.register_component("a", *component("a"))
+        failing.register_component("b", *component("b", fail=True))
+        with pytest.raises(Exception, match="boom"):
+            await failing.start()
+        failing.close()
+        assert calls == [("start", "a"), ("stop", "a")]
+        
+        calls.clear()
+        orchestrator = AsyncStartupOrchestrator()
+        orchestrator.register_component("a", *component("a"))
+        orchestrator.register_component("b", *component("b"))
+        await orchestrator.start()
+        try:
+            os.kill(os.getpid(), signal.SIGTERM)
+            await asyncio.wait_for(orchestrator.run_until_shutdown(), timeout=5)
+        finally:
+            orchestrator.close()
+        assert calls == [("start", "a"), ("start", "b"), ("stop", "b"), ("stop", "a")]
+        assert len(orchestrator.started_components) == 0
+    
+    asyncio.run(scenario())
+
+
 def test_disk_monitor_initialization():
     """Test disk monitor initialization."""
     monitor = DiskSpaceManager(monitor_path="/tmp", check_interval=30)
@@ -170,6 +170,41 @@ class TestMutationEngine:
         assert len(mutations) > 0
         assert "url" in mutations[0]
     
+    def test_iter_mutations_are_lazy(self, engine):
+        """Test iter_* variants yield the same mutations without building a list."""
+        import types
+        url = "https://example.com/api?id=123&name=test"
+        
+        mutations = engine.iter_param_mutations(url)
+        
+        assert isinstance(mutations, types.GeneratorType)
+        assert [m["url"] for m in mutations] == [m["url"] for m in engine.mutate_params(url)]
+        assert list(engine.iter_body_mutations(b"", "application/json")) == []
+        assert all(m["modifications"] == {"url": m["url"]} for m in engine.mutate_params(url))
+    
+    def test_mutate_params_soa(self, engine):
+        """Test parallel-list param mutations match mutate_params."""
+        url = "https://example.com/api?id=123&name=test"
+        
+        urls, mutations = engine.mutate_params_soa(url)
+        expected = engine.mutate_params(url)
+        
+        assert urls == [m["url"] for m in expected]
+        assert mutations == [m["mutation"] for m in expected]
+    
+    def test_mutate_stream_matches_eager_lists(self, engine):
+        """Test mutate_stream yields header, param then body mutations."""
+        headers = {"User-Agent": "Test"}
+        url = "https://example.com/api?id=123"
+        body = b"username=admin"
+        content_type = "application/x-www-form-urlencoded"
+        
+        streamed = list(engine.mutate_stream(headers, url, body, content_type))
+        eager = (engine.mutate_headers(headers) + engine.mutate_params(url)
+                 + engine.mutate_body(body, content_type))
+        
+        assert [m["modifications"] for m in streamed] == [m["modifications"] for m in eager]
+    
     def test_mutate_json_body(self, engine):
         """Test JSON body mutations."""
         body = b'{"username": "admin", "password": "secret"}'
@@ -180,6 +215,17 @@ class TestMutationEngine:
         assert len(mutations) > 0
         assert "body" in mutations[0]
     
+    def test_mutate_json_body_keeps_stdlib_values(self, engine):
+        """Test big integers and NaN survive into every mutated JSON body."""
+        content_type = "application/json"
+        
+        big = engine.mutate_body(b'{"k": "v", "big": 123456789012345678901234567890}', content_type)
+        assert big
+        assert all(b'"big": 123456789012345678901234567890' in m["body"]
+                   for m in big if m["mutation"].field_name == "k")
+        
+        assert engine.mutate_body(b'{"k": "v", "score": NaN}', content_type)
+    
     def test_mutate_form_body(self, engine):
         """Test form body mutations."""
         body = b"username=admin&password=secret"
@@ -189,6 +235,27 @@ class TestMutationEngine:
         
         assert len(mutations) > 0
     
+    def test_no_applicable_types_yields_nothing(self):
+        """Test engines without header-safe types skip header mutation."""
+        from src.community.fuzzer.mutation import MutationEngine, MutationType
+        
+        engine = MutationEngine([MutationType.PATH_TRAVERSAL])
+        
+        assert engine.mutate_headers({"User-Agent": "Test"}) == []
+        assert engine.mutate_params("https://example.com/?file=a.txt")
+    
+    def test_max_payload_expansion_skips_large_payloads(self):
+        """Test payloads over the expansion budget are not applied."""
+        from src.community.fuzzer.mutation import MutationEngine
+        body = b'{"username": "admin", "password": "secret"}'
+        
+        capped = MutationEngine(max_payload_expansion_bytes=1000)
+        mutations = capped.mutate_body(body, "application/json")
+        
+        assert mutations
+        assert all(len(m["mutation"].mutated_value) * 2 <= 1000 for m in mutations)
+        assert len(mutations) < len(MutationEngine().mutate_body(body, "application/json"))
+    
     def test_get_mutation_count(self, engine):
         """Test mutation count estimation."""
         count = engine.get_mutation_count(
@@ -199,6 +266,12 @@ class TestMutationEngine:
         )
         
         assert count > 0
+    
+    def test_get_mutation_count_matches_param_mutations(self, engine):
+        """Test param counts include blank values, as mutate_params does."""
+        url = "https://example.com/api?id=1&empty="
+        
+        assert engine.get_mutation_count({}, url) == len(engine.mutate_params(url))
 
 
 class TestHTTPFuzzer:
@@ -287,6 +360,94 @@ class TestHTTPFuzzer:
         # Server error - high score
         score = fuzzer._calculate_anomaly_score(200, 500, True, 100)
         assert score > 0.5
+    
+    @pytest.mark.asyncio
+    async def test_fuzz_flow_runs_mutations_concurrently(self):
+        """Test mutations overlap up to max_concurrent and all get recorded."""
+        import asyncio
+        from src.community.fuzzer.http_fuzzer import HTTPFuzzer, FuzzingStrategy
+        from src.community.replay.replayer import ReplayResult
+        
+        in_flight = 0
+        peak = 0
+        
+        async def replay_flow(flow_id, modifications=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return ReplayResult(replay_id="r", original_flow_id=flow_id, success=True, status_code=200)
+        
+        replayer = Mock()
+        replayer.replay_flow = replay_flow
+        fuzzer = HTTPFuzzer(replayer=replayer, max_concurrent=4, delay_ms=0)
+        flow_data = {"flow_id": "flow-1", "url": "https://example.com?id=1&q=a"}
+        
+        session = await fuzzer.fuzz_flow("flow-1", flow_data, FuzzingStrategy.PARAMS)
+        
+        assert session.status == "completed"
+        assert session.total_mutations > 4
+        assert session.completed_mutations == session.total_mutations
+        assert len(session.results) == session.total_mutations
+        assert 1 < peak <= 4
+    
+    @pytest.mark.asyncio
+    async def test_fuzz_flow_failure_stops_remaining_mutations(self):
+        """Test a failing replay fails the session and cancels the other workers."""
+        from src.community.fuzzer.http_fuzzer import HTTPFuzzer, FuzzingStrategy
+        from src.community.replay.replayer import ReplayResult
+        
+        calls = 0
+        
+        async def replay_flow(flow_id, modifications=None):
+            nonlocal calls
+            calls += 1
+            if modifications is not None and calls > 3:
+                raise RuntimeError("target unreachable")
+            return ReplayResult(replay_id="r", original_flow_id=flow_id, success=True, status_code=200)
+        
+        replayer = Mock()
+        replayer.replay_flow = replay_flow
+        fuzzer = HTTPFuzzer(replayer=replayer, max_concurrent=2, delay_ms=0)
+        flow_data = {"flow_id": "flow-1", "url": "https://example.com?id=1"}
+        
+        session = await fuzzer.fuzz_flow("flow-1", flow_data, FuzzingStrategy.PARAMS)
+        
+        assert session.status == "failed"
+        assert session.completed_mutations < 10
+    
+    def test_session_results_filtered_by_score(self):
+        """Test get_session_results filters on the recorded score column."""
+        from src.community.fuzzer.http_fuzzer import (
+            HTTPFuzzer, FuzzingResult, FuzzingSession, FuzzingStrategy
+        )
+        from src.community.fuzzer.mutation import Mutation, MutationType
+        
+        mutation = Mutation(
+            mutation_type=MutationType.SQL_INJECTION,
+            original_value="1",
+            mutated_value="' OR '1'='1",
+            location="param",
+            field_name="id",
+            description="SQL injection in param id"
+        )
+        session = FuzzingSession(session_id="s", flow_id="f", strategy=FuzzingStrategy.ALL)
+        for score in (0.1, 0.7, 0.5, 0.9):
+            session.record(FuzzingResult(
+                mutation=mutation, original_status=200, fuzzed_status=500,
+                response_diff=True, error_detected=True, duration_ms=1.0,
+                anomaly_score=score
+            ))
+        assert not hasattr(session, "__dict__")
+        assert session.completed_mutations == 4
+        assert session.anomalies_found == 2
+        
+        fuzzer = HTTPFuzzer(replayer=Mock())
+        fuzzer.sessions["s"] = session
+        assert [r["anomaly_score"] for r in fuzzer.get_session_results("s", 0.5)] == [0.7, 0.5, 0.9]
+        assert len(fuzzer.get_session_results("s")) == 4
+        assert fuzzer.get_session_results("s", 1) == []
 
 
 class TestWiresharkHelper:
@@ -385,6 +546,33 @@ class TestBurpExporter:
             assert "example.com" in content
             assert "items" in content
     
+    def test_export_session_is_well_formed(self, exporter):
+        """Test streamed export parses back with escaped text and base64 bodies."""
+        import base64
+        from xml.etree import ElementTree as ET
+        flows = [
+            {"flow_id": f"flow-{i}", "url": "https://example.com/a?x=1&y=2", "host": "example.com",
+             "path": "/a?x=1&y=2", "request_body": b"\x00raw"}
+            for i in range(3)
+        ]
+        
+        root = ET.parse(exporter.export_session("session-123", flows)).getroot()
+        
+        assert root.tag == "items"
+        assert [item.findtext("comment")[-6:] for item in root] == ["flow-0", "flow-1", "flow-2"]
+        assert root[0].findtext("url") == "https://example.com/a?x=1&y=2"
+        assert root[0].find("extension").text is None
+        assert base64.b64decode(root[0].findtext("request")).endswith(b"\r\n\r\n\x00raw")
+    
+    def test_export_large_session_keeps_order(self, exporter):
+        """Test large sessions are streamed in flow order."""
+        from xml.etree import ElementTree as ET
+        flows = [{"flow_id": str(i), "url": "https://example.com/", "timestamp": "t"} for i in range(600)]
+        
+        root = ET.parse(exporter.export_session("session-123", flows)).getroot()
+        
+        assert [item.findtext("comment").rsplit(" ", 1)[-1] for item in root] == [str(i) for i in range(600)]
+    
     def test_extract_port(self, exporter):
         """Test port extraction from URL."""
         assert exporter._extract_port("https://example.com") == 443
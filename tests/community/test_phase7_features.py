@@ -165,6 +165,10 @@ class TestGPSTracker:
         assert loc.latitude == 22.1987
         assert loc.longitude == 113.5439
         assert "22.1987" in str(loc)
+        assert loc.timestamp is not None
+        
+        with pytest.raises(AttributeError):
+            loc.latitude = 0.0
     
     def test_location_to_dict(self):
         """Test Location.to_dict()."""
@@ -177,6 +181,17 @@ class TestGPSTracker:
         assert data["longitude"] == 113.0
         assert "timestamp" in data
     
+    def test_location_timestamp_ns(self):
+        """Test Location stores epoch nanoseconds and converts lazily."""
+        from datetime import timezone
+        from src.community.gps.types import Location
+        
+        loc = Location(latitude=22.0, longitude=113.0, timestamp_ns=1_700_000_000_500_000_000)
+        
+        assert loc.timestamp.tzinfo is timezone.utc
+        assert loc.to_dict()["timestamp"] == "2023-11-14T22:13:20.500000+00:00"
+        assert Location(latitude=22.0, longitude=113.0).timestamp_ns > 0
+    
     @patch('shutil.which')
     def test_gps_tracker_fail_fast_no_gpsd(self, mock_which):
         """Test fail-fast when gpsd not found."""
@@ -189,6 +204,41 @@ class TestGPSTracker:
         
         assert "gpsd not found" in str(exc_info.value)
         assert "apt install gpsd" in str(exc_info.value)
+    
+    @patch('shutil.which', return_value=None)
+    def test_gps_tracker_remote_host_skips_local_check(self, mock_which):
+        """Test a remote gpsd host does not require a local gpsd binary."""
+        from src.community.gps.tracker import GPSTracker
+        
+        tracker = GPSTracker(host="192.168.1.50")
+        
+        assert tracker.host == "192.168.1.50"
+        mock_which.assert_not_called()
+    
+    @patch('shutil.which', return_value="/usr/sbin/gpsd")
+    def test_gps_tracker_streams_tpv_reports(self, mock_which):
+        """Test tracker enables WATCH mode and updates from streamed TPV reports."""
+        import socket
+        from src.community.gps.tracker import GPSTracker
+        
+        client, gpsd = socket.socketpair()
+        tracker = GPSTracker(poll_interval=0.05)
+        
+        with patch.object(socket, "create_connection", return_value=client):
+            tracker.start()
+            gpsd.sendall(
+                b'{"class":"VERSION","release":"3.22"}\n'
+                b'{"class":"TPV","mode":1}\n'
+                b'{"class":"TPV","mode":3,"lat":22.1987,'
+            )
+            gpsd.sendall(b'"lon":113.5439,"alt":50.0,"speed":1.5,"track":90.0}\n')
+            assert tracker.wait_for_location(timeout=2) is not None
+            tracker.stop()
+        
+        assert gpsd.recv(1024).startswith(b"?WATCH=")
+        assert tracker.get_location_tuple() == (22.1987, 113.5439)
+        assert tracker.current_location.altitude == 50.0
+        gpsd.close()
 
 
 class TestWiFiFrameDB: